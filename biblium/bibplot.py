@@ -2159,9 +2159,9 @@ class BiblioPlot(BiblioStats):
             fig, ax = plt.subplots(figsize=(fig_w, fig_h), dpi=dpi)
     
             if layout == "kamada_kawai":
-                pos = nx.kamada_kawai_layout(G)
+                pos = plotbib._cached_layout(G, "kamada_kawai")
             else:
-                pos = nx.spring_layout(G, seed=seed)
+                pos = plotbib._cached_layout(G, "spring", lambda: nx.spring_layout(G, seed=seed), key=seed)
     
             norder = list(G.nodes())
             ns = [node_sizes.get(n, 300.0) for n in norder]
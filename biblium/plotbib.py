@@ -3,12 +3,16 @@ from __future__ import annotations
 # --- Standard library ---
 import os
 import math
+import inspect
 import itertools
 import textwrap
 import re
 from collections import Counter, defaultdict
 from datetime import datetime
 import warnings
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
 # --- Typing ---
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
@@ -24,15 +28,18 @@ from matplotlib.colors import Normalize
 from matplotlib.cm import ScalarMappable
 from matplotlib.lines import Line2D
 from matplotlib.patches import Patch
-from matplotlib.ticker import MaxNLocator
+from matplotlib.ticker import FuncFormatter, MaxNLocator
 import matplotlib.colors as mcolors
 from matplotlib.patches import Circle
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import PatchCollection, PolyCollection
 from matplotlib.colors import TwoSlopeNorm
 
 from typing import Iterable    
 
-import seaborn as sns
+from biblium.lazy import LazyModule
+
+# Seaborn is imported on first use; it is one of the slowest imports here
+sns = LazyModule("seaborn")
 
 # --- Other visualization libraries ---
 from adjustText import adjust_text
@@ -63,19 +70,25 @@ try:
 except ImportError:
     hv = opts = None
 
-# Plotly (optional interactive plots)
-try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    from plotly.colors import sample_colorscale, get_colorscale
-except ImportError:
-    px = go = sample_colorscale = get_colorscale = None
+# Plotly (optional interactive plots; imported on first use)
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
+
+# Datashader (optional raster aggregation for very large scatters; imported on first use)
+ds = LazyModule("datashader")
 
 # --- Clustering/Distance ---
 from scipy.cluster.hierarchy import linkage, dendrogram, leaves_list
-from scipy.stats import kruskal, norm, pearsonr
+from scipy.stats import kruskal, norm
+from scipy.sparse import csr_matrix
 import scipy.cluster.hierarchy as sch
 
+# fastcluster (optional drop-in for scipy's linkage)
+try:
+    from fastcluster import linkage as _fast_linkage
+except ImportError:
+    _fast_linkage = None
+
 import networkx as nx
 from textwrap import wrap
 
@@ -463,6 +476,34 @@ def get_colors(n, color_scheme="default", values=None, cmap="viridis", default_c
     else:
         raise ValueError(f"Unknown color_scheme: {color_scheme}")
 
+def _figure_renderer(fig):
+    """Return a renderer for ``fig`` at its current dpi (Agg when the canvas has none)."""
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    if get_renderer is not None:
+        return get_renderer()
+    from matplotlib.backends.backend_agg import RendererAgg
+    return RendererAgg(fig.bbox.width, fig.bbox.height, fig.dpi)
+
+
+def _finalize_layout(fig, renderer=None):
+    """
+    Run the tight/constrained layout of ``fig`` now rather than at draw time.
+
+    Afterwards the axes sit where the saved figure will have them, so their
+    bounding boxes and ``transData`` are final. Works with the layout-engine
+    API (Matplotlib >= 3.6) and the older tight/constrained flags.
+    """
+    get_engine = getattr(fig, "get_layout_engine", None)
+    if get_engine is not None:
+        engine = get_engine()
+        if engine is not None:
+            engine.execute(fig)
+    elif fig.get_constrained_layout():
+        fig.execute_constrained_layout(renderer)
+    elif fig.get_tight_layout():
+        fig.tight_layout()
+
+
 def save_plot(filename_base, dpi=600):
     """
     Save current matplotlib figure to PNG, SVG, and PDF with tight layout.
@@ -471,11 +512,398 @@ def save_plot(filename_base, dpi=600):
         filename_base (str): Path without file extension.
         dpi (int): Resolution of the saved figures.
     """
+    fig = plt.gcf()
+    # Resolve the tight bounding box once (at the output dpi) instead of letting
+    # every savefig do its own dry-run render to find it.
+    fig_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        # Tight/constrained-layout figures only place their axes at draw time;
+        # settle them first so the bbox covers titles, legends and colorbars.
+        renderer = _figure_renderer(fig)
+        _finalize_layout(fig, renderer)
+        bbox = fig.get_tightbbox(renderer).padded(plt.rcParams["savefig.pad_inches"])
+    finally:
+        fig.dpi = fig_dpi
     for ext in ["png", "svg", "pdf"]:
         path = f"{filename_base}.{ext}"
-        plt.savefig(path, bbox_inches="tight", dpi=dpi)
+        fig.savefig(path, bbox_inches=bbox, dpi=dpi)
     print(f"Plot saved to {filename_base}.png (And svg, pdf)")
 
+
+# Shared style for the bibliometric-law and reference plots; resolved once per
+# figure through plt.rc_context instead of per-call fontsize arguments.
+_BIB_PLOT_RC: Dict[str, Any] = {
+    "axes.titlesize": 14,
+    "axes.labelsize": 12,
+}
+
+
+@contextmanager
+def _bib_plot_ctx(ax=None, figsize=(10, 6)):
+    """
+    Context manager yielding ``(fig, ax, own_fig)`` under the shared plot style.
+
+    Everything created inside the block picks up :data:`_BIB_PLOT_RC`;
+    see :func:`_prepare_axes` for how ``ax`` is handled. A caller-supplied
+    ``ax`` already holds its axis-label texts, which rc settings no longer
+    reach, so their font size is applied to them explicitly.
+    """
+    with plt.rc_context(_BIB_PLOT_RC):
+        fig, ax, own_fig = _prepare_axes(ax, figsize=figsize)
+        if not own_fig:
+            for label in (ax.xaxis.label, ax.yaxis.label):
+                label.set_fontsize(_BIB_PLOT_RC["axes.labelsize"])
+        yield fig, ax, own_fig
+
+
+def _get_cmap(cmap=None, n=None):
+    """
+    Return a colormap, optionally resampled to ``n`` colors.
+
+    Names (None meaning ``rcParams["image.cmap"]``) are resolved once and
+    the colormap is cached, so it is shared between callers and must not be
+    modified. Colormap objects are passed through unchanged (resampled when
+    ``n`` is given), as with ``cm.get_cmap``.
+    """
+    if cmap is None:
+        cmap = rcParams["image.cmap"]
+    if isinstance(cmap, str):
+        return _named_cmap(cmap, n)
+    if n:
+        return cmap.resampled(n) if hasattr(cmap, "resampled") else cmap._resample(n)
+    return cmap
+
+
+@lru_cache(maxsize=32)
+def _named_cmap(name, n=None):
+    """
+    Cached colormap lookup by name for :func:`_get_cmap`.
+
+    Uses the ``matplotlib.colormaps`` registry where available and falls
+    back to ``cm.get_cmap`` on older Matplotlib versions.
+    """
+    registry = getattr(plt.matplotlib, "colormaps", None)
+    if registry is not None and hasattr(registry["viridis"], "resampled"):
+        cmap = registry[name]
+        return cmap.resampled(n) if n else cmap
+    return cm.get_cmap(name, n) if n else cm.get_cmap(name)
+
+
+@lru_cache(maxsize=8)
+def _style_rc(sheet):
+    """
+    Return the parsed rc settings of a style sheet, reading style files once.
+
+    Named styles come from ``plt.style.library``; anything else (e.g.
+    "default") is returned unchanged for :func:`plt.style.use` to resolve.
+    """
+    if sheet in plt.style.library:
+        return dict(plt.style.library[sheet])
+    if os.path.isfile(sheet):
+        return dict(plt.matplotlib.rc_params_from_file(sheet, use_default_template=False))
+    return sheet
+
+
+@lru_cache(maxsize=16)
+def _colorscale_stops(colorscale):
+    """
+    Parse a Plotly colorscale once into ``(stops, rgb)`` arrays.
+
+    ``colorscale`` is a named scale or a (hashable) tuple of colors or
+    ``(stop, color)`` pairs; ``rgb`` holds one 0-1 RGB row per stop.
+    """
+    from plotly import colors as pcolors, exceptions
+
+    try:
+        pcolors.validate_colorscale(colorscale)
+        cs = colorscale
+    except exceptions.PlotlyError:
+        cs = pcolors.get_colorscale(colorscale) if isinstance(colorscale, str) else colorscale
+        cs = pcolors.make_colorscale(list(cs)) if isinstance(cs[0], str) else cs
+    stops = np.asarray(pcolors.colorscale_to_scale(cs), dtype=float)
+    rgb = np.asarray(pcolors.validate_colors(pcolors.colorscale_to_colors(cs), colortype="tuple"), dtype=float)
+    stops.setflags(write=False)
+    rgb.setflags(write=False)
+    return stops, rgb
+
+
+def _sample_colorscale(colorscale, values):
+    """
+    Vectorized equivalent of ``plotly.colors.sample_colorscale``.
+
+    Interpolates each RGB channel with :func:`np.interp` over the cached
+    colorscale stops and returns ``"rgb(r, g, b)"`` strings.
+    """
+    if not isinstance(colorscale, str):
+        colorscale = tuple(tuple(c) if isinstance(c, (list, tuple)) else c for c in colorscale)
+    stops, rgb = _colorscale_stops(colorscale)
+    values = np.asarray(values, dtype=float)
+    out = np.stack([np.interp(values, stops, rgb[:, k]) for k in range(3)], axis=1)
+    out = np.rint(out * 255.0).astype(int)
+    return [f"rgb({r}, {g}, {b})" for r, g, b in out]
+
+
+# Kamada-Kawai needs all-pairs distances (O(N^2) memory, roughly O(N^3) time);
+# above this many nodes the layout helpers fall back to a spring layout.
+_KK_MAX_NODES = 1000
+
+
+def _fallback_layout_name(G, name, kk_max_nodes=None):
+    """Return ``name``, or "spring" when Kamada-Kawai is requested for a graph too large for it."""
+    if kk_max_nodes is None:
+        kk_max_nodes = _KK_MAX_NODES
+    if name == "kamada_kawai" and G.number_of_nodes() > kk_max_nodes:
+        warnings.warn(
+            f"Graph has {G.number_of_nodes()} nodes (> {kk_max_nodes}); "
+            "using spring layout instead of Kamada-Kawai.",
+            RuntimeWarning,
+        )
+        return "spring"
+    return name
+
+
+def _lbfgs_fr_layout(G, k=None, pos=None, fixed=None, iterations=50, threshold=1e-4,
+                     weight="weight", scale=1, center=None, dim=2, seed=None):
+    """
+    Fruchterman-Reingold layout minimised with L-BFGS on the sparse adjacency.
+
+    Avoids Kamada-Kawai's dense distance matrix on medium-sized graphs. Uses
+    ``spring_layout(method="energy")``, which needs NetworkX >= 3.5; on older
+    NetworkX this is just ``spring_layout`` (not an L-BFGS solver), whose
+    sparse variant takes over above 500 nodes. Parameters are those of
+    :func:`networkx.spring_layout`.
+    """
+    kwargs = dict(k=k, pos=pos, fixed=fixed, iterations=iterations, threshold=threshold,
+                  weight=weight, scale=scale, center=center, dim=dim, seed=seed)
+    if "method" in inspect.signature(nx.spring_layout).parameters:
+        kwargs["method"] = "energy"
+    return nx.spring_layout(G, **kwargs)
+
+
+# Node positions per graph (held weakly), so re-plotting the same network does
+# not re-run an expensive layout such as Kamada-Kawai.
+_LAYOUT_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _cached_layout(G, name, compute=None, key=()):
+    """
+    Return the ``name`` layout of ``G``, computed once per graph state.
+
+    Entries are keyed on ``name`` plus an optional extra ``key`` and are
+    recomputed whenever the node or edge set of ``G`` has changed since they
+    were stored. ``compute`` defaults to ``nx.<name>_layout(G)`` (Kamada-Kawai
+    falling back to spring on large graphs). The returned positions are
+    copies, so callers may modify them freely.
+    """
+    if compute is None:
+        name = _fallback_layout_name(G, name)
+    per_graph = _LAYOUT_CACHE.setdefault(G, {})
+    # O(N + E) to build, negligible next to any layout worth caching.
+    version = (frozenset(G.nodes), frozenset(G.edges))
+    k = (name, key)
+    cached = per_graph.get(k)
+    if cached is None or cached[0] != version:
+        if compute is None:
+            layout_fn = _lbfgs_fr_layout if name == "lbfgs_fr" else getattr(nx, f"{name}_layout")
+            compute = partial(layout_fn, G)
+        cached = per_graph[k] = (version, compute())
+    return {n: np.array(p, copy=True) for n, p in cached[1].items()}
+
+
+def _in_degree_array(G):
+    """
+    In-degrees of a directed graph in ``G.nodes`` order, as a float array.
+
+    Read straight off ``G.in_degree`` (no adjacency matrix is built).
+    """
+    return np.fromiter((d for _, d in G.in_degree()), float, G.number_of_nodes())
+
+
+def _top_label_mask(scores, max_labels):
+    """
+    Boolean mask of the ``max_labels`` highest scores (all if None or not exceeded).
+
+    Used to cap the number of texts passed to ``adjust_text``, whose overlap
+    resolution scales quadratically with the number of labels.
+    """
+    scores = np.asarray(scores, dtype=float)
+    mask = np.ones(scores.size, dtype=bool)
+    if max_labels is None or scores.size <= max_labels:
+        return mask
+    mask[:] = False
+    if max_labels > 0:
+        mask[np.argpartition(-scores, max_labels - 1)[:max_labels]] = True
+    return mask
+
+
+def _grid_declutter_texts(ax, xy, labels, cell_px=30.0, max_shifts=2, **text_kwargs):
+    """
+    Place ``labels`` at data points ``xy`` (given in priority order) so that no
+    two labels share a ``cell_px`` square of display pixels.
+
+    Each label reserves every cell its rendered extent covers. A label that
+    hits a taken cell moves right by one cell, up to ``max_shifts`` times, and
+    is dropped if it still collides. Linear in the number of labels, unlike the
+    iterative overlap resolution of ``adjust_text``.
+
+    The figure layout is settled first, so call this after titles, legends and
+    colorbars are in place; the labels themselves are kept out of the layout.
+    """
+    xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+    if not len(xy):
+        return []
+    fig = ax.figure
+    ax.autoscale_view()
+    renderer = _figure_renderer(fig)
+    _finalize_layout(fig, renderer)
+    disp = ax.transData.transform(xy)
+    to_data = ax.transData.inverted()
+    taken = set()
+    texts = []
+    for (x, y), (px, py), label in zip(xy, disp, labels):
+        text = ax.text(x, y, label, **text_kwargs)
+        text.set_in_layout(False)
+        ext = text.get_window_extent(renderer)
+        for shift in range(max_shifts + 1):
+            dx = shift * cell_px
+            cells = {
+                (cx, cy)
+                for cx in range(int(np.floor((ext.x0 + dx) / cell_px)), int(np.floor((ext.x1 + dx) / cell_px)) + 1)
+                for cy in range(int(np.floor(ext.y0 / cell_px)), int(np.floor(ext.y1 / cell_px)) + 1)
+            }
+            if taken.isdisjoint(cells):
+                taken |= cells
+                if shift:
+                    text.set_position(to_data.transform((px + dx, py)))
+                texts.append(text)
+                break
+        else:
+            text.remove()
+    return texts
+
+
+def _label_category_axis(axis, labels, thin=False):
+    """
+    Label positions ``0..len(labels)-1`` of ``axis`` with ``labels``.
+
+    With ``thin``, only the integer positions picked by a ``MaxNLocator`` get a
+    tick (labelled by lookup), so thousands of categories cost a few tick
+    labels instead of one each.
+    """
+    if not thin:
+        axis.set_ticks(np.arange(len(labels)))
+        axis.set_ticklabels(labels)
+        return
+    n = len(labels)
+    axis.set_major_locator(MaxNLocator(nbins="auto", integer=True))
+    axis.set_major_formatter(FuncFormatter(
+        lambda val, pos: labels[int(round(val))] if 0 <= round(val) < n else ""))
+
+
+def _prepare_axes(ax=None, figsize=(10, 6)):
+    """
+    Return ``(fig, ax, own_fig)``, creating a new figure only when ``ax`` is None.
+
+    A supplied ``ax`` is made current so that ``plt.*`` calls and
+    :func:`save_plot` act on the caller's figure.
+    """
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize)
+        return fig, ax, True
+    plt.sca(ax)
+    return ax.figure, ax, False
+
+
+def _show_and_close(fig, own_fig=True, close_after=True):
+    """
+    Show a figure created by a plotting function and release it afterwards.
+
+    Figures drawn into a caller-supplied axes are left untouched so they
+    can be composed further.
+    """
+    if not own_fig:
+        return
+    plt.show()
+    if close_after:
+        plt.close(fig)
+
+
+def _maybe_downsample(x, y, max_points=5000, mode="lttb", log_x=False, log_y=False):
+    """
+    Return positional indices of a reduced point set for plotting.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Point coordinates of equal length.
+    max_points : int or None, default 5000
+        Upper bound on the number of returned points. ``None`` or a value
+        not smaller than ``len(x)`` keeps every point.
+    mode : str, default "lttb"
+        "lttb" keeps the points of a line chart that best preserve its shape
+        (Largest-Triangle-Three-Buckets, ``x`` is assumed to be sorted).
+        "grid" bins a scatter into a regular 2D grid and keeps the first
+        point of each non-empty cell.
+    log_x, log_y : bool, default False
+        The axis is drawn on a log scale. For "lttb", buckets are then spaced
+        evenly in ``log10(x)`` (so every decade keeps its share of points, and
+        sparse decades keep all of theirs) and triangle areas are measured in
+        log coordinates. Ignored unless the values are all positive.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted integer positions into ``x``/``y``.
+    """
+    n = len(x)
+    if max_points is None or n <= max_points or max_points < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    if mode == "grid":
+        bins = max(int(np.sqrt(max_points)), 1)
+        finite = np.isfinite(x) & np.isfinite(y)
+        pos = np.flatnonzero(finite)
+        if pos.size == 0:
+            return pos
+        _, xe, ye = np.histogram2d(x[pos], y[pos], bins=bins)
+        xi = np.clip(np.searchsorted(xe, x[pos], side="right") - 1, 0, bins - 1)
+        yi = np.clip(np.searchsorted(ye, y[pos], side="right") - 1, 0, bins - 1)
+        _, first = np.unique(xi * bins + yi, return_index=True)
+        return np.sort(pos[first])
+
+    if mode != "lttb":
+        raise ValueError("mode must be either 'lttb' or 'grid'.")
+
+    # first and last points are always kept, the rest is split into buckets
+    if log_x and x[0] > 0:
+        x = np.log10(x)
+        # evenly spaced in log(x); narrow buckets collapse to single points
+        targets = np.linspace(x[1], x[-1], max_points - 1)
+        edges = np.unique(np.r_[1, np.clip(np.searchsorted(x, targets), 1, n - 1), n - 1])
+    else:
+        edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    if log_y and (y > 0).all():
+        y = np.log10(y)
+    keep = np.empty(edges.size + 1, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for b in range(edges.size - 1):
+        lo, hi = edges[b], edges[b + 1]
+        nlo, nhi = hi, edges[b + 2] if b + 2 < edges.size else n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[b + 1] = a
+    return keep
+
 def plot_barh(
     df,
     x,
@@ -2604,8 +3032,8 @@ def plot_treemap(df, filename="treemap", item_col=None, size_col="Number of docu
         values = df[color_by]
         if pd.api.types.is_numeric_dtype(values):
             norm = mcolors.Normalize(vmin=values.min(), vmax=values.max())
-            cmap = cm.get_cmap(cmap)
-            colors = [cmap(norm(val)) for val in values]
+            cmap = _get_cmap(cmap)
+            colors = cmap(norm(values.to_numpy(dtype=float)))
             colorbar_type = "continuous"
         else:
             categories = pd.Categorical(values)
@@ -4924,8 +5352,8 @@ def plot_topic_distribution(
     if value_column and value_column in df.columns:
         topic_means = df.groupby("Topic")[value_column].mean().reindex(topic_order)
         norm = mcolors.Normalize(vmin=topic_means.min(), vmax=topic_means.max())
-        cmap = cm.get_cmap(palette)
-        colors = [cmap(norm(val)) for val in topic_means]
+        cmap = _get_cmap(palette)
+        colors = cmap(norm(topic_means.to_numpy(dtype=float)))
 
         bars = ax.bar(topic_order, topic_counts.values, color=colors)
 
@@ -6289,7 +6717,7 @@ def plot_bradford_distribution(source_counts, title="Bradford's Law - Source Sca
     plt.show()
 
 
-def plot_bradford_zones(source_counts, title="Bradford's Law - Zones", filename_base=None, dpi=600, colors=None, annotate_core=True, show_labels="zone1", label_rotation=90, alt_label_col="Abbreviated Source Title", max_label_length=30, show_grid=False):
+def plot_bradford_zones(source_counts, title="Bradford's Law - Zones", filename_base=None, dpi=600, colors=None, annotate_core=True, show_labels="zone1", label_rotation=90, alt_label_col="Abbreviated Source Title", max_label_length=30, show_grid=False, ax=None, close_after=True):
     """
     Plot Bradford's Law zone visualization.
     
@@ -6317,52 +6745,75 @@ def plot_bradford_zones(source_counts, title="Bradford's Law - Zones", filename_
         Maximum label length before truncation.
     show_grid : bool
         Whether to show grid lines.
-    """
-    fig, ax = plt.subplots(figsize=(12, 6))
-    zone_count = source_counts["Zone"].max()
-    if colors is None:
-        colors = ["#c6dbef", "#9ecae1", "#6baed6"][:zone_count]
-
-    start = 0
-    tick_labels = []
-    tick_positions = []
-
-    for z in range(1, zone_count + 1):
-        group = source_counts[source_counts["Zone"] == z].copy()
-        x = list(range(start + 1, start + len(group) + 1))
-        ax.fill_between(x, group["Document_Count"], color=colors[z - 1], step="mid", label=f"Zone {z}")
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw into. When given, the figure is neither shown nor closed.
+    close_after : bool
+        Close the figure after showing it to free its memory.
+    """
+    with _bib_plot_ctx(ax, figsize=(12, 6)) as (fig, ax, own_fig):
+        zone_count = source_counts["Zone"].max()
+        if colors is None:
+            colors = ["#c6dbef", "#9ecae1", "#6baed6"][:zone_count]
+
+        start = 0
+        tick_labels = []
+        tick_positions = []
+        zone_verts = []
+        zone_colors = []
+        legend_handles = []
+
+        for z in range(1, zone_count + 1):
+            group = source_counts[source_counts["Zone"] == z]
+            x = list(range(start + 1, start + len(group) + 1))
+            if x:
+                # mid-step outline closed down to the baseline, as fill_between(step="mid") draws it
+                xs = np.asarray(x, dtype=float)
+                mid = (xs[:-1] + xs[1:]) / 2
+                step_x = np.concatenate(([xs[0]], np.repeat(mid, 2), [xs[-1]]))
+                step_y = np.repeat(group["Document_Count"].to_numpy(dtype=float), 2)
+                zone_verts.append(np.column_stack((
+                    np.concatenate(([step_x[0]], step_x, [step_x[-1]])),
+                    np.concatenate(([0.0], step_y, [0.0])),
+                )))
+                zone_colors.append(colors[z - 1])
+            legend_handles.append(Patch(color=colors[z - 1], label=f"Zone {z}"))
+
+            if show_labels == "all" or (show_labels == "zone1" and z == 1):
+                if alt_label_col and alt_label_col in group.columns:
+                    labels = group[alt_label_col].fillna(group["Source"])
+                else:
+                    src = group["Source"]
+                    labels = src.where(src.str.len() <= max_label_length, src.str[:max_label_length-3] + "...")
 
-        if show_labels == "all" or (show_labels == "zone1" and z == 1):
-            if alt_label_col and alt_label_col in group.columns:
-                labels = group[alt_label_col].fillna(group["Source"])
-            else:
-                labels = group["Source"].apply(lambda s: s if len(s) <= max_label_length else s[:max_label_length-3] + "...")
+                tick_labels.extend(labels.tolist())
+                tick_positions.extend(x)
 
-            tick_labels.extend(labels.tolist())
-            tick_positions.extend(x)
+            start += len(group)
 
-        start += len(group)
+        # all zones in one artist
+        ax.add_collection(PolyCollection(zone_verts, facecolors=zone_colors, edgecolors=zone_colors))
+        ax.autoscale_view()
 
-    ax.set_xlabel("Source Rank", fontsize=12)
-    ax.set_ylabel("Documents", fontsize=12)
-    ax.set_title(title, fontsize=14)
-    ax.set_yscale("linear")
-    ax.set_xscale("log")
-    if show_grid:
-        ax.grid(True, which="both", ls="--", lw=0.5)
-    ax.legend()
+        ax.set_xlabel("Source Rank")
+        ax.set_ylabel("Documents")
+        ax.set_title(title)
+        ax.set_yscale("linear")
+        ax.set_xscale("log")
+        if show_grid:
+            ax.grid(True, which="both", ls="--", lw=0.5)
+        ax.legend(handles=legend_handles)
 
-    if tick_labels:
-        ax.set_xticks(tick_positions)
-        ax.set_xticklabels(tick_labels, rotation=label_rotation, ha="right", fontsize=9)
+        if tick_labels:
+            ax.set_xticks(tick_positions)
+            ax.set_xticklabels(tick_labels, rotation=label_rotation, ha="right", fontsize=9)
 
-    if annotate_core:
-        ax.text(2, max(source_counts["Document_Count"]) * 0.9, "Core Sources", fontsize=12, alpha=0.6)
+        if annotate_core:
+            ax.text(2, max(source_counts["Document_Count"]) * 0.9, "Core Sources", fontsize=12, alpha=0.6)
 
-    plt.tight_layout()
-    if filename_base:
-        save_plot(filename_base, dpi)
-    plt.show()
+        plt.tight_layout()
+        if filename_base:
+            save_plot(filename_base, dpi)
+        _show_and_close(fig, own_fig, close_after)
 
 def compute_zipf_distribution_from_counts(df, word_col=0, count_col=1):
     """
@@ -6382,14 +6833,18 @@ def compute_zipf_distribution_from_counts(df, word_col=0, count_col=1):
     if isinstance(count_col, int):
         count_col = df.columns[count_col]
     
-    zipf_df = df[[word_col, count_col]].copy()
-    zipf_df.columns = ["Word", "Frequency"]
-    zipf_df = zipf_df.sort_values(by="Frequency", ascending=False).reset_index(drop=True)
-    zipf_df["Rank"] = np.arange(1, len(zipf_df) + 1)
-    return zipf_df
+    words = df[word_col].to_numpy()
+    freqs = df[count_col].to_numpy()
+    # descending, stable for ties; a single argsort avoids the sorted + reindexed copies
+    order = np.argsort(-freqs, kind="stable")
+    return pd.DataFrame({
+        "Word": words[order],
+        "Frequency": freqs[order],
+        "Rank": np.arange(1, len(order) + 1),
+    })
 
 
-def plot_zipf_distribution(zipf_df, title="Zipf's Law - Word Frequencies", filename_base=None, dpi=600, color="blue", show_grid=False, top_n_labels=10):
+def plot_zipf_distribution(zipf_df, title="Zipf's Law - Word Frequencies", filename_base=None, dpi=600, color="blue", show_grid=False, top_n_labels=10, max_points=5000, ax=None, close_after=True):
     """
     Plot Zipf's Law distribution: frequency vs rank on a log-log scale.
 
@@ -6401,31 +6856,37 @@ def plot_zipf_distribution(zipf_df, title="Zipf's Law - Word Frequencies", filen
         color (str): Color of the curve.
         show_grid (bool): Whether to show grid.
         top_n_labels (int): Number of top labels to display.
-    """
-    plt.figure(figsize=(10, 6))
-    plt.loglog(zipf_df["Rank"], zipf_df["Frequency"], marker="o", linestyle="-", color=color)
-    plt.xlabel("Rank", fontsize=12)
-    plt.ylabel("Frequency", fontsize=12)
-    plt.title(title, fontsize=14)
-
-    if top_n_labels > 0:
-        for i in range(min(top_n_labels, len(zipf_df))):
-            x = zipf_df.loc[i, "Rank"]
-            y = zipf_df.loc[i, "Frequency"]
-            word = zipf_df.loc[i, "Word"]
-            plt.text(x, y, word, fontsize=8, ha="left", va="bottom")
-
-    if show_grid:
-        plt.grid(True, which="both", ls="--", lw=0.5)
-    plt.tight_layout()
+        max_points (int or None): Downsample the curve to at most this many points (None keeps all).
+        ax (matplotlib.axes.Axes, optional): Axes to draw into; the figure is then neither shown nor closed.
+        close_after (bool): Close the figure after showing it to free its memory.
+    """
+    with _bib_plot_ctx(ax) as (fig, ax, own_fig):
+        keep = _maybe_downsample(zipf_df["Rank"], zipf_df["Frequency"], max_points, mode="lttb",
+                                 log_x=True, log_y=True)
+        plt.loglog(zipf_df["Rank"].to_numpy()[keep], zipf_df["Frequency"].to_numpy()[keep], marker="o", linestyle="-", color=color)
+        plt.xlabel("Rank")
+        plt.ylabel("Frequency")
+        plt.title(title)
+
+        if top_n_labels > 0:
+            n_labels = min(top_n_labels, len(zipf_df))
+            ranks = zipf_df["Rank"].to_numpy()[:n_labels]
+            freqs = zipf_df["Frequency"].to_numpy()[:n_labels]
+            words = zipf_df["Word"].to_numpy()[:n_labels]
+            for x, y, word in zip(ranks, freqs, words):
+                plt.text(x, y, word, fontsize=8, ha="left", va="bottom")
+
+        if show_grid:
+            plt.grid(True, which="both", ls="--", lw=0.5)
+        plt.tight_layout()
 
-    if filename_base:
-        save_plot(filename_base, dpi)
+        if filename_base:
+            save_plot(filename_base, dpi)
 
-    plt.show()
+        _show_and_close(fig, own_fig, close_after)
 
 
-def plot_prices_law(author_counts, title="Price's Law - Core Author Contribution", filename_base=None, dpi=600, color_core="red", color_tail="gray", show_grid=False):
+def plot_prices_law(author_counts, title="Price's Law - Core Author Contribution", filename_base=None, dpi=600, color_core="red", color_tail="gray", show_grid=False, ax=None, close_after=True):
     """
     Plot cumulative document contribution by authors, highlighting Price's core group.
 
@@ -6437,30 +6898,33 @@ def plot_prices_law(author_counts, title="Price's Law - Core Author Contribution
         color_core (str): Color for core authors.
         color_tail (str): Color for remaining authors.
         show_grid (bool): Whether to show grid.
-    """
-    sorted_counts = author_counts.sort_values(ascending=False).reset_index(drop=True)
-    cumulative_docs = sorted_counts.cumsum() / sorted_counts.sum() * 100
-    core_size = int(np.sqrt(len(sorted_counts)))
-
-    plt.figure(figsize=(10, 6))
-    plt.plot(cumulative_docs.index[:core_size], cumulative_docs.iloc[:core_size], color=color_core, label="Core Authors")
-    plt.plot(cumulative_docs.index[core_size:], cumulative_docs.iloc[core_size:], color=color_tail, label="Other Authors")
-
-    plt.axvline(core_size, color="black", linestyle="--", linewidth=1, label=f"sqrt(N) = {core_size}")
-    plt.xlabel("Author Rank", fontsize=12)
-    plt.ylabel("Cumulative % of Documents", fontsize=12)
-    plt.title(title, fontsize=14)
-    plt.legend()
-    if show_grid:
-        plt.grid(True, which="both", ls="--", lw=0.5)
-    plt.tight_layout()
+        ax (matplotlib.axes.Axes, optional): Axes to draw into; the figure is then neither shown nor closed.
+        close_after (bool): Close the figure after showing it to free its memory.
+    """
+    arr = np.sort(np.asarray(author_counts, dtype=np.float64))[::-1]
+    cumulative_docs = np.cumsum(arr) / arr.sum() * 100.0
+    ranks = np.arange(arr.size)
+    core_size = int(np.sqrt(arr.size))
+
+    with _bib_plot_ctx(ax) as (fig, ax, own_fig):
+        plt.plot(ranks[:core_size], cumulative_docs[:core_size], color=color_core, label="Core Authors")
+        plt.plot(ranks[core_size:], cumulative_docs[core_size:], color=color_tail, label="Other Authors")
+
+        plt.axvline(core_size, color="black", linestyle="--", linewidth=1, label=f"sqrt(N) = {core_size}")
+        plt.xlabel("Author Rank")
+        plt.ylabel("Cumulative % of Documents")
+        plt.title(title)
+        plt.legend()
+        if show_grid:
+            plt.grid(True, which="both", ls="--", lw=0.5)
+        plt.tight_layout()
 
-    if filename_base:
-        save_plot(filename_base, dpi)
+        if filename_base:
+            save_plot(filename_base, dpi)
 
-    plt.show()
+        _show_and_close(fig, own_fig, close_after)
     
-def plot_pareto_principle(counts, top_percentage=20, title="Pareto Principle Analysis", filename_base=None, dpi=600, color_curve="blue", color_threshold="red", show_grid=False):
+def plot_pareto_principle(counts, top_percentage=20, title="Pareto Principle Analysis", filename_base=None, dpi=600, color_curve="blue", color_threshold="red", show_grid=False, ax=None, close_after=True):
     """
     Plot cumulative contribution curve highlighting the Pareto threshold.
 
@@ -6473,27 +6937,34 @@ def plot_pareto_principle(counts, top_percentage=20, title="Pareto Principle Ana
         color_curve (str): Line color.
         color_threshold (str): Threshold line color.
         show_grid (bool): Whether to show grid.
+        ax (matplotlib.axes.Axes, optional): Axes to draw into; the figure is then neither shown nor closed.
+        close_after (bool): Close the figure after showing it to free its memory.
     """
-    sorted_counts = counts.sort_values(ascending=False).reset_index(drop=True)
-    cumulative_contribution = sorted_counts.cumsum() / sorted_counts.sum() * 100
+    # descending in-place sort of a private copy, then normalise the running total in place
+    arr = np.array(counts, dtype=np.float64)
+    arr[::-1].sort()
+    cumulative_contribution = np.cumsum(arr)
+    if cumulative_contribution.size:
+        cumulative_contribution /= cumulative_contribution[-1]
+        cumulative_contribution *= 100.0
 
-    plt.figure(figsize=(10, 6))
-    plt.plot(cumulative_contribution.index, cumulative_contribution.values, color=color_curve)
+    with _bib_plot_ctx(ax) as (fig, ax, own_fig):
+        plt.plot(np.arange(arr.size), cumulative_contribution, color=color_curve)
 
-    threshold_index = int(np.ceil(top_percentage / 100 * len(cumulative_contribution)))
-    plt.axvline(threshold_index, color=color_threshold, linestyle="--", label=f"Top {top_percentage}%")
+        threshold_index = int(np.ceil(top_percentage / 100.0 * arr.size))
+        plt.axvline(threshold_index, color=color_threshold, linestyle="--", label=f"Top {top_percentage}%")
 
-    plt.xlabel("Item Rank", fontsize=12)
-    plt.ylabel("Cumulative % of Contribution", fontsize=12)
-    plt.title(title, fontsize=14)
-    plt.legend()
+        plt.xlabel("Item Rank")
+        plt.ylabel("Cumulative % of Contribution")
+        plt.title(title)
+        plt.legend()
 
-    plt.tight_layout()
+        plt.tight_layout()
 
-    if filename_base:
-        save_plot(filename_base, dpi)
+        if filename_base:
+            save_plot(filename_base, dpi)
 
-    plt.show()
+        _show_and_close(fig, own_fig, close_after)
 
 
 # =============================================================================
@@ -7020,7 +7491,8 @@ def plot_average_citations_per_year(
     wrap_xticks=False,
     wrap_width=10,
     filename_base=None,
-    show=True
+    show=True,
+    max_points=5000
 ):
     """
     Plot the average citations per document by year as a line or bar chart,
@@ -7047,6 +7519,7 @@ def plot_average_citations_per_year(
         wrap_width (int): Max width of each wrapped line.
         filename_base (str or None): Base filename for saving.
         show (bool): Whether to display the plot.
+        max_points (int or None): Downsample line plots to at most this many points (None keeps all).
     """
     fig, ax1 = plt.subplots(figsize=(10, 6))
 
@@ -7057,7 +7530,8 @@ def plot_average_citations_per_year(
     if plot_type == "bar":
         ax1.bar(x, y, color=color)
     elif plot_type == "line":
-        ax1.plot(x, y, marker=marker, color=color, linewidth=linewidth)
+        keep = _maybe_downsample(x, y, max_points, mode="lttb")
+        ax1.plot(x.iloc[keep], y.iloc[keep], marker=marker, color=color, linewidth=linewidth)
     else:
         raise ValueError("plot_type must be either 'line' or 'bar'.")
 
@@ -7070,9 +7544,8 @@ def plot_average_citations_per_year(
     if wrap_xticks:
         labels = [textwrap.fill(str(label), wrap_width) for label in x]
         ax1.set_xticks(x)
-        ax1.set_xticklabels(labels, rotation=xtick_rotation)
-    else:
-        plt.xticks(rotation=xtick_rotation)
+        ax1.set_xticklabels(labels)
+    ax1.tick_params(axis="x", rotation=xtick_rotation)
 
     # Optional secondary axis
     if doc_count_col is not None and doc_count_col in df.columns:
@@ -7375,6 +7848,7 @@ def plot_word_map(
     xlabel: str = "Dim 1",
     ylabel: str = "Dim 2",
     show_legend: bool = True,
+    max_points: int | None = 5000,
 ) -> None:
     """
     Scatter plot of term embeddings colored by cluster labels.
@@ -7413,6 +7887,9 @@ def plot_word_map(
         Label for the x-axis.
     ylabel : str, default "Dim 2"
         Label for the y-axis.
+    max_points : int or None, default 5000
+        When there are more terms than this, only one term per cell of a
+        regular grid is drawn (and labelled). ``None`` draws every term.
 
     Examples
     --------
@@ -7458,6 +7935,12 @@ def plot_word_map(
         y = np.zeros_like(x)
         embeddings = np.vstack((x, y)).T
 
+    keep = _maybe_downsample(embeddings[:, 0], embeddings[:, 1], max_points, mode="grid")
+    if keep.size < n_pts:
+        embeddings = embeddings[keep]
+        labels = labels[keep]
+        terms = [terms[i] for i in keep]
+
     plt.figure(figsize=figsize)
     scatter = plt.scatter(
         embeddings[:, 0],
@@ -7499,6 +7982,22 @@ def plot_word_map(
 
 
 
+@lru_cache(maxsize=32)
+def _linkage_cached(emb_bytes, shape, dtype, method, metric):
+    """
+    Cached hierarchical linkage of an embedding matrix passed as raw bytes.
+
+    Uses ``fastcluster`` when installed, otherwise
+    :func:`scipy.cluster.hierarchy.linkage`. The returned array is read-only
+    because it is shared between calls.
+    """
+    emb = np.frombuffer(emb_bytes, dtype=dtype).reshape(shape)
+    link = _fast_linkage if _fast_linkage is not None else linkage
+    Z = link(emb, method=method, metric=metric)
+    Z.flags.writeable = False
+    return Z
+
+
 def plot_topic_dendrogram(
     embeddings: np.ndarray,
     terms: list,
@@ -7600,8 +8099,9 @@ def plot_topic_dendrogram(
             f"got {len(terms)} labels for {n_pts} points"
         )
 
-    # Hierarchical clustering
-    Z = linkage(emb, method=method, metric=metric)
+    # Hierarchical clustering (cached for repeated calls on the same embeddings)
+    emb = np.ascontiguousarray(emb)
+    Z = _linkage_cached(emb.tobytes(), emb.shape, emb.dtype.str, method, metric)
 
     # Plot
     fig, ax = plt.subplots(figsize=figsize)
@@ -7932,7 +8432,7 @@ def plot_item_time_stats(
 
 # spectrogram
 
-def plot_reference_spectrogram(spectrogram_df, title="Spectroscopy of Science", save_path=None, group_by_decade=False, show_grid=False, fontsize=12):
+def plot_reference_spectrogram(spectrogram_df, title="Spectroscopy of Science", save_path=None, group_by_decade=False, show_grid=False, fontsize=12, ax=None, close_after=True):
     """
     Plots the spectrogram of cited years or decades.
 
@@ -7941,30 +8441,40 @@ def plot_reference_spectrogram(spectrogram_df, title="Spectroscopy of Science",
         title (str): Plot title.
         save_path (str or None): If provided, saves the plot using save_plot().
         group_by_decade (bool): If True, groups citations by decade.
+        ax (matplotlib.axes.Axes, optional): Axes to draw into; the figure is then neither shown nor closed.
+        close_after (bool): Close the figure after showing it to free its memory.
     """
-    df = spectrogram_df.copy()
     if group_by_decade:
-        df["Decade"] = (df.index // 10) * 10
-        df = df.groupby("Decade")["Citations"].sum().reset_index()
-        x = df["Decade"]
-        y = df["Citations"]
+        years = spectrogram_df.index.to_numpy(dtype=np.int64)
+        citations = np.nan_to_num(spectrogram_df["Citations"].to_numpy(dtype=np.float64))
+        if years.size:
+            decades = (years // 10) * 10
+            base = decades.min()
+            idx = ((decades - base) // 10).astype(np.intp)
+            sums = np.bincount(idx, weights=citations)
+            # keep only decades that actually occur, as groupby would
+            present = np.bincount(idx) > 0
+            x = (base + np.arange(sums.size) * 10)[present]
+            y = sums[present]
+        else:
+            x = y = np.array([])
         xlabel = "Cited Decade"
     else:
-        x = df.index
-        y = df["Citations"]
+        x = spectrogram_df.index.to_numpy()
+        y = spectrogram_df["Citations"].to_numpy()
         xlabel = "Cited Year"
 
-    plt.figure(figsize=(10, 5))
-    plt.plot(x, y, linewidth=2)
-    plt.title(title, fontsize=fontsize)
-    plt.xlabel(xlabel, fontsize=fontsize)
-    plt.ylabel("Number of Citations", fontsize=fontsize)
-    plt.grid(show_grid)
-    if save_path:
-        save_plot(save_path)
-    plt.show()
+    with _bib_plot_ctx(ax, figsize=(10, 5)) as (fig, ax, own_fig):
+        plt.plot(x, y, linewidth=2)
+        plt.title(title, fontsize=fontsize)
+        plt.xlabel(xlabel, fontsize=fontsize)
+        plt.ylabel("Number of Citations", fontsize=fontsize)
+        plt.grid(show_grid)
+        if save_path:
+            save_plot(save_path)
+        _show_and_close(fig, own_fig, close_after)
     
-def plot_reference_correlation(plot_df, xlabel=None, ylabel=None, title="Reference Correlation", show_corr=True, save_path=None, show_grid=False, fontsize=12):
+def plot_reference_correlation(plot_df, xlabel=None, ylabel=None, title="Reference Correlation", show_corr=True, save_path=None, show_grid=False, fontsize=12, max_points=5000, ax=None, close_after=True):
     """
     Plots a scatterplot using two columns from a DataFrame with optional correlation display.
 
@@ -7975,28 +8485,33 @@ def plot_reference_correlation(plot_df, xlabel=None, ylabel=None, title="Referen
         title (str): Plot title.
         show_corr (bool): Whether to display Pearson correlation in title.
         save_path (str or None): If provided, saves the plot.
+        max_points (int or None): Grid-downsample the scatter to at most this many points (None keeps all).
+        ax (matplotlib.axes.Axes, optional): Axes to draw into; the figure is then neither shown nor closed.
+        close_after (bool): Close the figure after showing it to free its memory.
     """
-    x = plot_df.iloc[:, 0]
-    y = plot_df.iloc[:, 1]
+    x = plot_df.iloc[:, 0].to_numpy(dtype=np.float64)
+    y = plot_df.iloc[:, 1].to_numpy(dtype=np.float64)
     xlabel = xlabel or plot_df.columns[0]
     ylabel = ylabel or plot_df.columns[1]
 
     corr_text = ""
     if show_corr:
-        r, _ = pearsonr(x, y)
+        # only the coefficient is shown, so skip pearsonr's p-value computation
+        r = np.corrcoef(x, y)[0, 1]
         corr_text = f" (r = {r:.2f})"
 
-    plt.figure(figsize=(6, 6))
-    plt.scatter(x, y, alpha=0.5)
-    min_val, max_val = min(min(x), min(y)), max(max(x), max(y))
-    plt.plot([min_val, max_val], [min_val, max_val], linestyle="--", color="gray")
-    plt.xlabel(xlabel, fontsize=fontsize)
-    plt.ylabel(ylabel, fontsize=fontsize)
-    plt.title(f"{title}{corr_text}", fontsize=fontsize)
-    plt.grid(show_grid)
-    if save_path:
-        save_plot(save_path)
-    plt.show()
+    with _bib_plot_ctx(ax, figsize=(6, 6)) as (fig, ax, own_fig):
+        keep = _maybe_downsample(x, y, max_points, mode="grid")
+        plt.scatter(x[keep], y[keep], alpha=0.5)
+        min_val, max_val = min(x.min(), y.min()), max(x.max(), y.max())
+        plt.plot([min_val, max_val], [min_val, max_val], linestyle="--", color="gray")
+        plt.xlabel(xlabel, fontsize=fontsize)
+        plt.ylabel(ylabel, fontsize=fontsize)
+        plt.title(f"{title}{corr_text}", fontsize=fontsize)
+        plt.grid(show_grid)
+        if save_path:
+            save_plot(save_path)
+        _show_and_close(fig, own_fig, close_after)
     
 # Scientific production by group
 
@@ -8066,11 +8581,12 @@ def plot_stacked_production_by_group(
     if "Year" not in stats.columns:
         raise ValueError("The stats DataFrame must contain a 'Year' column.")
 
-    data = stats.copy()
-
     # Identify columns and group names
-    doc_cols = [c for c in data.columns if c.startswith("Number of documents ")]
-    cit_cols = [c for c in data.columns if c.startswith("Cumulative Citations ")]
+    doc_cols = [c for c in stats.columns if c.startswith("Number of documents ")]
+    cit_cols = [c for c in stats.columns if c.startswith("Cumulative Citations ")]
+
+    # Only the used columns, with Year as object so it can hold the "Before ..." bin
+    data = stats[["Year", *doc_cols, *cit_cols]].assign(Year=stats["Year"].astype(object))
 
     doc_map = {c.replace("Number of documents ", ""): c for c in doc_cols}
     cit_map = {c.replace("Cumulative Citations ", ""): c for c in cit_cols}
@@ -8084,8 +8600,7 @@ def plot_stacked_production_by_group(
         ]
         group_colors = {g: palette[i % len(palette)] for i, g in enumerate(groups)}
 
-    # Year processing & optional pre-cut aggregation
-    data["Year"] = data["Year"].astype(object)
+    # Optional pre-cut aggregation
     if cut_year is not None:
         label = f"Before {cut_year}"
         mask_pre = pd.to_numeric(data["Year"], errors="coerce") < cut_year
@@ -8200,29 +8715,33 @@ def plot_count_differences(df: pd.DataFrame,
     """
     Plot percentage point differences using horizontal or vertical bars.
     """
-    df_plot = df.copy()
-
     if orientation == "auto":
         try:
-            years = pd.to_numeric(df_plot.index, errors="coerce")
+            years = pd.to_numeric(df.index, errors="coerce")
             is_time_series = years.notna().all() and years.is_monotonic_increasing
             orientation = "vertical" if is_time_series else "horizontal"
         except:
             orientation = "horizontal"
 
-    df_plot["Color"] = np.where(df_plot["PP_Diff"] >= 0, color_pos, color_neg)
+    # Work on arrays rather than a copy of the input frame
+    labels = df.index.astype(str).to_numpy()
+    diffs = df["PP_Diff"].to_numpy()
 
     if orientation == "horizontal":
-        df_plot = df_plot.sort_values("PP_Diff", ascending=True)
+        order = np.argsort(diffs, kind="stable")
+        labels = labels[order]
+        diffs = diffs[order]
+
+    bar_colors = np.where(diffs >= 0, color_pos, color_neg)
 
     fig, ax = plt.subplots(figsize=figsize)
 
     if orientation == "horizontal":
-        bars = ax.barh(df_plot.index.astype(str), df_plot["PP_Diff"],
-                       color=df_plot["Color"], alpha=alpha_cap)
+        bars = ax.barh(labels, diffs,
+                       color=bar_colors, alpha=alpha_cap)
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
-        x_vals = df_plot["PP_Diff"]
+        x_vals = diffs
         x_margin = (x_vals.max() - x_vals.min()) * margin_ratio
         ax.set_xlim(x_vals.min() - x_margin, x_vals.max() + x_margin)
 
@@ -8235,12 +8754,13 @@ def plot_count_differences(df: pd.DataFrame,
                         ha="left" if value > 0 else "right")
 
     else:
-        bars = ax.bar(df_plot.index.astype(str), df_plot["PP_Diff"],
-                      color=df_plot["Color"], alpha=alpha_cap)
+        bars = ax.bar(labels, diffs,
+                      color=bar_colors, alpha=alpha_cap)
         ax.set_ylabel(xlabel)
         ax.set_xlabel(ylabel)
-        plt.xticks(rotation=rotation, ha="right")
-        y_vals = df_plot["PP_Diff"]
+        ax.tick_params(axis="x", rotation=rotation)
+        plt.setp(ax.get_xticklabels(), ha="right")
+        y_vals = diffs
         y_margin = (y_vals.max() - y_vals.min()) * margin_ratio
         ax.set_ylim(y_vals.min() - y_margin, y_vals.max() + y_margin)
 
@@ -8268,7 +8788,7 @@ def plot_count_differences(df: pd.DataFrame,
     
 
 
-from matplotlib.ticker import FuncFormatter, NullFormatter
+from matplotlib.ticker import NullFormatter
 from matplotlib.collections import PathCollection
 
 
@@ -8320,6 +8840,9 @@ def plot_scatter(
     show: bool = True,
     *,
     force_integer_size_legend: bool = True,
+    max_labels: Optional[int] = 200,
+    rasterize_threshold: Optional[int] = 5000,
+    ax: Optional[plt.Axes] = None,
     **kwargs,
 ) -> None:
     """
@@ -8330,6 +8853,17 @@ def plot_scatter(
     ----------
     force_integer_size_legend : bool, default True
         Force integer labels in the size legend (rounded). Set False to allow decimal labels.
+    max_labels : int, optional, default 200
+        When label_col is given and there are more points than this, only the
+        ``max_labels`` largest points (by marker size) are labelled, which keeps
+        adjustText's quadratic overlap resolution bounded. None labels every point.
+    rasterize_threshold : int, optional, default 5000
+        With more points than this, the scatter markers are rasterized (at ``dpi``)
+        inside the SVG/PDF exports instead of being written as one vector path each;
+        axes, lines and text stay vector. None never rasterizes.
+    ax : matplotlib.axes.Axes, optional
+        Draw into an existing axes (e.g. one panel of a figure reused across many
+        calls). The caller's figure is then neither re-laid out, shown nor closed.
     formatter : Callable, optional
         Custom tick formatter. If None, and the data max on a *linear* axis is < 1000,
         that axis is formatted with plain numbers (no scientific notation).
@@ -8344,8 +8878,6 @@ def plot_scatter(
     except Exception:  # pragma: no cover
         adjust_text = None  # Fallback: labels won't be adjusted if unavailable
 
-    df_plot = df.copy()
-
     # Only include string-like columns for dropna subset
     cols: List[str] = [c for c in [x, y, size_col, color_col, marker_col, label_col] if isinstance(c, str)]
     if isinstance(error_x, str):
@@ -8353,13 +8885,27 @@ def plot_scatter(
     if isinstance(error_y, str):
         cols.append(error_y)
 
+    # Work on the referenced columns only (whatever their label type); the input
+    # frame is never modified
+    used = [x, y, size_col, color_col, marker_col, label_col]
+    used += [e for e in (error_x, error_y) if isinstance(e, str)]
+    df_plot = df.loc[:, list(dict.fromkeys(c for c in used if c is not None))]
+
     if dropna and cols:
-        df_plot.dropna(subset=cols, inplace=True)
+        df_plot = df_plot.dropna(subset=cols)
+
+    # Column handles reused by every branch below
+    x_ser = df_plot[x]
+    y_ser = df_plot[y]
+    x_arr = x_ser.to_numpy()
+    y_arr = y_ser.to_numpy()
+    size_ser = df_plot[size_col] if size_col else None
+    color_ser = df_plot[color_col] if color_col else None
 
     if style_sheet:
-        plt.style.use(style_sheet)
+        plt.style.use(_style_rc(style_sheet))
 
-    fig, ax = plt.subplots(figsize=fig_size)
+    fig, ax, own_fig = _prepare_axes(ax, figsize=fig_size)
     
     # Explicitly disable grid unless requested
     if grid:
@@ -8382,7 +8928,7 @@ def plot_scatter(
 
     # Sizes
     if size_col:
-        raw = df_plot[size_col].astype(float)
+        raw = size_ser.astype(float)
         if size_scale == "log":
             raw = np.log(raw.clip(lower=np.nextafter(0, 1)))
         max_raw = float(raw.max()) if len(raw) else 0.0
@@ -8390,25 +8936,26 @@ def plot_scatter(
     else:
         sizes = np.full(n, max_size)
 
-    # Colors
+    # Colors (numeric values are mapped to RGBA once; groups slice the rows)
     norm_c: Optional[Normalize] = None
+    cmap_obj = _get_cmap(colormap)
     use_colorbar = False
-    if color_col and pd.api.types.is_numeric_dtype(df_plot[color_col]):
-        norm_c = Normalize(vmin=float(df_plot[color_col].min()), vmax=float(df_plot[color_col].max()))
-        color_vals = norm_c(df_plot[color_col].to_numpy(dtype=float))
+    if color_col and pd.api.types.is_numeric_dtype(color_ser):
+        norm_c = Normalize(vmin=float(color_ser.min()), vmax=float(color_ser.max()))
+        color_vals = cmap_obj(norm_c(color_ser.to_numpy(dtype=float)))
         use_colorbar = True
     elif color_col:
-        color_vals = df_plot[color_col]
+        color_vals = color_ser
     else:
         color_vals = None
 
     base_kwargs: Dict[str, Any] = {
         "s": sizes,
-        "cmap": colormap,
         "alpha": alpha,
         "edgecolors": edge_color,
         "linewidths": edge_width,
         "zorder": zorder,
+        "rasterized": rasterize_threshold is not None and n > rasterize_threshold,
     }
     if color_vals is not None:
         base_kwargs["c"] = color_vals
@@ -8420,34 +8967,39 @@ def plot_scatter(
     if marker_col:
         default_markers = ["o", "s", "^", "D", "v", "<", ">", "p", "*", "X"]
         markers = marker_sequence or default_markers
+        # Positions of every marker group in one pass; arrays are indexed per group
+        group_idx = df_plot.groupby(marker_col, sort=False).indices
+        no_rows = np.empty(0, dtype=np.intp)
+        sizes_np = np.asarray(sizes)
+        color_vals_np = np.asarray(color_vals) if color_vals is not None else None
         for i, grp in enumerate(df_plot[marker_col].unique()):
-            mask = df_plot[marker_col] == grp
+            idx = group_idx.get(grp, no_rows)
             kwargs_grp = base_kwargs.copy()
-            if color_vals is not None:
-                kwargs_grp["c"] = np.asarray(color_vals)[mask.to_numpy()]
-            kwargs_grp["s"] = np.asarray(sizes)[mask.to_numpy()]
+            if color_vals_np is not None:
+                kwargs_grp["c"] = color_vals_np[idx]
+            kwargs_grp["s"] = sizes_np[idx]
             m = markers[i % len(markers)]
-            sc = ax.scatter(df_plot.loc[mask, x], df_plot.loc[mask, y], marker=m, **kwargs_grp, **kwargs)
+            sc = ax.scatter(x_arr[idx], y_arr[idx], marker=m, **kwargs_grp, **kwargs)
             scatter_artists.append(sc)
             marker_handles.append((m, grp))
     else:
         kw = dict(kwargs)
         kw.pop("cmap", None)
-        sc = ax.scatter(df_plot[x], df_plot[y], **base_kwargs, **kw)
+        sc = ax.scatter(x_arr, y_arr, **base_kwargs, **kw)
         scatter_artists.append(sc)
 
     # Error bars
     if error_x is not None or error_y is not None:
         xerr = df_plot[error_x] if isinstance(error_x, str) else error_x
         yerr = df_plot[error_y] if isinstance(error_y, str) else error_y
-        ax.errorbar(df_plot[x], df_plot[y], xerr=xerr, yerr=yerr, fmt="none", alpha=alpha * 0.5)
+        ax.errorbar(x_arr, y_arr, xerr=xerr, yerr=yerr, fmt="none", alpha=alpha * 0.5)
 
     # Set axis limits based on data min/max
     if not df_plot.empty:
-        data_xmin = float(df_plot[x].min())
-        data_xmax = float(df_plot[x].max())
-        data_ymin = float(df_plot[y].min())
-        data_ymax = float(df_plot[y].max())
+        data_xmin = float(x_ser.min())
+        data_xmax = float(x_ser.max())
+        data_ymin = float(y_ser.min())
+        data_ymax = float(y_ser.max())
 
         # Add some padding
         if x_scale == "log":
@@ -8485,21 +9037,24 @@ def plot_scatter(
             return [str(int(round(float(v)))) for v in vals]
         return [str(int(v)) if float(v).is_integer() else f"{float(v):.2f}" for v in vals]
 
+    # Size-legend handles (min / median / max), scaled like the plotted markers
+    def _size_legend() -> Tuple[List[Line2D], List[str]]:
+        vals = [float(size_ser.min()), float(size_ser.median()), float(size_ser.max())]
+        sizes_leg = [
+            ((np.log(v) if size_scale == "log" else v) / max_raw) * max_size if max_raw > 0 else max_size
+            for v in vals
+        ]
+        handles = [Line2D([], [], linestyle="", marker="o", markersize=np.sqrt(s), color="black", alpha=alpha)
+                   for s in sizes_leg]
+        return handles, _format_size_labels(vals)
+
     # Legends
     if legend:
         size_flag = size_col is not None
         marker_flag = marker_col is not None
 
         if size_flag and not marker_flag:
-            vals = [float(df_plot[size_col].min()), float(df_plot[size_col].median()), float(df_plot[size_col].max())]
-            base_max = float((np.log(df_plot[size_col]) if size_scale == "log" else df_plot[size_col]).max())
-            sizes_leg = [
-                ((np.log(v) if size_scale == "log" else v) / base_max) * max_size if base_max > 0 else max_size
-                for v in vals
-            ]
-            handles = [Line2D([], [], linestyle="", marker="o", markersize=np.sqrt(s), color="black", alpha=alpha)
-                       for s in sizes_leg]
-            labs = _format_size_labels(vals)
+            handles, labs = _size_legend()
             ax.legend(handles, labs, title=size_col, loc="lower right", frameon=True, edgecolor="black",
                       **(legend_kwargs or {}))
 
@@ -8512,15 +9067,7 @@ def plot_scatter(
 
         else:
             if size_flag:
-                vals = [float(df_plot[size_col].min()), float(df_plot[size_col].median()), float(df_plot[size_col].max())]
-                base_max = float((np.log(df_plot[size_col]) if size_scale == "log" else df_plot[size_col]).max())
-                sizes_leg = [
-                    ((np.log(v) if size_scale == "log" else v) / base_max) * max_size if base_max > 0 else max_size
-                    for v in vals
-                ]
-                handles = [Line2D([], [], linestyle="", marker="o", markersize=np.sqrt(s), color="black", alpha=alpha)
-                           for s in sizes_leg]
-                labs = _format_size_labels(vals)
+                handles, labs = _size_legend()
                 fig.legend(
                     handles, labs, title=size_col, loc="lower center", bbox_to_anchor=(0.25, -0.02),
                     ncol=len(handles), frameon=True, edgecolor="black"
@@ -8536,7 +9083,7 @@ def plot_scatter(
 
     # Colorbar
     if color_col and use_colorbar and norm_c is not None:
-        sm = ScalarMappable(norm=norm_c, cmap=colormap)
+        sm = ScalarMappable(norm=norm_c, cmap=cmap_obj)
         sm.set_array([])
         cbar = fig.colorbar(sm, ax=ax, pad=0.02)
         cbar.set_label(color_col)
@@ -8546,12 +9093,12 @@ def plot_scatter(
     xs = np.linspace(xmin, xmax, 200)
 
     if mean_line:
-        mx, my = float(df_plot[x].mean()), float(df_plot[y].mean())
+        mx, my = float(x_ser.mean()), float(y_ser.mean())
         ax.axvline(mx, linestyle="--", color="gray", zorder=1)
         ax.axhline(my, linestyle="--", color="gray", zorder=1)
 
     if median_line:
-        mdx, mdy = float(df_plot[x].median()), float(df_plot[y].median())
+        mdx, mdy = float(x_ser.median()), float(y_ser.median())
         ax.axvline(mdx, linestyle=":", color="gray", zorder=1)
         ax.axhline(mdy, linestyle=":", color="gray", zorder=1)
 
@@ -8565,7 +9112,7 @@ def plot_scatter(
                 ax.plot(xs, (xs - intercept) / slope, linestyle="--", color="gray", zorder=1)
 
     if mean_marker and mean_line:
-        mx, my = float(df_plot[x].mean()), float(df_plot[y].mean())
+        mx, my = float(x_ser.mean()), float(y_ser.mean())
         ymin, ymax = ax.get_ylim()
         xmin, xmax = ax.get_xlim()
         y_offset = (ymax - ymin) * 0.02
@@ -8580,16 +9127,39 @@ def plot_scatter(
 
     # Highlight points (by mask or index list)
     if highlight_points is not None:
-        hp = df_plot.loc[highlight_points]
-        ax.scatter(hp[x], hp[y], s=kwargs.get("mean_marker_size", 6), color="red", zorder=4)
+        if isinstance(highlight_points, pd.Series) and pd.api.types.is_bool_dtype(highlight_points):
+            # label-aligned mask (e.g. built on df before dropna), aligned as .loc would
+            if highlight_points.index.equals(df_plot.index):
+                hp = highlight_points.to_numpy()
+            else:
+                hp = highlight_points.reindex(df_plot.index, fill_value=False).to_numpy()
+        else:
+            hp = np.asarray(highlight_points)
+        if hp.dtype != bool:
+            # index labels -> positions in df_plot (every match for duplicate labels)
+            labels = hp
+            found = pd.Index(labels).isin(df_plot.index)
+            if not found.all():
+                raise KeyError(f"highlight_points not in the plotted rows: {labels[~found].tolist()}")
+            hp = df_plot.index.get_indexer_for(labels)
+        ax.scatter(x_arr[hp], y_arr[hp], s=kwargs.get("mean_marker_size", 6), color="red", zorder=4)
 
     # Point labels + robust adjustText to prevent overlaps
     if label_col:
-        texts = []
         lfsize = kwargs.get("label_font_size", 6)
-        for _, row in df_plot.iterrows():
-            txt = ax.text(row[x], row[y], str(row[label_col]), fontsize=lfsize, zorder=5)
-            texts.append(txt)
+        label_arr = df_plot[label_col].to_numpy()
+        if max_labels is None or n <= max_labels:
+            label_idx = np.arange(n)
+        elif max_labels <= 0:
+            label_idx = np.empty(0, dtype=np.intp)
+        else:
+            # keep the largest points, in their original order
+            largest = np.argpartition(-np.asarray(sizes, dtype=float), max_labels - 1)[:max_labels]
+            label_idx = np.sort(largest)
+        texts = [
+            ax.text(xi, yi, str(li), fontsize=lfsize, zorder=5)
+            for xi, yi, li in zip(x_arr[label_idx], y_arr[label_idx], label_arr[label_idx])
+        ]
 
         # Sensible, stronger defaults; user may override via adjust_kwargs
         adj_defaults = {
@@ -8603,7 +9173,7 @@ def plot_scatter(
         }
         merged_adjust = {**adj_defaults, **(adjust_kwargs or {})}
 
-        if adjust_text is not None:
+        if adjust_text is not None and texts:
             # Pass plotted scatter artists so labels avoid points, too.
             adjust_text(texts, ax=ax, add_objects=scatter_artists, **merged_adjust)
 
@@ -8629,8 +9199,8 @@ def plot_scatter(
         ax.xaxis.set_major_formatter(formatter)
         ax.yaxis.set_major_formatter(formatter)
     else:
-        xdata_max = float(np.nanmax(df_plot[x].to_numpy())) if len(df_plot) else 0.0
-        ydata_max = float(np.nanmax(df_plot[y].to_numpy())) if len(df_plot) else 0.0
+        xdata_max = float(np.nanmax(x_arr)) if len(df_plot) else 0.0
+        ydata_max = float(np.nanmax(y_arr)) if len(df_plot) else 0.0
 
         def _plain_number(v, pos):
             if not np.isfinite(v) or v == 0:
@@ -8650,19 +9220,17 @@ def plot_scatter(
             ax.yaxis.set_major_formatter(FuncFormatter(_plain_number))
             ax.yaxis.set_minor_formatter(NullFormatter())
 
-    fig.tight_layout()
-    plt.subplots_adjust(bottom=0.18, right=0.85)
+    if own_fig:
+        fig.tight_layout()
+        fig.subplots_adjust(bottom=0.18, right=0.85)
 
     if filename is not None:
-        save_plot(filename)
-
-    if show:
-        plt.show()
-    plt.close(fig)
-
+        save_plot(filename, dpi)
 
-import plotly.graph_objects as go
-from plotly.express.colors import sample_colorscale
+    if own_fig:
+        if show:
+            plt.show()
+        plt.close(fig)
 
 
 def _select_top_binary(df: pd.DataFrame, n: int) -> pd.DataFrame:
@@ -8739,72 +9307,69 @@ def prepare_for_sankey(
     # --- Build node identity with (group_id, label) to avoid collisions --------
     raw_labels: List[str] = []
     group_ids: List[int] = []
-    node_keys: List[Tuple[int, str]] = []
     for gid, df in enumerate(selected_fields):
         cols = list(df.columns)
         raw_labels.extend(cols)
         group_ids.extend([gid] * len(cols))
-        node_keys.extend((gid, c) for c in cols)
-
-    label_to_idx = {key: idx for idx, key in enumerate(node_keys)}
 
     # --- Compute color values per node (vectorized when possible) --------------
     color_values: List[float] = []
     if color_series is not None and len(raw_labels) > 0:
-        # Align index once
+        # Align index once; only rows with a finite color value contribute
         s = color_series.reindex(selected_fields[0].index)
-        s_values = s.to_numpy()
-        s_isfinite = np.isfinite(s_values)
-
-        def _vectorized_mean(field_df: pd.DataFrame) -> np.ndarray:
-            # counts of non-NaN contributing rows
-            counts = field_df.astype("float32").T.dot(s_isfinite.astype("float32"))
-            # sums over non-NaN (replace NaN with 0 so they don't contribute)
-            sums = field_df.astype("float32").T.dot(np.nan_to_num(s_values, nan=0.0).astype("float32"))
-            with np.errstate(invalid="ignore", divide="ignore"):
-                means = sums / counts
-            return means
-
-        can_vectorize = color_func in (np.mean, np.nanmean) or getattr(color_func, "__name__", "") in {"mean", "nanmean"}
-
-        if can_vectorize:
-            for df in selected_fields:
-                means = _vectorized_mean(df)
-                color_values.extend(means.tolist())
-        else:
-            # Safe fallback for arbitrary aggregators
-            for df in selected_fields:
-                for col in df.columns:
-                    mask = df[col].astype(bool).to_numpy()
-                    vals = s_values[mask]
-                    vals = vals[np.isfinite(vals)]
-                    color_values.append(float(color_func(pd.Series(vals))) if vals.size else np.nan)
-
-    # --- Compute links via pairwise column-wise dot-products -------------------
+        s_values = s.to_numpy(dtype=np.float64)
+        valid = np.isfinite(s_values)
+        c_valid = s_values[valid]
+
+        func_name = getattr(color_func, "__name__", "")
+        is_mean = color_func in (np.mean, np.nanmean) or func_name in {"mean", "nanmean"}
+        is_sum = color_func in (np.sum, np.nansum) or func_name in {"sum", "nansum"}
+
+        for df in selected_fields:
+            A = df.to_numpy(dtype=np.float64)[valid]
+            counts = A.sum(axis=0)
+            if is_mean or is_sum:
+                # one matrix-vector product per field
+                sums = A.T @ c_valid
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    agg = sums / counts if is_mean else sums
+                agg = np.where(counts > 0, agg, np.nan)
+            else:
+                # Arbitrary aggregators: one groupby over (row, column) incidences
+                rows, cols = np.nonzero(A)
+                agg = (
+                    pd.Series(c_valid[rows])
+                    .groupby(cols)
+                    .agg(lambda v: float(color_func(v.reset_index(drop=True))))
+                    .reindex(range(A.shape[1]))
+                    .to_numpy(dtype=np.float64)
+                )
+            color_values.extend(agg.tolist())
+
+    # --- Compute links via pairwise sparse co-occurrence products -------------
+    # Node indices follow field order, so a field's first node sits at its offset.
+    offsets = np.concatenate(([0], np.cumsum([df.shape[1] for df in selected_fields])))
+    sparse_fields = [csr_matrix(df.to_numpy(dtype=np.int64)) for df in selected_fields]
+
     link_frames = []
     k = len(selected_fields)
     pairs = itertools.combinations(range(k), 2) if all_pairs else zip(range(k - 1), range(1, k))
     for i, j in pairs:
-        # counts_{i->j}[ci, cj] = co-occurrence count
-        counts = selected_fields[i].T.dot(selected_fields[j])  # shape: (cols_i × cols_j)
-        if isinstance(counts, pd.DataFrame):
-            counts = counts.astype("int64")
-            stacked = counts.stack()
-            if stacked.empty:
-                continue
-            stacked = stacked[stacked > 0]  # drop zero links early
-            if stacked.empty:
-                continue
-            src_labels = stacked.index.get_level_values(0)
-            tgt_labels = stacked.index.get_level_values(1)
-            links = pd.DataFrame(
-                {
-                    "source": [label_to_idx[(i, s)] for s in src_labels],
-                    "target": [label_to_idx[(j, t)] for t in tgt_labels],
-                    "value": stacked.to_numpy(),
-                }
-            )
-            link_frames.append(links)
+        # counts_{i->j}[ci, cj] = co-occurrence count; only nonzero pairs are stored
+        counts = (sparse_fields[i].T @ sparse_fields[j]).tocsr()
+        counts.eliminate_zeros()
+        if counts.nnz == 0:
+            continue
+        counts.sort_indices()  # CSR with sorted indices is already row-major order
+        rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+        links = pd.DataFrame(
+            {
+                "source": offsets[i] + rows,
+                "target": offsets[j] + counts.indices,
+                "value": counts.data,
+            }
+        )
+        link_frames.append(links)
 
     if link_frames:
         links_df = pd.concat(link_frames, ignore_index=True)
@@ -8882,7 +9447,7 @@ def plot_sankey(
             vmin, vmax = float(np.nanmin(vals)), float(np.nanmax(vals))
             norm = (vals - vmin) / (vmax - vmin) if vmax > vmin else np.zeros_like(vals)
             norm = np.where(np.isfinite(norm), norm, 0.5)
-            node["color"] = sample_colorscale(colorscale, norm.tolist())
+            node["color"] = _sample_colorscale(colorscale, norm)
 
     # --- column locking (x/y)
     if group_ids is not None and field_names:
@@ -9134,6 +9699,7 @@ def plot_network(
     label_fontsize_min: float = 7.0,
     label_fontsize_max: float = 18.0,
     label_scale_with_size: bool = True,
+    label_fontsize_bins: "int | None" = 5,  # quantize size-scaled fontsizes; None = continuous
     label_min_fraction: float = 0.0,
     label_top_k: "int | None" = None,
     adjust_labels: bool = True,
@@ -9165,6 +9731,8 @@ def plot_network(
         * Continuous colorbar otherwise.
     - Node sizes come from `size_attr`, with optional clamp and transform ("log"/"sqrt"/callable).
       Labels can be filtered via `label_min_fraction` and/or `label_top_k`.
+    - Size-scaled label fontsizes are snapped to `label_fontsize_bins` levels between
+      `label_fontsize_min` and `label_fontsize_max` (pass None for continuous sizes).
     - Returns `(fig, ax, pos)`. Saves to `<filename>.<export_format>` if `filename` is provided.
 
     Notes:
@@ -9208,22 +9776,17 @@ def plot_network(
             return default
 
     def _normalize_edge_widths(w, lo=min_edge_width, hi=max_edge_width, pct=edge_width_percentiles):
-        if len(w) == 0:
-            return []
         w = np.asarray(w, dtype=float)
-        if pct is not None and len(w) > 1:
+        if w.size == 0:
+            return w
+        if pct is not None and w.size > 1:
             p_lo, p_hi = np.clip(np.asarray(pct, dtype=float), 0, 100)
             a, b = np.percentile(w, [p_lo, p_hi])
         else:
             a, b = float(np.min(w)), float(np.max(w))
         if not np.isfinite(a) or not np.isfinite(b) or a == b:
-            return [0.5 * (lo + hi)] * len(w)
-        ww = (w - a) / (b - a)
-        return list(lo + ww * (hi - lo))
-
-    def _blend_rgba(c1, c2):
-        a, b = mcolors.to_rgba(c1), mcolors.to_rgba(c2)
-        return tuple((x + y) * 0.5 for x, y in zip(a, b))
+            return np.full(w.size, 0.5 * (lo + hi))
+        return lo + (w - a) * ((hi - lo) / (b - a))
 
     def _call_safe(func, **k):
         sig = inspect.signature(func)
@@ -9257,9 +9820,11 @@ def plot_network(
 
     # -------------------- largest component --------------------
     if largest_component and G.number_of_nodes() > 0:
-        comps = list(nx.weakly_connected_components(G) if G.is_directed() else nx.connected_components(G))
-        if comps:
-            G = G.subgraph(max(comps, key=len)).copy()
+        comps = nx.weakly_connected_components(G) if G.is_directed() else nx.connected_components(G)
+        comp = max(comps, key=len)
+        # already connected -> keep G as is (no subgraph copy)
+        if len(comp) < G.number_of_nodes():
+            G = G.subgraph(comp).copy()
 
     # -------------------- layout --------------------
     if pos is None:
@@ -9271,9 +9836,11 @@ def plot_network(
             "circular": nx.circular_layout,
             "kamada_kawai": nx.kamada_kawai_layout,
             "shell": nx.shell_layout,
+            "lbfgs_fr": _lbfgs_fr_layout,
         }
-        layout_fn = layouts.get(layout, nx.spring_layout)
-        pos = layout_fn(G, **layout_kwargs)
+        layout_fn = layouts.get(_fallback_layout_name(G, layout), nx.spring_layout)
+        # not every layout takes `seed` (e.g. kamada_kawai, shell)
+        pos = _call_safe(layout_fn, G=G, **layout_kwargs)
 
     nodes = list(G.nodes())
     if not nodes:
@@ -9285,7 +9852,7 @@ def plot_network(
         if not show_frame:
             ax.axis("off")
         if tight_layout:
-            plt.tight_layout()
+            fig.tight_layout()
         if filename:
             fig.savefig(f"{filename}.{export_format}", dpi=dpi, bbox_inches="tight", transparent=transparent)
         return fig, ax, {}
@@ -9300,7 +9867,9 @@ def plot_network(
         ax.axis("off")
 
     # -------------------- node colors --------------------
-    node_colors = {}
+    # one RGBA row per node, aligned with `nodes`
+    node_idx = {n: i for i, n in enumerate(nodes)}
+    node_rgba = np.empty((len(nodes), 4), dtype=float)
     colorbar_mappable = None
     legend_handles = None
     legend_title = None
@@ -9314,12 +9883,11 @@ def plot_network(
             comms.setdefault(cid, []).append(n)
         # palette
         base = "tab20" if (len(comms) > 10 and cmap_name_discrete == "tab10") else cmap_name_discrete
-        cmap = cm.get_cmap(base, max(len(comms), 1))
+        cmap = _get_cmap(base, max(len(comms), 1))
         handles = []
         for i, (cid, members) in enumerate(sorted(comms.items(), key=lambda x: x[0])):
             col = cmap(i)
-            for n in members:
-                node_colors[n] = col
+            node_rgba[[node_idx[n] for n in members]] = col
             # use custom labels if provided (manual); else raw id
             lab = (cluster_labels or {}).get(cid, str(cid))
             handles.append(
@@ -9333,20 +9901,20 @@ def plot_network(
     # (B) color_attr set → discrete vs continuous
     else:
         if color_attr:
-            raw_vals = [G.nodes[n].get(color_attr, None) for n in nodes]
+            raw_vals = [v for _, v in G.nodes(data=color_attr, default=None)]
             present = [v for v in raw_vals if v is not None]
             is_disc, cats = _is_discrete(present, max_cat_legend)
 
             if is_disc:
                 base = "tab20" if (len(cats) > 10 and cmap_name_discrete == "tab10") else cmap_name_discrete
-                cmap = cm.get_cmap(base, max(len(cats), 1))
+                cmap = _get_cmap(base, max(len(cats), 1))
                 cat2col = {c: cmap(i) for i, c in enumerate(cats)}
-                for n, v in zip(nodes, raw_vals):
-                    if v is None:
-                        node_colors[n] = missing_color
-                    else:
-                        key = str(v) if isinstance(v, str) else int(round(float(v)))
-                        node_colors[n] = cat2col.get(key, missing_color)
+                missing_rgba = mcolors.to_rgba(missing_color)
+                node_rgba[:] = [
+                    missing_rgba if v is None
+                    else cat2col.get(str(v) if isinstance(v, str) else int(round(float(v))), missing_rgba)
+                    for v in raw_vals
+                ]
                 legend_handles = [
                     Line2D([0], [0], marker="o", linestyle="", markersize=9,
                            markerfacecolor=cat2col[c], markeredgecolor=node_outline_color,
@@ -9355,42 +9923,45 @@ def plot_network(
                 ]
                 legend_title = str(color_attr)
             else:
-                # continuous mapping
-                clean = []
-                for v in raw_vals:
+                # continuous mapping (missing / non-numeric values become NaN)
+                clean = np.full(len(nodes), np.nan)
+                for i, v in enumerate(raw_vals):
                     try:
-                        clean.append(float(v) if v is not None else None)
+                        clean[i] = float(v) if v is not None else np.nan
                     except Exception:
-                        clean.append(None)
-                vals = np.array([x for x in clean if x is not None], dtype=float)
+                        pass
+                vals = clean[~np.isnan(clean)]
                 _vmin = vmin if vmin is not None else (float(np.min(vals)) if len(vals) else 0.0)
                 _vmax = vmax if vmax is not None else (float(np.max(vals)) if len(vals) else 1.0)
                 if _vmin == _vmax:
                     _vmin, _vmax = _vmin - 0.5, _vmax + 0.5
                 norm = mcolors.Normalize(vmin=_vmin, vmax=_vmax)
-                cmap = cm.get_cmap(cmap_name_continuous)
+                cmap = _get_cmap(cmap_name_continuous)
                 sm = cm.ScalarMappable(cmap=cmap, norm=norm)
                 sm.set_array([])
                 colorbar_mappable = sm
-                for n, v in zip(nodes, clean):
-                    node_colors[n] = (cmap(norm(v)) if v is not None else missing_color)
+                # one colormap call for all nodes
+                node_rgba[:] = cmap(norm(clean))
+                node_rgba[np.isnan(clean)] = mcolors.to_rgba(missing_color)
         else:
-            for n in nodes:
-                node_colors[n] = default_node_color
+            node_rgba[:] = mcolors.to_rgba(default_node_color)
 
     # -------------------- node sizes --------------------
-    raw_sizes = np.array(
-        [
-            _safe_numeric(G.nodes[n].get(size_attr, default_node_size), default_node_size) if size_attr else default_node_size
-            for n in nodes
-        ],
-        dtype=float,
-    )
+    if size_attr:
+        raw_sizes = np.fromiter(
+            (_safe_numeric(v, default_node_size) for _, v in G.nodes(data=size_attr, default=default_node_size)),
+            dtype=float,
+            count=len(nodes),
+        )
+    else:
+        raw_sizes = np.full(len(nodes), float(default_node_size))
     # clamp
-    if size_vmin is not None:
-        raw_sizes = np.maximum(raw_sizes, float(size_vmin))
-    if size_vmax is not None:
-        raw_sizes = np.minimum(raw_sizes, float(size_vmax))
+    if size_vmin is not None or size_vmax is not None:
+        raw_sizes = np.clip(
+            raw_sizes,
+            None if size_vmin is None else float(size_vmin),
+            None if size_vmax is None else float(size_vmax),
+        )
 
     # transform
     def _apply_size_transform(arr: "np.ndarray") -> "np.ndarray":
@@ -9398,7 +9969,7 @@ def plot_network(
         if tr is None and log_scale:
             tr = "log"
         if callable(tr):
-            out = np.array([max(tr(float(x)), 0.0) for x in arr], dtype=float)
+            out = np.maximum(np.fromiter((tr(float(x)) for x in arr), dtype=float, count=arr.size), 0.0)
         elif tr == "log":
             out = np.log1p(np.maximum(arr, 0.0))
         elif tr == "sqrt":
@@ -9409,56 +9980,63 @@ def plot_network(
 
     svals = _apply_size_transform(raw_sizes)
     if fix_max_size:
-        smax = float(np.max(svals)) if len(svals) else 1.0
-        denom = max(smax, 1e-12)
-        sizes = (svals / denom) * size_scale
+        smax = float(svals.max()) if svals.size else 1.0
+        sizes = (svals / max(smax, 1e-12)) * size_scale
     else:
         sizes = svals * size_scale
-    sizes = sizes.tolist()
 
     # -------------------- edges --------------------
     def _edge_weight(u, v, d):
         return _safe_numeric(d.get("weight", edge_width), edge_width)
 
-    edges_raw = [(u, v, _edge_weight(u, v, d)) for u, v, d in G.edges(data=True) if u != v]
-
-    # min weight filter
-    if edge_min_weight is not None:
-        edges_raw = [(u, v, w) for (u, v, w) in edges_raw if w >= edge_min_weight]
+    edgelist = [(u, v) for u, v in G.edges() if u != v]
+    w_all = np.fromiter(
+        (_edge_weight(u, v, d) for u, v, d in G.edges(data=True) if u != v),
+        dtype=float,
+        count=len(edgelist),
+    )
 
-    # keep fraction
+    # min weight filter + keep fraction, as one boolean mask over the weights
     if not (0.0 < edge_keep_fraction <= 1.0):
         raise ValueError("edge_keep_fraction must be in (0, 1].")
-    if edges_raw and edge_keep_fraction < 1.0:
-        weights_sorted = sorted([w for _, _, w in edges_raw])
-        k = max(1, int(round(len(weights_sorted) * edge_keep_fraction)))
-        thresh = weights_sorted[-k]
-        edges_raw = [(u, v, w) for (u, v, w) in edges_raw if w >= thresh]
-
-    edgelist = [(u, v) for (u, v, _) in edges_raw]
-    w_all = [w for _, _, w in edges_raw]
+    keep = np.ones(w_all.size, dtype=bool)
+    if edge_min_weight is not None:
+        keep &= w_all >= edge_min_weight
+    if keep.any() and edge_keep_fraction < 1.0:
+        kept_w = w_all[keep]
+        k = max(1, int(round(kept_w.size * edge_keep_fraction)))
+        thresh = np.partition(kept_w, kept_w.size - k)[kept_w.size - k]
+        keep &= w_all >= thresh
+    if not keep.all():
+        edgelist = [e for e, flag in zip(edgelist, keep) if flag]
+        w_all = w_all[keep]
+
     edge_widths = _normalize_edge_widths(w_all)
 
     # edge colors
     if edge_color_by:
-        # continuous mapping on edges
-        vals = []
-        for u, v in edgelist:
-            d = G[u][v]
-            val = d.get(edge_color_by, d.get("weight", None))
-            vals.append(_safe_numeric(val, None))
-        _vals = np.array([v for v in vals if v is not None], dtype=float)
+        # continuous mapping on edges (missing values become NaN)
+        evals = np.fromiter(
+            (_safe_numeric(G[u][v].get(edge_color_by, G[u][v].get("weight", None)), np.nan) for u, v in edgelist),
+            dtype=float,
+            count=len(edgelist),
+        )
+        _vals = evals[~np.isnan(evals)]
         _emin = edge_vmin if edge_vmin is not None else (float(np.min(_vals)) if len(_vals) else 0.0)
         _emax = edge_vmax if edge_vmax is not None else (float(np.max(_vals)) if len(_vals) else 1.0)
         if _emin == _emax:
             _emin, _emax = _emin - 0.5, _emax + 0.5
         enorm = mcolors.Normalize(vmin=_emin, vmax=_emax)
-        ecmap = cm.get_cmap(edge_cmap_name)
-        edge_colors = [ecmap(enorm(v)) if v is not None else (0, 0, 0, edge_alpha) for v in vals]
-    else:
+        ecmap = _get_cmap(edge_cmap_name)
+        edge_colors = ecmap(enorm(evals)).reshape(-1, 4)
+        edge_colors[np.isnan(evals)] = (0, 0, 0, edge_alpha)
+    elif edgelist:
         # blend incident node colors
-        edge_colors = [_blend_rgba(node_colors.get(u, default_node_color), node_colors.get(v, default_node_color))
-                       for (u, v) in edgelist]
+        u_idx = np.fromiter((node_idx[u] for u, _ in edgelist), dtype=np.intp, count=len(edgelist))
+        v_idx = np.fromiter((node_idx[v] for _, v in edgelist), dtype=np.intp, count=len(edgelist))
+        edge_colors = (node_rgba[u_idx] + node_rgba[v_idx]) * 0.5
+    else:
+        edge_colors = []
 
     # -------------------- draw edges --------------------
     _arrows = G.is_directed() if arrows is None else bool(arrows)
@@ -9468,8 +10046,8 @@ def plot_network(
         G=G,
         pos=pos,
         edgelist=edgelist,
-        edge_color=edge_colors or None,
-        width=edge_widths or edge_width,
+        edge_color=edge_colors if len(edge_colors) else None,
+        width=edge_widths if edge_widths.size else edge_width,
         alpha=edge_alpha,
         ax=ax,
         arrows=_arrows,
@@ -9486,7 +10064,7 @@ def plot_network(
         pos=pos,
         nodelist=nodes,
         node_shape=node_shape,
-        node_color=[node_colors[n] for n in nodes],
+        node_color=node_rgba,
         node_size=sizes,
         alpha=node_alpha,
         linewidths=node_outline_width,
@@ -9498,47 +10076,50 @@ def plot_network(
     # -------------------- labels --------------------
     # label text source
     if label_attr:
-        raw_labels = [G.nodes[n].get(label_attr, str(n)) for n in nodes]
+        _missing = object()
+        raw_labels = [str(n) if v is _missing else v for n, v in G.nodes(data=label_attr, default=_missing)]
     else:
         raw_labels = [str(n) for n in nodes]
     # optional formatting
     if label_formatter:
-        raw_labels = [label_formatter(lbl, n, G.nodes[n]) for lbl, n in zip(raw_labels, nodes)]
+        raw_labels = [label_formatter(lbl, n, d) for lbl, (n, d) in zip(raw_labels, G.nodes(data=True))]
 
     # visibility mask
     import numpy as _np  # avoid shadowing earlier np in closures
     show_mask = _np.ones(len(nodes), dtype=bool)
-    if label_min_fraction > 0.0 and len(sizes) > 0:
-        smax = max(sizes)
-        thr = label_min_fraction * smax
-        show_mask &= (_np.asarray(sizes) >= thr)
-    if label_top_k is not None and label_top_k >= 0 and len(sizes) > 0:
-        order = _np.argsort(-_np.asarray(sizes))
-        keep_idx = set(order[: int(label_top_k)])
-        show_mask &= _np.array([i in keep_idx for i in range(len(nodes))], dtype=bool)
+    if label_min_fraction > 0.0 and sizes.size > 0:
+        thr = label_min_fraction * sizes.max()
+        show_mask &= sizes >= thr
+    if label_top_k is not None and label_top_k >= 0 and sizes.size > 0:
+        order = _np.argsort(-sizes)
+        keep = _np.zeros(len(nodes), dtype=bool)
+        keep[order[: int(label_top_k)]] = True
+        show_mask &= keep
 
     texts = []
     if _np.any(show_mask):
-        s_arr = _np.asarray(sizes)
-        s_min, s_max = (float(_np.min(s_arr)), float(_np.max(s_arr))) if len(s_arr) else (1.0, 1.0)
+        pos_arr = _np.array([pos[n] for n in nodes], dtype=float).reshape(-1, 2)
+        s_min, s_max = (float(sizes.min()), float(sizes.max())) if sizes.size else (1.0, 1.0)
         eps = 1e-9
-        for i, n in enumerate(nodes):
-            if not show_mask[i]:
-                continue
-            x, y = pos[n]
-            if label_scale_with_size and s_max > s_min + eps:
-                fs = label_fontsize_min + ((s_arr[i] - s_min) / (s_max - s_min)) * (label_fontsize_max - label_fontsize_min)
-            else:
-                fs = label_fontsize
-            # pick text color
-            tcolor = "black"
-            if auto_label_contrast:
-                rgba = mcolors.to_rgba(node_colors.get(n, default_node_color))
-                r, g, b = rgba[:3]
-                luminance = 0.299 * r + 0.587 * g + 0.114 * b
-                tcolor = "black" if luminance > 0.6 else "white"
-            t = ax.text(x, y, raw_labels[i], fontsize=fs, ha="center", va="center", color=tcolor)
-            t.set_path_effects([pe.withStroke(linewidth=label_halo_width, foreground=label_halo_color)])
+        # fontsizes for all nodes at once, optionally snapped to a few levels
+        if label_scale_with_size and s_max > s_min + eps:
+            frac = (sizes - s_min) / (s_max - s_min)
+            if label_fontsize_bins is not None and label_fontsize_bins >= 2:
+                steps = label_fontsize_bins - 1
+                frac = _np.round(frac * steps) / steps
+            font_sizes = label_fontsize_min + frac * (label_fontsize_max - label_fontsize_min)
+        else:
+            font_sizes = _np.full(len(nodes), float(label_fontsize))
+        # text colors
+        if auto_label_contrast:
+            luminance = node_rgba[:, :3] @ _np.array([0.299, 0.587, 0.114])
+            text_colors = _np.where(luminance > 0.6, "black", "white")
+        else:
+            text_colors = _np.full(len(nodes), "black")
+        halo = [pe.withStroke(linewidth=label_halo_width, foreground=label_halo_color)]
+        for i in _np.flatnonzero(show_mask):
+            t = ax.text(pos_arr[i, 0], pos_arr[i, 1], raw_labels[i], fontsize=font_sizes[i],
+                        ha="center", va="center", color=text_colors[i], path_effects=halo)
             texts.append(t)
 
     if adjust_labels and texts and _HAS_ADJUST_TEXT:
@@ -9569,7 +10150,7 @@ def plot_network(
     # -------------------- finalize --------------------
     ax.set_aspect("equal")
     if tight_layout:
-        plt.tight_layout()
+        fig.tight_layout()
     if filename:
         fig.savefig(f"{filename}.{export_format}", dpi=dpi, bbox_inches="tight", transparent=transparent)
 
@@ -9652,7 +10233,9 @@ def plot_citation_network(
     edge_width : float, default=0.5
         Width of network edges.
     layout : str, default='kamada_kawai'
-        Layout algorithm for node positions. Options: 'kamada_kawai', 'spring', 'circular'.
+        Layout algorithm for node positions. Options: 'kamada_kawai', 'spring', 'circular',
+        'lbfgs_fr' (sparse Fruchterman-Reingold, suited to graphs of a few thousand nodes;
+        minimised with L-BFGS on NetworkX >= 3.5, plain spring layout otherwise).
     highlight_main_path : bool, default=False
         If True, highlights the main citation path in the network.
     main_path : list[str], optional
@@ -9671,26 +10254,22 @@ def plot_citation_network(
     -------
     None
     """
-    if layout == 'kamada_kawai':
-        pos = nx.kamada_kawai_layout(G)
-    elif layout == 'spring':
-        pos = nx.spring_layout(G)
-    elif layout == 'circular':
-        pos = nx.circular_layout(G)
-    else:
+    if layout not in ('kamada_kawai', 'spring', 'circular', 'lbfgs_fr'):
         raise ValueError(f'Unknown layout: {layout}')
+    pos = _cached_layout(G, layout)
 
     if not isinstance(size_dict, dict):
         size_dict = None
     if size_dict is None:
-        size_dict = dict(G.in_degree())
+        size_dict = dict(zip(G, _in_degree_array(G)))
 
-    node_sizes = [size_dict.get(node, 1) * node_size_factor for node in G.nodes()]
+    n_nodes = G.number_of_nodes()
+    node_sizes = np.fromiter((size_dict.get(node, 1) for node in G), dtype=float, count=n_nodes) * node_size_factor
     if sqrt_sizes:
-        node_sizes = [np.sqrt(s) for s in node_sizes]
+        node_sizes = np.sqrt(node_sizes)
 
     if color_dict is not None:
-        node_colors = [color_dict.get(node, 0.5) for node in G.nodes()]
+        node_colors = np.fromiter((color_dict.get(node, 0.5) for node in G), dtype=float, count=n_nodes)
     else:
         node_colors = 'lightblue'
 
@@ -9773,7 +10352,8 @@ def plot_main_path(
     font_size : int, default=10
         Font size for node labels.
     layout : str, default="kamada_kawai"
-        Layout algorithm to position nodes. Options include: "kamada_kawai", "spring", "circular", "shell".
+        Layout algorithm to position nodes. Options include: "kamada_kawai", "spring", "circular", "shell",
+        "lbfgs_fr" (L-BFGS Fruchterman-Reingold on NetworkX >= 3.5, plain spring layout otherwise).
     filename : str, optional
         Base filename (without extension) to save the plot. If None, the plot is shown interactively.
 
@@ -9791,17 +10371,23 @@ def plot_main_path(
         "spring": nx.spring_layout,
         "kamada_kawai": nx.kamada_kawai_layout,
         "circular": nx.circular_layout,
-        "shell": nx.shell_layout
+        "shell": nx.shell_layout,
+        "lbfgs_fr": _lbfgs_fr_layout,
     }
-    pos = layout_funcs.get(layout, nx.kamada_kawai_layout)(subG)
+    layout_fn = layout_funcs.get(_fallback_layout_name(subG, layout), nx.kamada_kawai_layout)
+    # subG is rebuilt on every call, so cache on the full graph and the path
+    pos = _cached_layout(G, f"main_path:{layout_fn.__name__}", lambda: layout_fn(subG), key=tuple(path))
 
-    sizes = ([size_dict.get(n, 300) for n in subG.nodes()] if size_dict else
-             [300 + 200 * G.in_degree(n) for n in subG.nodes()])
+    n_path = subG.number_of_nodes()
+    if size_dict:
+        sizes = np.fromiter((size_dict.get(n, 300) for n in subG), dtype=float, count=n_path)
+    else:
+        sizes = 300 + 200 * np.fromiter((d for _, d in G.in_degree(subG.nodes())), dtype=float, count=n_path)
 
     if color_dict:
-        vals = [color_dict.get(n, 0) for n in subG.nodes()]
-        norm = plt.Normalize(vmin=min(vals), vmax=max(vals))
-        colors = [cmap(norm(v)) for v in vals]
+        vals = np.fromiter((color_dict.get(n, 0) for n in subG), dtype=float, count=n_path)
+        norm = plt.Normalize(vmin=vals.min(), vmax=vals.max())
+        colors = cmap(norm(vals))
         numeric = True
     else:
         colors = "orange"
@@ -9846,11 +10432,14 @@ def layout_historiograph(G):
         if year is not None:
             year_nodes[year].append(node)
 
+    # One batched draw; same stream order as drawing per node
+    jitters = np.random.uniform(-0.5, 0.5, size=sum(map(len, year_nodes.values())))
     pos = {}
+    k = 0
     for year, nodes in year_nodes.items():
-        for i, node in enumerate(sorted(nodes)):
-            jitter = np.random.uniform(-0.5, 0.5)
-            pos[node] = (year, jitter)
+        for node in sorted(nodes):
+            pos[node] = (year, jitters[k])
+            k += 1
 
     return pos
 
@@ -9866,38 +10455,65 @@ def plot_historiograph(
     max_year=None,
     save_as=None,
     dpi=600,
+    max_labels=100,
 ):
-    """Draw the historiograph using matplotlib, excluding isolated nodes, loops, and applying filters."""
-    plt.figure(figsize=figsize)
+    """
+    Draw the historiograph using matplotlib, excluding isolated nodes, loops, and applying filters.
 
-    def node_passes_filters(n, d):
-        if min_year and d.get("year") < min_year:
-            return False
-        if max_year and d.get("year") > max_year:
-            return False
-        if min_citations and d.get("Cited by", 0) < min_citations:
-            return False
-        if min_indegree and G.in_degree(n) < min_indegree:
-            return False
-        return True
+    Only the ``max_labels`` largest nodes (by ``size_attr``, else by degree) get a
+    title label; pass None to label every node.
+    """
+    plt.figure(figsize=figsize)
 
-    filtered_nodes = [n for n, d in G.nodes(data=True) if node_passes_filters(n, d)]
-    filtered_graph = G.subgraph(filtered_nodes).copy()
-    filtered_graph.remove_edges_from(nx.selfloop_edges(filtered_graph))
-    connected_nodes = [n for n in filtered_graph.nodes if filtered_graph.degree(n) > 0]
-    subgraph = filtered_graph.subgraph(connected_nodes).copy()
+    def _numeric_attr(attr, default=None):
+        vals = pd.Series([v for _, v in G.nodes(data=attr, default=default)], dtype=object)
+        return pd.to_numeric(vals, errors="coerce").to_numpy(dtype=float)
+
+    # Node filters as array masks; nodes without a year fail the year filters
+    node_list = list(G.nodes)
+    keep = np.ones(len(node_list), dtype=bool)
+    if min_year or max_year:
+        years = _numeric_attr("year")
+        if min_year:
+            keep &= np.nan_to_num(years, nan=-np.inf) >= min_year
+        if max_year:
+            keep &= np.nan_to_num(years, nan=np.inf) <= max_year
+    if min_citations:
+        keep &= np.nan_to_num(_numeric_attr("Cited by", 0), nan=0.0) >= min_citations
+    if min_indegree:
+        keep &= _in_degree_array(G) >= min_indegree
+
+    filtered_nodes = [n for n, k in zip(node_list, keep) if k]
+    # Find the nodes that keep an edge other than a self-loop on a view, then copy once
+    filtered_view = G.subgraph(filtered_nodes)
+    connected_nodes = [
+        n for n in filtered_view
+        if filtered_view.degree(n) > 2 * filtered_view.number_of_edges(n, n)
+    ]
+    subgraph = G.subgraph(connected_nodes).copy()
+    subgraph.remove_edges_from(list(nx.selfloop_edges(subgraph)))
 
     if size_attr:
         sizes = [subgraph.nodes[n].get(size_attr, 3) * 10 for n in subgraph.nodes]
     else:
         sizes = [300 for _ in subgraph.nodes]
 
-    sub_pos = {k: v for k, v in pos.items() if k in subgraph.nodes}
+    # One (N, 2) array in subgraph order instead of filtering the whole layout dict
+    nodes = list(subgraph)
+    pos_arr = np.array([pos[n] for n in nodes], dtype=float).reshape(-1, 2)
+    sub_pos = dict(zip(nodes, pos_arr))
 
     nx.draw(subgraph, sub_pos, with_labels=False, arrows=True, node_size=sizes, node_color="lightblue")
 
     labels = {k: v for k, v in nx.get_node_attributes(subgraph, "title").items()}
-    texts = [plt.text(sub_pos[n][0], sub_pos[n][1], labels[n], fontsize=8, ha="center", va="center") for n in labels]
+    if max_labels is not None and len(labels) > max_labels:
+        if size_attr:
+            scores = [subgraph.nodes[n].get(size_attr, 3) for n in labels]
+        else:
+            scores = [subgraph.degree(n) for n in labels]
+        mask = _top_label_mask(scores, max_labels)
+        labels = {n: t for (n, t), k in zip(labels.items(), mask) if k}
+    texts = [plt.text(*sub_pos[n], labels[n], fontsize=8, ha="center", va="center") for n in labels]
     adjust_text(texts, arrowprops=dict(arrowstyle="->", color='gray', lw=0.5))
 
     plt.title("Historiograph")
@@ -9927,23 +10543,26 @@ def plot_country_collab_network(matrix_df, threshold=1, figsize=(12, 12), layout
         print("Empty matrix: network not generated.")
         return
 
+    # Symmetric matrix: read the upper triangle once (diagonal excluded)
+    arr = matrix_df.to_numpy()
+    labels = matrix_df.index.to_numpy()
+    iu, ju = np.triu_indices(arr.shape[0], k=1)
+    weights = arr[iu, ju]
+    keep = weights >= threshold
     G = nx.Graph()
-    for i in matrix_df.index:
-        for j in matrix_df.columns:
-            weight = matrix_df.loc[i, j]
-            if i != j and weight >= threshold:
-                G.add_edge(i, j, weight=weight)
+    G.add_weighted_edges_from(zip(labels[iu[keep]], labels[ju[keep]], weights[keep]))
+
+    if len(G.nodes) == 0:
+        print("No edges above threshold: network not generated.")
+        return
 
     layout = {
         "spring": nx.spring_layout,
         "kamada_kawai": nx.kamada_kawai_layout,
         "circular": nx.circular_layout,
-        "shell": nx.shell_layout
-    }[layout_func]
-
-    if len(G.nodes) == 0:
-        print("No edges above threshold: network not generated.")
-        return
+        "shell": nx.shell_layout,
+        "lbfgs_fr": _lbfgs_fr_layout,
+    }[_fallback_layout_name(G, layout_func)]
 
     pos = layout(G)
     edge_weights = [G[u][v]["weight"] for u, v in G.edges()]
@@ -9981,7 +10600,13 @@ def plot_country_collab_heatmap(matrix_df, top_n=50, figsize=(12, 10), cmap="Blu
 
     # Compute total collaborations and select top N countries
     totals = matrix_df.sum(axis=1) + matrix_df.sum(axis=0)
-    top_countries = totals.sort_values(ascending=False).head(top_n).index
+    vals = totals.to_numpy(dtype=float)
+    if top_n < len(vals):
+        # partial selection of the top N, then sort only those (ties keep matrix order)
+        top = np.sort(np.argpartition(-vals, top_n - 1)[:top_n])
+    else:
+        top = np.arange(len(vals))
+    top_countries = totals.index[top[np.argsort(-vals[top], kind="stable")]]
     matrix_top = matrix_df.loc[top_countries, top_countries]
 
     plt.figure(figsize=figsize)
@@ -10017,11 +10642,20 @@ def save_sankey(diagram, filename_base, formats=("png", "svg", "pdf", "html")):
     formats : tuple of str, optional
         File formats to save (png, svg, pdf, html).
     """
-    for ext in formats:
-        path = f"{filename_base}.{ext}"
-        if ext == "html":
-            diagram.write_html(path)
-        else:
+    image_paths = [f"{filename_base}.{ext}" for ext in formats if ext != "html"]
+    if "html" in formats:
+        diagram.write_html(f"{filename_base}.html")
+    if not image_paths:
+        return
+    # Plotly >= 6.1 exports several images with a single Kaleido session
+    try:
+        from plotly.io import write_images
+    except ImportError:
+        write_images = None
+    if write_images is not None:
+        write_images([diagram] * len(image_paths), image_paths)
+    else:
+        for path in image_paths:
             diagram.write_image(path)
 
 
@@ -10084,9 +10718,6 @@ def plot_bipartite_sankey(
     plotly.graph_objects.Figure
         The Sankey diagram figure.
     """
-    import plotly.graph_objects as go
-    from plotly.colors import sample_colorscale
-    
     # Extract links from contingency matrix
     links = []
     for row_idx, row_name in enumerate(contingency_matrix.index):
@@ -10136,7 +10767,7 @@ def plot_bipartite_sankey(
         normalized = [0.5] * len(values)
     
     # Sample colors from colorscale
-    link_colors = sample_colorscale(colorscale, normalized)
+    link_colors = _sample_colorscale(colorscale, normalized)
     # Add transparency
     link_colors = [c.replace('rgb', 'rgba').replace(')', ', 0.6)') if 'rgb' in c else c 
                    for c in link_colors]
@@ -10246,7 +10877,9 @@ def plot_thematic_map(
     save_plot_base=None,
     dpi=600,
     ax=None,
-    item_sep="\n"
+    item_sep="\n",
+    degree_centrality=None,
+    max_labels=100,
 ):
     """
     Plot thematic map of clusters with axis labels, no tick values,
@@ -10287,6 +10920,11 @@ def plot_thematic_map(
         Existing axis to plot onto. If None, a new figure and axis are created.
     item_sep : str, optional
         Separator string between item labels.
+    degree_centrality : dict, optional
+        Precomputed ``nx.degree_centrality(G)``, e.g. shared with other plots of
+        the same graph; computed here if None.
+    max_labels : int or None, optional
+        Annotate at most this many clusters (the largest); None annotates all.
 
     Returns
     -------
@@ -10295,32 +10933,39 @@ def plot_thematic_map(
     if ax is None:
         fig, ax = plt.subplots(figsize=figsize)
     key = partition_attr if partition_attr.startswith("partition_") else f"partition_{partition_attr}"
-    metrics = utilsbib.compute_cluster_metrics(G, key)
+    deg_c = nx.degree_centrality(G) if degree_centrality is None else degree_centrality
+    metrics = utilsbib.compute_cluster_metrics(G, key, degree_centrality=deg_c)
     cids = [c for c in metrics if metrics[c]["size"] >= min_cluster_size]
     if max_clusters and len(cids) > max_clusters:
         cids = sorted(cids, key=lambda c: metrics[c]["size"], reverse=True)[:max_clusters]
 
     densities = [metrics[c]["density"] for c in cids]
     centrals = [metrics[c]["avg_degree_centrality"] for c in cids]
-    sizes_raw = [metrics[c]["size"] for c in cids]
-    max_raw = max(sizes_raw) if sizes_raw else 1
-    sizes = [(s / max_raw) * max_dot_size for s in sizes_raw]
+    sizes_raw = np.array([metrics[c]["size"] for c in cids], dtype=float)
+    max_raw = sizes_raw.max() if sizes_raw.size else 1
+    sizes = sizes_raw / max_raw * max_dot_size
 
     if color_df is not None and color_col is not None:
-        df_col = color_df.set_index(key)
-        vals = [df_col.loc[c, color_col] if c in df_col.index else 0 for c in cids]
-        norm = colors.Normalize(vmin=min(vals), vmax=max(vals))
-        cmap = cm.get_cmap(cmap_name)
-        colors_list = [cmap(norm(v)) for v in vals]
+        col_vals = color_df.set_index(key)[color_col]
+        # repeated cluster keys: the first row wins (reindex needs unique labels)
+        col_vals = col_vals[~col_vals.index.duplicated(keep="first")]
+        vals = col_vals.reindex(cids).fillna(0).to_numpy(dtype=float)
+        norm = colors.Normalize(vmin=vals.min(), vmax=vals.max())
+        colors_list = _get_cmap(cmap_name)(norm(vals))
     else:
         colors_list = ["lightgrey"] * len(cids)
 
-    deg_c = nx.degree_centrality(G)
+    # cluster id -> member nodes, in a single pass over G
+    members = defaultdict(list)
+    for n, c in G.nodes(data=key):
+        members[c].append(n)
     text_objs = []
+    label_mask = _top_label_mask(sizes_raw, max_labels)
     for i, cid in enumerate(cids):
         ax.scatter(densities[i], centrals[i], s=sizes[i], color=colors_list[i], alpha=0.7)
-        nodes = [n for n, d in G.nodes(data=True) if d.get(key) == cid]
-        top_nodes = sorted(nodes, key=lambda n: deg_c.get(n, 0), reverse=True)[:items_per_cluster]
+        if not label_mask[i]:
+            continue
+        top_nodes = sorted(members.get(cid, []), key=deg_c.__getitem__, reverse=True)[:items_per_cluster]
         labels = [str(n) for n in top_nodes]
         if include_cluster_label:
             labels.insert(0, str(cid))
@@ -10420,14 +11065,18 @@ def plot_thematic_evolution(
     if n == 1:
         axes = [axes]
 
+    # degree centrality once per graph, shared by the maps and the Sankey labels
+    degc_list = [nx.degree_centrality(G) for G in graphs]
+
     # plot thematic maps without titles
-    for ax, G in zip(axes, graphs):
+    for ax, G, deg_c in zip(axes, graphs, degc_list):
         plot_thematic_map(
             G,
             partition_attr,
             quadrant_labels=None,
             ax=ax,
             item_sep=item_sep,
+            degree_centrality=deg_c,
             **map_kwargs
         )
 
@@ -10440,17 +11089,18 @@ def plot_thematic_evolution(
             fig_maps.savefig(path, bbox_inches="tight")
 
     # prepare Sankey data with top_k labels
+    key = partition_attr if partition_attr.startswith("partition_") else f"partition_{partition_attr}"
     clusters_list = []
-    degc_list = []
+    node_cids = []  # per time point: node -> cluster id
     for G in graphs:
-        key = partition_attr if partition_attr.startswith("partition_") else f"partition_{partition_attr}"
+        node_to_cid = dict(G.nodes(data=key))
         clust = {}
-        deg_c = nx.degree_centrality(G)
-        for node, d in G.nodes(data=True):
-            cid = d.get(key)
+        for node, cid in node_to_cid.items():
             clust.setdefault(cid, set()).add(node)
         clusters_list.append(clust)
-        degc_list.append(deg_c)
+        node_cids.append(node_to_cid)
+    # per time point: cluster id -> position in insertion order (Sankey node order)
+    cid_pos = [{cid: i for i, cid in enumerate(clust)} for clust in clusters_list]
 
     node_labels = []
     offsets = []
@@ -10463,17 +11113,19 @@ def plot_thematic_evolution(
             node_labels.append(label)
         cum += len(clust)
 
+    # links: count (cluster at t, cluster at t+1) pairs over the shared nodes
     sources, targets, values = [], [], []
     for t in range(n - 1):
-        src_cids = list(clusters_list[t].keys())
-        tgt_cids = list(clusters_list[t + 1].keys())
-        for i, src in enumerate(src_cids):
-            for j, tgt in enumerate(tgt_cids):
-                val = len(clusters_list[t][src] & clusters_list[t + 1][tgt])
-                if val > 0:
-                    sources.append(offsets[t] + i)
-                    targets.append(offsets[t + 1] + j)
-                    values.append(val)
+        src_pos, tgt_pos = cid_pos[t], cid_pos[t + 1]
+        node_to_src, node_to_tgt = node_cids[t], node_cids[t + 1]
+        cross = Counter(
+            (src_pos[node_to_src[node]], tgt_pos[node_to_tgt[node]])
+            for node in node_to_src.keys() & node_to_tgt.keys()
+        )
+        for (i, j), val in sorted(cross.items()):
+            sources.append(offsets[t] + i)
+            targets.append(offsets[t + 1] + j)
+            values.append(val)
 
     sankey_node = dict(label=node_labels)
     sankey_link = dict(source=sources, target=targets, value=values)
@@ -10506,6 +11158,7 @@ def plot_correspondence_analysis(
     title: str = "Correspondence Analysis with Frequencies",
     abbreviate_labels: bool = False,
     abbreviate_kwargs: dict | None = None,
+    rasterize_threshold: int | None = 5000,
 ):
     """
     Plot 2D correspondence analysis with optional scaling by frequency, 
@@ -10545,27 +11198,41 @@ def plot_correspondence_analysis(
         If True, applies `abbreviate_words` to row and column labels.
     abbreviate_kwargs : dict, optional
         Extra keyword arguments passed to `abbreviate_words`.
+    rasterize_threshold : int or None, default=5000
+        With more row plus column points than this, the markers are rasterized
+        (at ``dpi``) in SVG/PDF exports. None never rasterizes.
     """
     fig, ax = plt.subplots(figsize=figsize)
+    rasterize = rasterize_threshold is not None and len(row_coords) + len(col_coords) > rasterize_threshold
     ax.grid(False)
     ax.set_facecolor("white")
 
-    row_freq = df_relation.sum(axis=1)
-    col_freq = df_relation.sum(axis=0)
+    if use_size:
+        # Both margins from one ndarray; align each to the coordinates with one indexer
+        arr = df_relation.to_numpy(dtype=float)
+        row_freq, col_freq = arr.sum(axis=1), arr.sum(axis=0)
 
-    row_sizes = (row_freq.loc[row_coords.index] / row_freq.max() * size_scale) if use_size else size_scale
-    col_sizes = (col_freq.loc[col_coords.index] / col_freq.max() * size_scale) if use_size else size_scale
+        def _aligned(freq, labels, coords):
+            idx = labels.get_indexer(coords.index)
+            if (idx < 0).any():
+                raise KeyError(f"{list(coords.index[idx < 0])} not in df_relation")
+            return freq[idx] / freq.max() * size_scale
+
+        row_sizes = _aligned(row_freq, df_relation.index, row_coords)
+        col_sizes = _aligned(col_freq, df_relation.columns, col_coords)
+    else:
+        row_sizes = col_sizes = size_scale
 
     # Plot rows
     ax.scatter(
         row_coords.iloc[:, 0], row_coords.iloc[:, 1],
-        c="tab:blue", s=row_sizes, alpha=alpha, label=row_label_name
+        c="tab:blue", s=row_sizes, alpha=alpha, label=row_label_name, rasterized=rasterize
     )
 
     # Plot columns
     ax.scatter(
         col_coords.iloc[:, 0], col_coords.iloc[:, 1],
-        c="tab:red", s=col_sizes, alpha=alpha, marker="^", label=col_label_name
+        c="tab:red", s=col_sizes, alpha=alpha, marker="^", label=col_label_name, rasterized=rasterize
     )
 
     # Annotate
@@ -10650,6 +11317,20 @@ def plot_residual_heatmap(
 
     plt.show()
 
+@lru_cache(maxsize=128)
+def _bipartite_legend_handles(row_label_name, col_label_name):
+    """
+    Return the (cached) proxy legend handles for the bipartite plot's two node types.
+
+    Safe to share between figures: ``ax.legend`` copies the handle properties into
+    its own artists and never adds the proxies to an axes.
+    """
+    return (
+        Line2D([0], [0], marker="o", color="w", label=row_label_name, markerfacecolor="tab:blue", markersize=8),
+        Line2D([0], [0], marker="s", color="w", label=col_label_name, markerfacecolor="tab:red", markersize=8),
+    )
+
+
 def plot_bipartite_network(
     B: nx.Graph,
     row_nodes: list,
@@ -10665,7 +11346,10 @@ def plot_bipartite_network(
     filename_base: str = None,
     dpi: int = 600,
     row_label_name: str = "Rows",
-    col_label_name: str = "Columns"
+    col_label_name: str = "Columns",
+    max_labels: Optional[int] = 100,
+    rasterize_threshold: Optional[int] = 5000,
+    label_cell_px: float = 30.0
 ):
     """
     Visualize a bipartite network with label adjustment, thresholding, and edge weight rendering.
@@ -10686,15 +11370,21 @@ def plot_bipartite_network(
         dpi (int): DPI for saved files.
         row_label_name (str): Legend label for row nodes.
         col_label_name (str): Legend label for column nodes.
-    """
-
-    # Filter edges
-    edges_to_plot = [
-        (u, v) for u, v, d in B.edges(data=True)
-        if d.get("weight", 1) >= weight_threshold
-    ]
-    filtered_nodes = set(u for u, v in edges_to_plot) | set(v for u, v in edges_to_plot)
-    B_sub = B.subgraph(filtered_nodes).copy()
+        max_labels (int or None): Label at most this many nodes (highest degree); None labels all.
+        rasterize_threshold (int or None): With more nodes plus edges than this, nodes and edges
+            are rasterized (at ``dpi``) in SVG/PDF exports; None never rasterizes.
+        label_cell_px (float): Labels are decluttered on a grid of cells this many display
+            pixels wide; higher-degree nodes win a cell, the rest shift right or are dropped.
+    """
+
+    # Filter edges in one pass, keeping their weights for the widths below
+    edges_to_plot, edge_weights = [], []
+    for u, v, w in B.edges(data="weight", default=1):
+        if w >= weight_threshold:
+            edges_to_plot.append((u, v))
+            edge_weights.append(w)
+    # Read-only view induced by the kept edges' endpoints; no attribute copies
+    B_sub = B.subgraph({node for edge in edges_to_plot for node in edge})
 
     pos = nx.spring_layout(B_sub, seed=42, k=0.15)
     degrees = dict(B_sub.degree())
@@ -10702,49 +11392,71 @@ def plot_bipartite_network(
     row_sizes = [node_size_scale if same_size else degrees[n] * node_size_scale for n in row_nodes if n in B_sub]
     col_sizes = [node_size_scale if same_size else degrees[n] * node_size_scale for n in col_nodes if n in B_sub]
 
-    fig, ax = plt.subplots(figsize=figsize)
+    # Constrained layout is solved once at draw time instead of a tight_layout pass
+    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    rasterize = (rasterize_threshold is not None
+                 and B_sub.number_of_nodes() + len(edges_to_plot) > rasterize_threshold)
 
     # Nodes
-    nx.draw_networkx_nodes(B_sub, pos, nodelist=[n for n in row_nodes if n in B_sub],
-                           node_color="tab:blue", node_size=row_sizes, alpha=0.8, label=row_label_name)
-    nx.draw_networkx_nodes(B_sub, pos, nodelist=[n for n in col_nodes if n in B_sub],
-                           node_color="tab:red", node_shape="s", node_size=col_sizes, alpha=0.8, label=col_label_name)
+    row_coll = nx.draw_networkx_nodes(B_sub, pos, nodelist=[n for n in row_nodes if n in B_sub],
+                                      node_color="tab:blue", node_size=row_sizes, alpha=0.8, label=row_label_name)
+    col_coll = nx.draw_networkx_nodes(B_sub, pos, nodelist=[n for n in col_nodes if n in B_sub],
+                                      node_color="tab:red", node_shape="s", node_size=col_sizes, alpha=0.8,
+                                      label=col_label_name)
 
     # Edge weights
-    edge_weights = [B_sub[u][v].get("weight", 1) for u, v in edges_to_plot]
     if show_edge_weights:
-        scaled_widths = [w * edge_width_scale for w in edge_weights]
+        scaled_widths = np.fromiter(edge_weights, dtype=float, count=len(edge_weights)) * edge_width_scale
     else:
-        scaled_widths = 1
+        scaled_widths = 1.0
 
-    nx.draw_networkx_edges(B_sub, pos, edgelist=edges_to_plot, width=scaled_widths, alpha=edge_alpha, edge_color="gray")
-
-    # Node labels
-    texts = [ax.text(pos[n][0], pos[n][1], n, fontsize=8) for n in B_sub.nodes]
-    adjust_text(texts, ax=ax, arrowprops=dict(arrowstyle="-", color="gray", lw=0.5))
+    # arrows=False keeps a single LineCollection even for directed inputs,
+    # instead of one FancyArrowPatch per edge
+    edge_coll = nx.draw_networkx_edges(B_sub, pos, edgelist=edges_to_plot, width=scaled_widths,
+                                       alpha=edge_alpha, edge_color="gray", arrows=False)
+    if rasterize:
+        for artist in (row_coll, col_coll, edge_coll):
+            artist.set_rasterized(True)
 
     # Legend
-    handles = [
-        plt.Line2D([0], [0], marker="o", color="w", label=row_label_name, markerfacecolor="tab:blue", markersize=8),
-        plt.Line2D([0], [0], marker="s", color="w", label=col_label_name, markerfacecolor="tab:red", markersize=8)
-    ]
-    ax.legend(handles=handles, fontsize=8)
+    ax.legend(handles=_bipartite_legend_handles(row_label_name, col_label_name), fontsize=8)
 
     ax.set_axis_off()
     if title:
         ax.set_title(title)
-    plt.tight_layout()
+
+    # Node labels, highest degree first, decluttered on a coarse pixel grid; placed
+    # last so the grid matches the final (constrained) layout
+    nodes = list(B_sub)
+    deg_arr = np.array([degrees[n] for n in nodes], dtype=float)
+    label_idx = np.flatnonzero(_top_label_mask(deg_arr, max_labels))
+    label_idx = label_idx[np.argsort(-deg_arr[label_idx], kind="stable")]
+    pos_arr = np.array([pos[n] for n in nodes], dtype=float).reshape(-1, 2)
+    _grid_declutter_texts(ax, pos_arr[label_idx], [nodes[i] for i in label_idx],
+                          cell_px=label_cell_px, fontsize=8)
 
     if filename_base:
         save_plot(filename_base, dpi=dpi)
 
     plt.show()
     
+def _centered_norm(vmin: float, vmax: float, center: float | None) -> Normalize:
+    """
+    Colour norm for signed metrics: diverging around ``center`` when it lies
+    strictly inside ``(vmin, vmax)``, otherwise linear with a non-empty range.
+    """
+    if center is not None and vmin < center < vmax:
+        return TwoSlopeNorm(vmin=vmin, vcenter=center, vmax=vmax)
+    if center is not None and vmin == vmax == center:
+        return Normalize(vmin=vmin - 1.0, vmax=vmax + 1.0)
+    return Normalize(vmin=vmin, vmax=vmax if vmax > vmin else vmin + 1.0)
+
+
 def plot_top_n_pairs(
     sorted_pairs_df,
     *,
     metric_column: str = "Residual",
-    top_n: int = 20,
+    top_n: int | None = 20,                # None: all pairs
     size_column: str | None = "observed",  # Column for bubble sizes (e.g., "observed" for intersection count)
     size_scale: float = 100.0,             # Scale factor for bubble sizes
     min_size: float = 50.0,                # Minimum bubble size
@@ -10763,6 +11475,9 @@ def plot_top_n_pairs(
     order: str = "freq",                   # "freq" (default), "alpha", "custom"
     row_order: list[str] | None = None,    # used when order="custom"
     col_order: list[str] | None = None,    # used when order="custom"
+    rasterize_threshold: int | None = 5000,  # rasterize bubbles in SVG/PDF above this many
+    backend: str = "matplotlib",           # "matplotlib" | "datashader"
+    raster_size: tuple[int, int] = (800, 600),  # max (width, height) in cells for "datashader"
 ):
     """
     Plot top-N row/column pairs as a bubble chart.
@@ -10781,6 +11496,20 @@ def plot_top_n_pairs(
     - order="custom": respect `row_order` / `col_order`; missing labels are ignored and the
       remaining used labels are appended alphabetically.
 
+    With more than `rasterize_threshold` bubbles (None: never), the scatter layer is
+    rasterized at `dpi` in vector exports; guides, text and colorbar stay vector.
+
+    Backends
+    --------
+    - backend="matplotlib": one bubble per pair.
+    - backend="datashader": pairs are aggregated with ``datashader`` into the mean of
+      `metric_column` per cell (at most one cell per row/column label, capped at
+      `raster_size`) and drawn as a single image; bubble sizes are not shown. Meant
+      for `top_n=None` (all pairs) on very large tables. Requires ``datashader``.
+
+    With the datashader backend, or when an axis has more labels than `raster_size`
+    allows on it, that axis labels only an evenly spaced subset of its categories.
+
     Returns
     -------
     (fig, ax)
@@ -10795,8 +11524,12 @@ def plot_top_n_pairs(
         raise ValueError("order must be \"freq\", \"alpha\", or \"custom\".")
     if sign not in {"both", "positive", "negative"}:
         raise ValueError("sign must be \"both\", \"positive\", or \"negative\".")
+    if backend not in {"matplotlib", "datashader"}:
+        raise ValueError("backend must be \"matplotlib\" or \"datashader\".")
 
-    df = sorted_pairs_df.copy()
+    # Work on the columns used below only; wide association tables carry many more
+    needed = ["Row", "Column", metric_column, size_column, "Count"]
+    df = sorted_pairs_df[[c for c in dict.fromkeys(needed) if c in sorted_pairs_df.columns]]
 
     # Filter by sign
     if sign == "positive":
@@ -10806,9 +11539,17 @@ def plot_top_n_pairs(
     if df.empty:
         raise ValueError("No data to plot after applying sign filter.")
 
-    # Rank by |metric| and take top_n
-    df["abs_metric"] = df[metric_column].abs()
-    df_top = df.sort_values("abs_metric", ascending=False, kind="mergesort").head(top_n)
+    # Rank by |metric| and take top_n with a partial selection (ties keep input
+    # order, as the stable sort did; NaN metrics only fill up a short selection)
+    abs_metric = df[metric_column].abs()
+    abs_pos = abs_metric.reset_index(drop=True)
+    is_nan = abs_pos.isna()
+    if top_n is None:
+        top_n = len(abs_pos)
+    top_pos = abs_pos[~is_nan].nlargest(top_n).index
+    if len(top_pos) < top_n:
+        top_pos = top_pos.append(abs_pos.index[is_nan][: top_n - len(top_pos)])
+    df_top = df.iloc[top_pos]
     if df_top.empty:
         raise ValueError("No rows in top-N selection. Check inputs.")
 
@@ -10824,7 +11565,7 @@ def plot_top_n_pairs(
         if "Count" in df.columns and df["Count"].notna().any():
             totals = df.groupby(axis_col)["Count"].sum().sort_values(ascending=False)
         else:
-            totals = df.groupby(axis_col)["abs_metric"].sum().sort_values(ascending=False)
+            totals = abs_metric.groupby(df[axis_col]).sum().sort_values(ascending=False)
         order_all = list(totals.index.astype(str))
         used_set = set(used_labels)
         return [lab for lab in order_all if lab in used_set]
@@ -10832,7 +11573,8 @@ def plot_top_n_pairs(
     def _custom_axis(provided: list[str] | None, used_labels: list[str]) -> list[str]:
         if provided is None:
             return _alpha(used_labels)
-        provided = [str(x) for x in provided]
+        # duplicates would be repeated categories below
+        provided = list(dict.fromkeys(str(x) for x in provided))
         used_set = set(used_labels)
         ordered = [lab for lab in provided if lab in used_set]
         leftovers = [lab for lab in used_labels if lab not in set(ordered)]
@@ -10849,14 +11591,15 @@ def plot_top_n_pairs(
         row_labels = _custom_axis(row_order, used_rows)
         col_labels = _custom_axis(col_order, used_cols)
 
-    # Map to grid
-    x_pos = {label: i for i, label in enumerate(row_labels)}
-    y_pos = {label: i for i, label in enumerate(col_labels)}
-    df_top = df_top[df_top["Row"].astype(str).isin(row_labels) & df_top["Column"].astype(str).isin(col_labels)].copy()
-    if df_top.empty:
+    # Map to grid: categorical codes give each label's axis position (-1 if unused)
+    x_codes = pd.Categorical(df_top["Row"].astype(str), categories=row_labels).codes
+    y_codes = pd.Categorical(df_top["Column"].astype(str), categories=col_labels).codes
+    on_grid = (x_codes >= 0) & (y_codes >= 0)
+    if not on_grid.any():
         raise ValueError("No top-N pairs remain after applying axis label orders.")
-    df_top["x"] = df_top["Row"].astype(str).map(x_pos)
-    df_top["y"] = df_top["Column"].astype(str).map(y_pos)
+    if not on_grid.all():
+        df_top = df_top[on_grid]
+        x_codes, y_codes = x_codes[on_grid], y_codes[on_grid]
 
     # Calculate bubble sizes - proportional to size_column if available
     if size_column and size_column in df_top.columns:
@@ -10876,34 +11619,54 @@ def plot_top_n_pairs(
     vmin, vmax = float(v.min()), float(v.max())
     if color_map is None:
         color_map = "coolwarm"
-    if center_color is not None and vmin < center_color < vmax:
-        norm = TwoSlopeNorm(vmin=vmin, vcenter=center_color, vmax=vmax)
-    elif center_color is not None and vmin == vmax == center_color:
-        norm = Normalize(vmin=vmin - 1.0, vmax=vmax + 1.0)
-    else:
-        norm = Normalize(vmin=vmin, vmax=vmax if vmax > vmin else vmin + 1.0)
+    # Named maps come from the cache; the registry would hand out a fresh copy per call
+    cmap = _get_cmap(color_map)
+    # The norm depends on this call's data and is mutated by the colorbar, so it is
+    # built fresh rather than cached
+    norm = _centered_norm(vmin, vmax, center_color)
 
-    # Plot
-    fig, ax = plt.subplots(figsize=figsize)
+    # Plot; constrained layout also makes room for the colorbar at draw time
+    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
     
     # Remove any grid styling that might come from global styles (seaborn, etc.)
     ax.set_facecolor("white")
     ax.grid(False)
     
-    sc = ax.scatter(
-        df_top["x"].values,
-        df_top["y"].values,
-        s=sizes,
-        c=v.values,
-        cmap=color_map,
-        norm=norm,
-        edgecolors="none",
-    )
+    if backend == "datashader":
+        try:
+            canvas_cls = ds.Canvas
+        except ImportError as exc:
+            raise ImportError("backend=\"datashader\" requires the 'datashader' package.") from exc
+        # Mean metric per cell; never finer than one cell per label
+        n_x, n_y = len(row_labels), len(col_labels)
+        cvs = canvas_cls(plot_width=min(n_x, raster_size[0]), plot_height=min(n_y, raster_size[1]),
+                         x_range=(-0.5, n_x - 0.5), y_range=(-0.5, n_y - 0.5))
+        points = pd.DataFrame({"x": x_codes.astype(float), "y": y_codes.astype(float),
+                               "v": v.to_numpy()})
+        agg = cvs.points(points, "x", "y", ds.mean("v"))
+        sc = ax.imshow(np.asarray(agg, dtype=float), cmap=cmap, norm=norm, origin="lower",
+                       extent=(-0.5, n_x - 0.5, -0.5, n_y - 0.5), aspect="auto",
+                       interpolation="nearest")
+    else:
+        sc = ax.scatter(
+            x_codes,
+            y_codes,
+            s=sizes,
+            c=v.values,
+            cmap=cmap,
+            norm=norm,
+            edgecolors="none",
+            rasterized=rasterize_threshold is not None and len(x_codes) > rasterize_threshold,
+        )
 
-    ax.set_xticks(np.arange(len(row_labels)))
-    ax.set_xticklabels(row_labels, rotation=45, ha="right")
-    ax.set_yticks(np.arange(len(col_labels)))
-    ax.set_yticklabels(col_labels)
+    # One tick per label, unless there are more labels than raster cells (or the
+    # raster backend is used): then only a readable subset is labelled
+    thin = backend == "datashader"
+    _label_category_axis(ax.xaxis, row_labels, thin or len(row_labels) > raster_size[0])
+    _label_category_axis(ax.yaxis, col_labels, thin or len(col_labels) > raster_size[1])
+    ax.tick_params(axis="x", labelrotation=45)
+    for lab in ax.get_xticklabels():
+        lab.set_horizontalalignment("right")
     ax.invert_yaxis()
     
     # Disable all grid lines
@@ -10916,10 +11679,11 @@ def plot_top_n_pairs(
         spine.set_linewidth(0.5)
 
     if show_guides:
-        for xi in range(len(row_labels)):
-            ax.axvline(x=xi, lw=0.5, color="0.9", zorder=0)
-        for yi in range(len(col_labels)):
-            ax.axhline(y=yi, lw=0.5, color="0.9", zorder=0)
+        # One LineCollection per direction, spanning the axes like axvline/axhline
+        ax.vlines(np.arange(len(row_labels)), 0, 1, transform=ax.get_xaxis_transform(),
+                  lw=0.5, color="0.9", zorder=0)
+        ax.hlines(np.arange(len(col_labels)), 0, 1, transform=ax.get_yaxis_transform(),
+                  lw=0.5, color="0.9", zorder=0)
 
     ax.set_xlabel(x_label)
     ax.set_ylabel(y_label)
@@ -10932,7 +11696,6 @@ def plot_top_n_pairs(
 
     ax.set_xlim(-0.5, len(row_labels) - 0.5)
     ax.set_ylim(len(col_labels) - 0.5, -0.5)
-    fig.tight_layout()
 
     if filename_base:
         dirn = os.path.dirname(filename_base)
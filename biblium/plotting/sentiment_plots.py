@@ -11,13 +11,14 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import importlib.util
 from typing import Dict, Optional, Any, Tuple
 
-try:
-    import seaborn as sns
-    HAS_SEABORN = True
-except ImportError:
-    HAS_SEABORN = False
+from biblium.lazy import LazyModule
+
+# Imported on first use (only for despine), so importing this module stays cheap
+HAS_SEABORN = importlib.util.find_spec("seaborn") is not None
+sns = LazyModule("seaborn")
 
 # Default color following Biblium convention
 DEFAULT_COLOR = "lightblue"
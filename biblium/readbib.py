@@ -11,20 +11,51 @@ import json
 import os
 import re
 import time
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 import requests
 
 fd = os.path.dirname(__file__)
 # REFACTORED: Used os.path.join
-df0 = pd.read_excel(os.path.join(fd, "additional files", "variable names.xlsx"), sheet_name="names")
+_VARIABLE_NAMES_PATH = os.path.join(fd, "additional files", "variable names.xlsx")
+
+
+@lru_cache(maxsize=1)
+def _get_df0() -> pd.DataFrame:
+    """Load the 'names' sheet of the variable-name table on first use."""
+    return pd.read_excel(_VARIABLE_NAMES_PATH, sheet_name="names")
+
+
+@lru_cache(maxsize=None)
+def _get_name_mapping(key_column: str) -> Dict[Any, Any]:
+    """
+    Column-rename dict from ``key_column`` values to the 'name' column of df0.
+
+    Built once per mapping column; passing the dict to ``DataFrame.rename``
+    leaves unmapped columns unchanged, like the create_name_mapper function.
+    """
+    df0 = _get_df0()
+    return dict(zip(df0[key_column], df0["name"]))
+
+
+def __getattr__(name: str) -> Any:
+    # df0 used to be read at import time; keep it available as a lazy attribute
+    if name == "df0":
+        return _get_df0()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 """Helpers for reading Web of Science (WoS) exports in various formats (Excel, text, BibTeX)."""
 # WOS
 
 # Regular expression to detect WoS tag lines in the .txt export
 _TAG_LINE_RE = re.compile(r'^([A-Z0-9]{2,3})\s+(.*)$')
+# read_wos_txt applies the same rule with slices and set lookups, which is
+# much cheaper per line than a regex match. The file is read in text mode:
+# exports carry UTF-8 author names, and decoding per value from a bytes
+# stream is slower than letting the text layer decode whole lines.
+_TAG_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
 
 def create_name_mapper(
     df: pd.DataFrame,
@@ -40,6 +71,8 @@ def create_name_mapper(
     Returns:
         Callable[[Any], Any]: A function that takes a value (from key_column) and returns the corresponding
                               'name' value from the same row, or the original value if not found.
+                              The underlying dict is available as its ``mapping`` attribute; pass
+                              that to ``DataFrame.rename`` to avoid a Python call per label.
     """
     # Build mapping from key_column values to name values
     mapping = dict(zip(df[key_column], df["name"]))
@@ -58,6 +91,7 @@ def create_name_mapper(
         """
         return mapping.get(value, value)
 
+    mapper.mapping = mapping
     return mapper
 
 """Helpers for reading OpenAlex CSV exports and mapping columns using a shared variable-name table."""
@@ -93,7 +127,7 @@ def read_oa_csv(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     for c in df.columns:
@@ -146,7 +180,7 @@ def read_oa_xlsx(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     # Attempt to convert numeric columns
@@ -1054,22 +1088,130 @@ def read_wos_xls(
         DataFrame with raw WoS columns, no all-NA columns,
         potentially with renamed columns.
     """
-    # Load the Excel file (auto-detect engine)
+    # Load the Excel file (auto-detect engine). For .xlsx, pandas' openpyxl
+    # engine already opens the workbook with read_only=True/data_only=True and
+    # streams rows, so a hand-rolled openpyxl loop would not lower peak memory
+    # while giving up pandas' NA, header and number-to-string handling.
     df = pd.read_excel(filepath, dtype=str)
     # Drop any columns that are entirely missing
     df.dropna(axis=1, how='all', inplace=True)
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
 
+def _records_to_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a DataFrame from parsed records (dicts of field -> value).
+
+    Columns are filled by index in one pass, in first-seen order with NaN for
+    absent fields, like ``pd.DataFrame(records)`` but without aligning every
+    record dict against the full column set.
+    """
+    n = len(records)
+    nan = float("nan")
+    columns: Dict[str, List[Any]] = {}
+    for i, record in enumerate(records):
+        for field, value in record.items():
+            column = columns.get(field)
+            if column is None:
+                column = columns[field] = [nan] * n
+            column[i] = value
+    return pd.DataFrame(columns)
+
+def _records_to_frames(
+    records: Iterable[Dict[str, Any]],
+    chunksize: Optional[int],
+    mapping_column: Optional[str],
+):
+    """
+    Turn a stream of parsed records into one renamed DataFrame, or, when
+    ``chunksize`` is given, an iterator of DataFrames of ``chunksize`` records.
+
+    Every column holds at least one parsed value, so none is all-NA.
+    """
+    mapper = _get_name_mapping(mapping_column) if mapping_column is not None else None
+
+    def to_frame(chunk):
+        df = _records_to_frame(chunk)
+        if mapper is not None:
+            df.rename(columns=mapper, inplace=True)
+        return df
+
+    if chunksize is None:
+        return to_frame(list(records))
+    if isinstance(chunksize, bool) or not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer or None, got {chunksize!r}")
+
+    def chunks():
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunksize:
+                yield to_frame(chunk)
+                chunk = []
+        if chunk:
+            yield to_frame(chunk)
+
+    return chunks()
+
+def _iter_wos_txt_records(filepath: str) -> Iterator[Dict[str, str]]:
+    """Yield one {tag: value} dict per record of a WoS plain-text export."""
+    tag_chars = _TAG_CHARS
+    with open(filepath, encoding='utf-8') as f:
+        # Skip first two metadata lines
+        next(f, None)
+        next(f, None)
+        record = {}
+        # Multi-line values (e.g. CR with hundreds of cited references) collect
+        # their parts here and are joined once per record, instead of being
+        # re-concatenated on every continuation line
+        parts = {}
+        last_tag = None
+        for line in f:
+            line = line.rstrip('\n')
+            # Blank line indicates end of record
+            if not line or line.isspace():
+                if record:
+                    for t, p in parts.items():
+                        record[t] = ' '.join(p)
+                    yield record
+                    record = {}
+                    parts = {}
+                last_tag = None
+                continue
+            # Tag lines, as _TAG_LINE_RE: 2-3 tag characters, then whitespace
+            tag = None
+            if len(line) > 2 and line[0] in tag_chars and line[1] in tag_chars:
+                if line[2].isspace():
+                    tag = line[:2]
+                elif len(line) > 3 and line[2] in tag_chars and line[3].isspace():
+                    tag = line[:3]
+            if tag is not None:
+                record[tag] = line[len(tag):].lstrip()
+                parts.pop(tag, None)
+                last_tag = tag
+            else:
+                # Continuation of previous tag
+                if last_tag and last_tag in record:
+                    p = parts.get(last_tag)
+                    if p is None:
+                        p = parts[last_tag] = [record[last_tag]]
+                    p.append(line.strip())
+        # Yield last record if present
+        if record:
+            for t, p in parts.items():
+                record[t] = ' '.join(p)
+            yield record
+
 def read_wos_txt(
     filepath: str,
     mapping_column: str = 'wos-abb',
-) -> pd.DataFrame:
+    chunksize: Optional[int] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Read a Web of Science plain-text export (.txt) and return a DataFrame
     with raw field tags as columns, parsing records separated by blank lines,
@@ -1084,56 +1226,46 @@ def read_wos_txt(
         Column name in df0 to use for mapping column names. If provided,
         a mapper is constructed via create_name_mapper(df0, mapping_column)
         and applied to rename columns.
+    chunksize : int, optional
+        If given, stream the file and return an iterator of DataFrames with
+        up to ``chunksize`` records each instead of one DataFrame, so exports
+        larger than memory can be processed piecewise. Each chunk only has
+        the columns present in its own records.
 
     Returns
     -------
-    pd.DataFrame
+    pd.DataFrame or Iterator[pd.DataFrame]
         DataFrame with raw WoS tags as columns, no all-NA columns,
-        potentially with renamed columns.
+        potentially with renamed columns; an iterator of such DataFrames
+        when ``chunksize`` is given.
     """
-    records = []
+    return _records_to_frames(_iter_wos_txt_records(filepath), chunksize, mapping_column)
+
+def _iter_wos_bib_records(filepath: str) -> Iterator[Dict[str, str]]:
+    """Yield one {field: value} dict per entry of a WoS BibTeX export."""
+    entry = {}
     with open(filepath, encoding='utf-8') as f:
-        # Skip first two metadata lines
-        next(f, None)
-        next(f, None)
-        record = {}
-        last_tag = None
         for line in f:
-            line = line.rstrip('\n')
-            # Blank line indicates end of record
-            if not line.strip():
-                if record:
-                    records.append(record)
-                    record = {}
-                last_tag = None
+            line = line.strip()
+            # New entry on '@'
+            if line[:1] == '@':
+                if entry:
+                    yield entry
+                entry = {}
                 continue
-            # Match tag lines
-            m = _TAG_LINE_RE.match(line)
-            if m:
-                tag, val = m.groups()
-                record[tag] = val
-                last_tag = tag
-            else:
-                # Continuation of previous tag
-                if last_tag and last_tag in record:
-                    record[last_tag] += ' ' + line.strip()
-        # Append last record if present
-        if record:
-            records.append(record)
-    df = pd.DataFrame(records)
-    df.dropna(axis=1, how='all', inplace=True)
-
-    # Apply column mapping if requested
-    if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
-        df.rename(columns=mapper, inplace=True)
-
-    return df
+            # One scan finds the first '=' and splits on it
+            key, sep, rest = line.partition('=')
+            if sep:
+                entry[key.strip().lower()] = rest.strip().rstrip(',').strip('{}').strip()
+    # Yield last entry
+    if entry:
+        yield entry
 
 def read_wos_bib(
     filepath: str,
     mapping_column: str = 'wos-bib',
-) -> pd.DataFrame:
+    chunksize: Optional[int] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Read a Web of Science BibTeX export (.bib) and return a DataFrame
     with raw BibTeX fields as columns, all-NA columns dropped,
@@ -1147,40 +1279,19 @@ def read_wos_bib(
         Column name in df0 to use for mapping column names. If provided,
         a mapper is constructed via create_name_mapper(df0, mapping_column)
         and applied to rename columns.
+    chunksize : int, optional
+        If given, stream the file and return an iterator of DataFrames with
+        up to ``chunksize`` entries each instead of one DataFrame. Each chunk
+        only has the columns present in its own entries.
 
     Returns
     -------
-    pd.DataFrame
+    pd.DataFrame or Iterator[pd.DataFrame]
         DataFrame with raw BibTeX fields as columns, no all-NA columns,
-        potentially with renamed columns.
+        potentially with renamed columns; an iterator of such DataFrames
+        when ``chunksize`` is given.
     """
-    records = []
-    entry = {}
-    with open(filepath, encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            # New entry on '@'
-            if line.startswith('@'):
-                if entry:
-                    records.append(entry)
-                entry = {}
-            elif '=' in line:
-                key, rest = line.split('=', 1)
-                key = key.strip().lower()
-                val = rest.strip().rstrip(',').strip('{}').strip()
-                entry[key] = val
-    # Append last entry
-    if entry:
-        records.append(entry)
-    df = pd.DataFrame(records)
-    df.dropna(axis=1, how='all', inplace=True)
-
-    # Apply column mapping if requested
-    if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
-        df.rename(columns=mapper, inplace=True)
-
-    return df
+    return _records_to_frames(_iter_wos_bib_records(filepath), chunksize, mapping_column)
 
 """Helpers for reading PubMed/MEDLINE exports in text format."""
 # PUBMED
@@ -1258,12 +1369,12 @@ def read_pubmed_txt(
         if record:
             records.append(record)
     
-    df = pd.DataFrame(records)
-    df.dropna(axis=1, how='all', inplace=True)
+    # Columns only exist for tags that were parsed, so none is all-NA
+    df = _records_to_frame(records)
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -1522,7 +1633,7 @@ def read_dimensions_csv(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     # Convert numeric columns
@@ -1572,7 +1683,7 @@ def read_dimensions_xlsx(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -1617,7 +1728,7 @@ def read_lens_csv(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     # Convert numeric columns
@@ -1713,7 +1824,7 @@ def read_lens_json(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -1795,7 +1906,7 @@ def read_cochrane_ris(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -1831,7 +1942,7 @@ def read_cochrane_csv(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -1926,7 +2037,7 @@ def read_ris(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -2068,7 +2179,7 @@ def read_bibtex(
 
     # Apply column mapping if requested
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -2163,7 +2274,7 @@ def read_endnote_xml(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -2275,7 +2386,7 @@ def read_zotero_rdf(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -2314,7 +2425,7 @@ def read_scopus_bib(
     df = read_bibtex(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2343,7 +2454,7 @@ def read_scopus_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2386,7 +2497,7 @@ def read_ieee_csv(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     # Convert numeric columns
@@ -2422,7 +2533,7 @@ def read_ieee_bib(
     df = read_bibtex(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2450,7 +2561,7 @@ def read_ieee_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2486,7 +2597,7 @@ def read_proquest_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2515,7 +2626,7 @@ def read_proquest_csv(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -2556,7 +2667,7 @@ def read_ebsco_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2594,7 +2705,7 @@ def read_dblp_bib(
     df = read_bibtex(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2667,7 +2778,7 @@ def read_dblp_xml(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -2704,7 +2815,7 @@ def read_arxiv_bib(
     df = read_bibtex(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2746,7 +2857,7 @@ def read_semantic_scholar_csv(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     # Convert numeric columns
@@ -2826,7 +2937,7 @@ def read_semantic_scholar_json(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -2862,7 +2973,7 @@ def read_jstor_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -2986,7 +3097,7 @@ def read_crossref_json(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -3098,7 +3209,7 @@ def read_orcid_json(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -3134,7 +3245,7 @@ def read_psycinfo_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3164,7 +3275,7 @@ def read_eric_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3193,7 +3304,7 @@ def read_eric_csv(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -3223,7 +3334,7 @@ def read_econlit_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3253,7 +3364,7 @@ def read_mathscinet_bib(
     df = read_bibtex(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3283,7 +3394,7 @@ def read_inspec_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3313,7 +3424,7 @@ def read_georef_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3343,7 +3454,7 @@ def read_cab_abstracts_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3373,7 +3484,7 @@ def read_cinahl_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3403,7 +3514,7 @@ def read_embase_ris(
     df = read_ris(filepath, mapping_column=None)
     
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
     
     return df
@@ -3432,7 +3543,7 @@ def read_embase_csv(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     return df
@@ -3480,7 +3591,7 @@ def read_generic_csv(
     df.dropna(axis=1, how='all', inplace=True)
 
     if mapping_column is not None:
-        mapper = create_name_mapper(df0, mapping_column)
+        mapper = _get_name_mapping(mapping_column)
         df.rename(columns=mapper, inplace=True)
 
     # Convert numeric columns
@@ -3497,6 +3608,95 @@ def read_generic_csv(
 """Generic helper to read bibliographic files from different databases."""
 # general
 
+def _read_pubmed_txt_auto(f_name: str) -> pd.DataFrame:
+    """Read a PubMed .txt export, detecting MEDLINE, PMID-list or Summary format."""
+    with open(f_name, 'r', encoding='utf-8') as f_check:
+        first_lines = f_check.read(500)
+    if re.search(r'^PMID-\s*\d+', first_lines, re.MULTILINE):
+        # MEDLINE format
+        return read_pubmed_txt(f_name)
+    if re.match(r'^\d+\s*$', first_lines.split('\n')[0].strip()):
+        # PMID list (just numbers)
+        return read_pubmed_pmid_list(f_name)
+    if re.match(r'^\d+:\s*[A-Z]', first_lines):
+        # Summary format
+        return read_pubmed_summary(f_name)
+    # Default to MEDLINE
+    return read_pubmed_txt(f_name)
+
+
+# Database readers by file extension: normalized db name -> (label, {ext: reader})
+_BIBFILE_READERS: Dict[str, Tuple[str, Dict[str, Callable[[str], pd.DataFrame]]]] = {
+    # Major databases
+    "scopus": ("Scopus", {".xlsx": pd.read_excel, ".csv": pd.read_csv,
+                          ".bib": read_scopus_bib, ".ris": read_scopus_ris}),
+    "wos": ("WoS", {".txt": read_wos_txt, ".xls": read_wos_xls, ".xlsx": read_wos_xls,
+                    ".bib": read_wos_bib}),
+    "openalex": ("OpenAlex", {".csv": read_oa_csv, ".xlsx": read_oa_xlsx}),
+    "pubmed": ("PubMed", {".csv": read_pubmed_csv, ".nbib": read_pubmed_txt,
+                          ".txt": _read_pubmed_txt_auto}),
+    "dimensions": ("Dimensions", {".csv": read_dimensions_csv, ".xlsx": read_dimensions_xlsx,
+                                  ".xls": read_dimensions_xlsx}),
+    "lens": ("Lens", {".csv": read_lens_csv, ".json": read_lens_json, ".jsonl": read_lens_json}),
+    "cochrane": ("Cochrane", {".ris": read_cochrane_ris, ".csv": read_cochrane_csv}),
+    # Engineering / computer science
+    "ieee": ("IEEE Xplore", {".csv": read_ieee_csv, ".bib": read_ieee_bib, ".ris": read_ieee_ris}),
+    "dblp": ("DBLP", {".bib": read_dblp_bib, ".xml": read_dblp_xml}),
+    "arxiv": ("arXiv", {".bib": read_arxiv_bib}),
+    # Multidisciplinary / AI-powered
+    "semanticscholar": ("Semantic Scholar", {".csv": read_semantic_scholar_csv,
+                                             ".json": read_semantic_scholar_json,
+                                             ".jsonl": read_semantic_scholar_json}),
+    "crossref": ("CrossRef", {".json": read_crossref_json}),
+    "orcid": ("ORCID", {".json": read_orcid_json}),
+    # Aggregators / multi-database
+    "proquest": ("ProQuest", {".ris": read_proquest_ris, ".csv": read_proquest_csv}),
+    "ebsco": ("EBSCO", {".ris": read_ebsco_ris}),
+    "jstor": ("JSTOR", {".ris": read_jstor_ris}),
+    # Specialized subject databases
+    "psycinfo": ("PsycINFO", {".ris": read_psycinfo_ris}),
+    "eric": ("ERIC", {".ris": read_eric_ris, ".csv": read_eric_csv}),
+    "econlit": ("EconLit", {".ris": read_econlit_ris}),
+    "mathscinet": ("MathSciNet", {".bib": read_mathscinet_bib}),
+    "inspec": ("Inspec", {".ris": read_inspec_ris}),
+    "georef": ("GeoRef", {".ris": read_georef_ris}),
+    "cababstracts": ("CAB Abstracts", {".ris": read_cab_abstracts_ris}),
+    "cinahl": ("CINAHL", {".ris": read_cinahl_ris}),
+    "embase": ("Embase", {".ris": read_embase_ris, ".csv": read_embase_csv}),
+}
+
+_BIBFILE_DB_ALIASES = {
+    "webofscience": "wos",
+    "oa": "openalex",
+    "lensorg": "lens",
+    "ieeexplore": "ieee",
+    "s2": "semanticscholar",
+    "apapsycinfo": "psycinfo",
+    "cab": "cababstracts",
+}
+
+# Generic formats: the reader handles the file whatever its extension
+_GENERIC_BIBFILE_READERS: Dict[str, Callable[[str], pd.DataFrame]] = {
+    "ris": read_ris, "generic_ris": read_ris,
+    "bibtex": read_bibtex, "bib": read_bibtex, "generic_bib": read_bibtex,
+    "endnote": read_endnote_xml, "endnotexml": read_endnote_xml,
+    "zotero": read_zotero_rdf, "zoterordf": read_zotero_rdf,
+    "csv": read_generic_csv, "generic_csv": read_generic_csv,
+}
+
+# Compression suffixes looked through to the inner extension (e.g. .csv.gz)
+_COMPRESSION_EXTS = frozenset({".gz", ".bz2", ".xz", ".zip", ".zst"})
+
+
+def _bibfile_extension(f_name: str) -> str:
+    """Lower-cased file extension, looking through one compression suffix."""
+    root, ext = os.path.splitext(f_name)
+    ext = ext.lower()
+    if ext in _COMPRESSION_EXTS:
+        ext = os.path.splitext(root)[1].lower()
+    return ext
+
+
 def read_bibfile(
     f_name,
     db,
@@ -3548,291 +3748,31 @@ def read_bibfile(
         return pd.DataFrame([])
     
     db_lower = db.lower().strip().replace(' ', '').replace('-', '').replace('_', '')
-    f_name_lower = f_name.lower()
-    
-    # =========================================================================
-    # MAJOR DATABASES
-    # =========================================================================
-    
-    # Scopus
-    if db_lower == "scopus":
-        if ".xlsx" in f_name_lower:
-            df = pd.read_excel(f_name)
-        elif ".csv" in f_name_lower:
-            df = pd.read_csv(f_name)
-        elif ".bib" in f_name_lower:
-            df = read_scopus_bib(f_name)
-        elif ".ris" in f_name_lower:
-            df = read_scopus_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for Scopus: {f_name}")
-    
-    # Web of Science
-    elif db_lower == "wos" or db_lower == "webofscience":
-        if ".txt" in f_name_lower:
-            df = read_wos_txt(f_name)
-        elif ".xls" in f_name_lower:
-            df = read_wos_xls(f_name)
-        elif ".bib" in f_name_lower:
-            df = read_wos_bib(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for WoS: {f_name}")
-    
-    # OpenAlex
-    elif db_lower in ["openalex", "oa"]:
-        if ".csv" in f_name_lower:
-            df = read_oa_csv(f_name)
-        elif ".xlsx" in f_name_lower:
-            df = read_oa_xlsx(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for OpenAlex: {f_name}")
-    
-    # PubMed
-    elif db_lower == "pubmed":
-        if ".csv" in f_name_lower:
-            df = read_pubmed_csv(f_name)
-        elif ".nbib" in f_name_lower:
-            df = read_pubmed_txt(f_name)
-        elif ".txt" in f_name_lower:
-            # Auto-detect: MEDLINE format vs Summary format vs PMID list
-            with open(f_name, 'r', encoding='utf-8') as f_check:
-                first_lines = f_check.read(500)
-            import re
-            if re.search(r'^PMID-\s*\d+', first_lines, re.MULTILINE):
-                # MEDLINE format
-                df = read_pubmed_txt(f_name)
-            elif re.match(r'^\d+\s*$', first_lines.split('\n')[0].strip()):
-                # PMID list (just numbers)
-                df = read_pubmed_pmid_list(f_name)
-            elif re.match(r'^\d+:\s*[A-Z]', first_lines):
-                # Summary format
-                df = read_pubmed_summary(f_name)
-            else:
-                # Default to MEDLINE
-                df = read_pubmed_txt(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for PubMed: {f_name}. Use .csv, .txt, or .nbib format.")
-    
-    # Dimensions
-    elif db_lower == "dimensions":
-        if ".csv" in f_name_lower:
-            df = read_dimensions_csv(f_name)
-        elif ".xlsx" in f_name_lower or ".xls" in f_name_lower:
-            df = read_dimensions_xlsx(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for Dimensions: {f_name}")
-    
-    # Lens.org
-    elif db_lower == "lens" or db_lower == "lensorg":
-        if ".csv" in f_name_lower:
-            df = read_lens_csv(f_name)
-        elif ".json" in f_name_lower or ".jsonl" in f_name_lower:
-            df = read_lens_json(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for Lens: {f_name}")
-    
-    # Cochrane Library
-    elif db_lower == "cochrane":
-        if ".ris" in f_name_lower:
-            df = read_cochrane_ris(f_name)
-        elif ".csv" in f_name_lower:
-            df = read_cochrane_csv(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for Cochrane: {f_name}. Use .ris or .csv format.")
-    
-    # =========================================================================
-    # ENGINEERING / COMPUTER SCIENCE
-    # =========================================================================
-    
-    # IEEE Xplore
-    elif db_lower == "ieee" or db_lower == "ieeexplore":
-        if ".csv" in f_name_lower:
-            df = read_ieee_csv(f_name)
-        elif ".bib" in f_name_lower:
-            df = read_ieee_bib(f_name)
-        elif ".ris" in f_name_lower:
-            df = read_ieee_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for IEEE Xplore: {f_name}")
-    
-    # DBLP
-    elif db_lower == "dblp":
-        if ".bib" in f_name_lower:
-            df = read_dblp_bib(f_name)
-        elif ".xml" in f_name_lower:
-            df = read_dblp_xml(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for DBLP: {f_name}")
-    
-    # arXiv
-    elif db_lower == "arxiv":
-        if ".bib" in f_name_lower:
-            df = read_arxiv_bib(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for arXiv: {f_name}. Use .bib format.")
-    
-    # =========================================================================
-    # MULTIDISCIPLINARY / AI-POWERED
-    # =========================================================================
-    
-    # Semantic Scholar
-    elif db_lower == "semanticscholar" or db_lower == "s2":
-        if ".csv" in f_name_lower:
-            df = read_semantic_scholar_csv(f_name)
-        elif ".json" in f_name_lower or ".jsonl" in f_name_lower:
-            df = read_semantic_scholar_json(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for Semantic Scholar: {f_name}")
-    
-    # CrossRef
-    elif db_lower == "crossref":
-        if ".json" in f_name_lower:
-            df = read_crossref_json(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for CrossRef: {f_name}. Use .json format.")
-    
-    # ORCID
-    elif db_lower == "orcid":
-        if ".json" in f_name_lower:
-            df = read_orcid_json(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for ORCID: {f_name}. Use .json format.")
-    
-    # =========================================================================
-    # AGGREGATORS / MULTI-DATABASE
-    # =========================================================================
-    
-    # ProQuest
-    elif db_lower == "proquest":
-        if ".ris" in f_name_lower:
-            df = read_proquest_ris(f_name)
-        elif ".csv" in f_name_lower:
-            df = read_proquest_csv(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for ProQuest: {f_name}")
-    
-    # EBSCO
-    elif db_lower == "ebsco":
-        if ".ris" in f_name_lower:
-            df = read_ebsco_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for EBSCO: {f_name}. Use .ris format.")
-    
-    # JSTOR
-    elif db_lower == "jstor":
-        if ".ris" in f_name_lower:
-            df = read_jstor_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for JSTOR: {f_name}. Use .ris format.")
-    
-    # =========================================================================
-    # SPECIALIZED SUBJECT DATABASES
-    # =========================================================================
-    
-    # PsycINFO (Psychology)
-    elif db_lower == "psycinfo" or db_lower == "apapsycinfo":
-        if ".ris" in f_name_lower:
-            df = read_psycinfo_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for PsycINFO: {f_name}. Use .ris format.")
-    
-    # ERIC (Education)
-    elif db_lower == "eric":
-        if ".ris" in f_name_lower:
-            df = read_eric_ris(f_name)
-        elif ".csv" in f_name_lower:
-            df = read_eric_csv(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for ERIC: {f_name}")
-    
-    # EconLit (Economics)
-    elif db_lower == "econlit":
-        if ".ris" in f_name_lower:
-            df = read_econlit_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for EconLit: {f_name}. Use .ris format.")
-    
-    # MathSciNet (Mathematics)
-    elif db_lower == "mathscinet":
-        if ".bib" in f_name_lower:
-            df = read_mathscinet_bib(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for MathSciNet: {f_name}. Use .bib format.")
-    
-    # Inspec (Physics/Engineering/Computing)
-    elif db_lower == "inspec":
-        if ".ris" in f_name_lower:
-            df = read_inspec_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for Inspec: {f_name}. Use .ris format.")
-    
-    # GeoRef (Geosciences)
-    elif db_lower == "georef":
-        if ".ris" in f_name_lower:
-            df = read_georef_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for GeoRef: {f_name}. Use .ris format.")
-    
-    # CAB Abstracts (Agriculture/Life Sciences)
-    elif db_lower == "cababstracts" or db_lower == "cab":
-        if ".ris" in f_name_lower:
-            df = read_cab_abstracts_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for CAB Abstracts: {f_name}. Use .ris format.")
-    
-    # CINAHL (Nursing/Allied Health)
-    elif db_lower == "cinahl":
-        if ".ris" in f_name_lower:
-            df = read_cinahl_ris(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for CINAHL: {f_name}. Use .ris format.")
-    
-    # Embase (Biomedical/Pharmacological)
-    elif db_lower == "embase":
-        if ".ris" in f_name_lower:
-            df = read_embase_ris(f_name)
-        elif ".csv" in f_name_lower:
-            df = read_embase_csv(f_name)
-        else:
-            raise ValueError(f"Unsupported file format for Embase: {f_name}")
-    
-    # =========================================================================
-    # GENERIC FORMATS (auto-detect by file extension)
-    # =========================================================================
-    
-    # Generic RIS
-    elif db_lower == "ris" or db_lower == "generic_ris":
-        df = read_ris(f_name)
-    
-    # Generic BibTeX
-    elif db_lower == "bibtex" or db_lower == "bib" or db_lower == "generic_bib":
-        df = read_bibtex(f_name)
-    
-    # EndNote XML
-    elif db_lower == "endnote" or db_lower == "endnotexml":
-        df = read_endnote_xml(f_name)
-    
-    # Zotero RDF
-    elif db_lower == "zotero" or db_lower == "zoterordf":
-        df = read_zotero_rdf(f_name)
-    
-    # Generic CSV
-    elif db_lower == "csv" or db_lower == "generic_csv":
-        df = read_generic_csv(f_name)
-    
-    else:
-        # Build list of supported databases for error message
-        supported = [
-            "scopus", "wos", "openalex/oa", "pubmed", "dimensions", "lens", "cochrane",
-            "ieee", "dblp", "arxiv", "semantic_scholar/s2", "crossref", "orcid",
-            "proquest", "ebsco", "jstor",
-            "psycinfo", "eric", "econlit", "mathscinet", "inspec", "georef", 
-            "cab_abstracts/cab", "cinahl", "embase",
-            "ris", "bibtex/bib", "endnote", "zotero", "csv"
-        ]
-        raise ValueError(f"Unsupported database: {db}. Supported: {', '.join(supported)}")
-    
-    return df
+    db_key = _BIBFILE_DB_ALIASES.get(db_lower, db_lower)
+
+    if db_key in _BIBFILE_READERS:
+        label, readers = _BIBFILE_READERS[db_key]
+        reader = readers.get(_bibfile_extension(f_name))
+        if reader is None:
+            raise ValueError(
+                f"Unsupported file format for {label}: {f_name}. "
+                f"Use {', '.join(dict.fromkeys(readers))} format."
+            )
+        return reader(f_name)
+
+    if db_lower in _GENERIC_BIBFILE_READERS:
+        return _GENERIC_BIBFILE_READERS[db_lower](f_name)
+
+    # Build list of supported databases for error message
+    supported = [
+        "scopus", "wos", "openalex/oa", "pubmed", "dimensions", "lens", "cochrane",
+        "ieee", "dblp", "arxiv", "semantic_scholar/s2", "crossref", "orcid",
+        "proquest", "ebsco", "jstor",
+        "psycinfo", "eric", "econlit", "mathscinet", "inspec", "georef", 
+        "cab_abstracts/cab", "cinahl", "embase",
+        "ris", "bibtex/bib", "endnote", "zotero", "csv"
+    ]
+    raise ValueError(f"Unsupported database: {db}. Supported: {', '.join(supported)}")
 
 
 # =============================================================================
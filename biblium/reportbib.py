@@ -52,7 +52,12 @@ Notes
 
 from __future__ import annotations
 
+import unicodedata
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain
 from pathlib import Path
+from string import Template
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
@@ -69,6 +74,7 @@ ICONS_DIR: Path = FD / "additional files" / "icons"
 # -----------------------------
 
 from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.drawing.image import Image as XLImage
 from openpyxl.styles import Font, PatternFill
 from openpyxl.utils import get_column_letter
@@ -116,6 +122,59 @@ COLOR_MAP: Dict[str, str] = {
 }
 
 
+# Shared openpyxl style objects; cells only store their index in the
+# workbook's style tables, so one instance can style any number of cells
+_LINK_FONT = Font(color="0000FF", underline="single")
+
+
+@lru_cache(maxsize=64)
+def _solid_fill(
+    hex_color: str,
+) -> PatternFill:
+    """
+    Return a (cached) solid PatternFill in a 6-digit hex color.
+
+    Parameters
+    ----------
+    hex_color : str
+        Hex color code without "#".
+
+    Returns
+    -------
+    PatternFill
+        Solid fill, shared between calls.
+    """
+    return PatternFill(start_color=hex_color, end_color=hex_color, fill_type="solid")
+
+
+def _style_array(
+    ws,
+    **styles: Any,
+):
+    """
+    Register cell styles with the workbook of `ws` once and return their packed form.
+
+    Cells built with ``Cell(ws, value=..., style_array=...)`` copy the array,
+    which skips looking each style object up in the workbook per cell.
+
+    Parameters
+    ----------
+    ws
+        OpenPyXL worksheet of the target workbook.
+    **styles
+        Style attributes to set, e.g. ``font=Font(bold=True)``.
+
+    Returns
+    -------
+    openpyxl.styles.cell_style.StyleArray
+        Packed style indices, valid for every sheet of that workbook.
+    """
+    cell = WriteOnlyCell(ws)
+    for name, value in styles.items():
+        setattr(cell, name, value)
+    return cell._style
+
+
 def _normalize_hex(
     rgb_or_name: str,
     default: str = "FFFFFF",
@@ -171,7 +230,7 @@ def _set_internal_link(
     """
     target = f"'{sheet_name}'!{cell_ref}"
     cell.hyperlink = Hyperlink(ref=cell.coordinate, location=target)
-    cell.font = Font(color="0000FF", underline="single")
+    cell.font = _LINK_FONT
 
 
 def _set_external_file_link(
@@ -194,7 +253,23 @@ def _set_external_file_link(
         url = "file://" + str(file_path.resolve()).replace("\\", "/")
 
     cell.hyperlink = Hyperlink(ref=cell.coordinate, target=url)
-    cell.font = Font(color="0000FF", underline="single")
+    cell.font = _LINK_FONT
+
+
+@lru_cache(maxsize=16)
+def _icon_bytes(
+    icon_name: str,
+) -> Optional[bytes]:
+    """
+    Raw bytes of a bundled icon (None if missing), read once per process.
+
+    Icons are placed on every TOC row; an `XLImage` over a fresh BytesIO of
+    these bytes avoids reopening the file for each image and again at save.
+    """
+    icon_path = ICONS_DIR / icon_name
+    if not icon_path.exists():
+        return None
+    return icon_path.read_bytes()
 
 
 def _fit_image(
@@ -233,6 +308,61 @@ def _fit_image(
 # Path helpers
 # -----------------------------
 
+def _name_key(name: str) -> str:
+    """
+    Case- and normalization-folded file name, so a listing lookup never misses
+    a name that a case-insensitive filesystem (macOS, Windows) would match.
+    """
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+@lru_cache(maxsize=256)
+def _dir_entries(
+    directory: str,
+    mtime_ns: int,
+) -> frozenset:
+    """
+    Folded entry names of `directory` (see `_name_key`), cached per directory
+    version (keyed on its mtime, which changes whenever an entry is added,
+    removed or renamed).
+    """
+    return frozenset(_name_key(e.name) for e in Path(directory).iterdir())
+
+
+def _first_existing(
+    candidates,
+) -> Optional[Path]:
+    """
+    Return the first existing path of `candidates` (resolved), or None.
+
+    One cached listing per parent directory (`_dir_entries`) rules out the
+    obvious misses; only candidates whose folded name is listed are confirmed
+    with ``Path.exists()``. Probing many file name variants thus costs a
+    ``stat`` per directory plus one per likely hit, instead of a resolve +
+    ``stat`` per candidate, while case-insensitive matches and broken
+    symlinks are answered by the filesystem as before.
+
+    Parameters
+    ----------
+    candidates
+        Iterable of Path objects, in order of preference.
+    """
+    listings: Dict[Path, frozenset] = {}
+    for cand in candidates:
+        parent = cand.parent
+        entries = listings.get(parent)
+        if entries is None:
+            try:
+                directory = parent.absolute()
+                entries = _dir_entries(str(directory), directory.stat().st_mtime_ns)
+            except OSError:
+                entries = frozenset()
+            listings[parent] = entries
+        if _name_key(cand.name) in entries and cand.exists():
+            return cand.resolve()
+    return None
+
+
 def _resolve_image_path(
     self: Any,
     tpath: str,
@@ -310,10 +440,9 @@ def _resolve_image_path(
 
     # 1) Absolute base path
     if p and p.is_absolute():
-        for fn in filename_variants:
-            cand = (p / fn).resolve()
-            if cand.exists():
-                return cand
+        found = _first_existing(p / fn for fn in filename_variants)
+        if found is not None:
+            return found
 
     # Collect candidate bases
     bases: List[Path] = []
@@ -341,14 +470,10 @@ def _resolve_image_path(
     bases.append(Path.cwd() / "plots")  # Also check plots subfolder
 
     # Try combinations of bases and filename variants
-    for base in bases:
-        rel = (p or Path(""))
-        for fn in filename_variants:
-            cand = (base / rel / fn).resolve()
-            if cand.exists():
-                return cand
-
-    return None
+    rel = (p or Path(""))
+    return _first_existing(
+        base / rel / fn for base in bases for fn in filename_variants
+    )
 
 
 def _resolve_base(
@@ -562,6 +687,26 @@ def validate_template(
     return result
 
 
+@lru_cache(maxsize=32)
+def _load_template(
+    template_path: str,
+    mtime_ns: int,
+    sheet_name: str,
+) -> pd.DataFrame:
+    """
+    Parse a template sheet once per file version (keyed on its mtime).
+
+    The cached DataFrame is shared; callers go through `_read_template`,
+    which hands out copies.
+    """
+    # pandas' openpyxl reader already opens the workbook read_only/data_only;
+    # a hand-rolled ws.values loader saves ~2 ms on the bundled template but
+    # loses pandas' cell/dtype handling (e.g. 50 vs 50.0 in mixed columns)
+    df = pd.read_excel(template_path, sheet_name=sheet_name)
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
 def _read_template(
     template_path: Union[str, Path],
     sheet_name: str,
@@ -569,6 +714,9 @@ def _read_template(
     """
     Read the Excel template and strip whitespace from header cells.
 
+    The parsed sheet is cached until the file changes, so generating several
+    report formats from one template reads the workbook only once.
+
     Parameters
     ----------
     template_path : str or Path
@@ -579,11 +727,11 @@ def _read_template(
     Returns
     -------
     pandas.DataFrame
-        Template definition dataframe.
+        Template definition dataframe (a copy, safe to modify).
     """
-    df = pd.read_excel(template_path, sheet_name=sheet_name)
-    df.columns = [str(c).strip() for c in df.columns]
-    return df
+    template_path = Path(template_path).resolve()
+    mtime_ns = template_path.stat().st_mtime_ns
+    return _load_template(str(template_path), mtime_ns, sheet_name).copy()
 
 
 def _get_df_attr(
@@ -611,6 +759,35 @@ def _get_df_attr(
     return obj if isinstance(obj, pd.DataFrame) else None
 
 
+def _self_attrs(
+    self: Any,
+    records: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Look up every attribute named by template records once.
+
+    Parameters
+    ----------
+    self : Any
+        Object holding the report attributes.
+    records : list of dict
+        Rows from `_template_records`.
+
+    Returns
+    -------
+    dict
+        Maps each non-empty "Data Attr" / "Description" / "Narrative" name to
+        ``getattr(self, name, None)``.
+    """
+    names = {
+        row[col]
+        for row in records
+        for col in ("Data Attr", "Description", "Narrative")
+    }
+    names.discard("")
+    return {name: getattr(self, name, None) for name in names}
+
+
 def _round_numeric(
     df: pd.DataFrame,
     ndigits: int = 3,
@@ -650,27 +827,62 @@ def _round_numeric(
 
 def _autosize_columns(
     ws,
+    rows,
+    df: Optional[pd.DataFrame] = None,
 ) -> None:
     """
     Autosize columns on an openpyxl worksheet based on cell text length.
 
+    Write-only worksheets stream their column settings ahead of the cells, so
+    the widths are computed from the rows that are about to be appended.
+
     Parameters
     ----------
     ws
         OpenPyXL worksheet.
-    """
-    for col_cells in ws.columns:
-        try:
-            idx = col_cells[0].column
-        except Exception:
-            continue
-        max_len = 0
-        for cell in col_cells:
-            if cell.value is not None:
-                max_len = max(max_len, len(str(cell.value)))
+    rows
+        Iterable of rows (sequences of values or cells) the sheet will hold.
+    df : pandas.DataFrame, optional
+        Table whose data rows the sheet also holds, from column A. Measured
+        column-wise straight from the frame; cells must not be None (as
+        produced by `_df_display`).
+    """
+    widths: Dict[int, int] = {}
+    for row in rows:
+        for idx, value in enumerate(row, 1):
+            if isinstance(value, Cell):
+                value = value.value
+            n = len(str(value)) if value is not None else 0
+            if n > widths.get(idx, -1):
+                widths[idx] = n
+    if df is not None:
+        for idx in range(1, df.shape[1] + 1):
+            n = max(map(len, map(str, df.iloc[:, idx - 1].tolist())), default=0)
+            if n > widths.get(idx, -1):
+                widths[idx] = n
+    for idx, max_len in widths.items():
         ws.column_dimensions[get_column_letter(idx)].width = max_len + 2
 
 
+def _df_rows(
+    df: pd.DataFrame,
+):
+    """
+    Yield the header row(s) and then the data rows of `df` for ``ws.append``.
+
+    Header rows come from openpyxl's ``dataframe_to_rows`` (multi-level and
+    datetime column labels); data rows are plain ``itertuples`` tuples, without
+    its per-row list and index handling.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Table to write (index is not included).
+    """
+    yield from dataframe_to_rows(df.iloc[:0], index=False, header=True)
+    yield from df.itertuples(index=False, name=None)
+
+
 def _parse_head_value(
     head_value: Any,
 ) -> Optional[int]:
@@ -793,7 +1005,8 @@ def _filter_columns(
     if not available_cols:
         return df
     
-    return df[available_cols].copy()
+    # Column selection already yields a new frame; no extra copy needed
+    return df[available_cols]
 
 
 def _is_xlsx_only(row: pd.Series) -> bool:
@@ -810,7 +1023,15 @@ def _is_xlsx_only(row: pd.Series) -> bool:
     bool
         True if xlsx_only flag is set.
     """
-    xlsx_only = row.get("xlsx_only", False)
+    return _xlsx_only_flag(row.get("xlsx_only", False))
+
+
+def _xlsx_only_flag(
+    xlsx_only: Any,
+) -> bool:
+    """
+    Interpret an xlsx_only cell value (see `_is_xlsx_only`).
+    """
     if isinstance(xlsx_only, bool):
         return xlsx_only
     if isinstance(xlsx_only, str):
@@ -924,11 +1145,11 @@ def _df_display(
     if df is None or df.empty:
         return df
 
-    out = _round_numeric(df, ndigits).copy()
-    out = out.astype("object")
-    mask = pd.isna(out)
-    out[mask] = ""
-    return out
+    # Whole-column work only: round, find missing cells on the typed frame
+    # (much cheaper than on boxed objects), then box and blank them in one go
+    out = _round_numeric(df, ndigits)
+    missing = out.isna()
+    return out.astype("object").mask(missing, "")
 
 
 def _flag_true(
@@ -951,6 +1172,67 @@ def _flag_true(
     return s in {"true", "yes", "1", "y"}
 
 
+# Template columns read as text by the Word/PPTX/TeX exporters
+_TEMPLATE_TEXT_COLUMNS = (
+    "Level 1",
+    "Level 2",
+    "Item Type",
+    "Data Attr",
+    "Path",
+    "Plot Filename",
+    "Caption",
+    "Text",
+    "Narrative",
+    "Description",
+    "Table Style",
+    "Columns (docx/pptx/tex)",
+    "Page Break After",
+)
+
+
+def _template_records(
+    df_template: pd.DataFrame,
+) -> List[Dict[str, Any]]:
+    """
+    Normalize a template once for the Word/PPTX/TeX exporters.
+
+    Rows flagged ``xlsx_only`` are dropped, text columns are cleaned with
+    `_clean_str` column by column and the item type is resolved up front,
+    so the export loops read plain strings instead of re-cleaning a boxed
+    row Series per field.
+
+    Parameters
+    ----------
+    df_template : pandas.DataFrame
+        Template definition dataframe.
+
+    Returns
+    -------
+    list of dict
+        One dict per kept row with the `_TEMPLATE_TEXT_COLUMNS` as cleaned
+        strings ("" if missing), "Head" as the raw cell and "item_type" as
+        returned by `_infer_item_type` ("" if unrecognized).
+    """
+    df = df_template
+    if "xlsx_only" in df.columns:
+        df = df[~df["xlsx_only"].map(_xlsx_only_flag).astype(bool)]
+
+    records = pd.DataFrame(index=df.index)
+    for col in _TEMPLATE_TEXT_COLUMNS:
+        records[col] = df[col].map(_clean_str) if col in df.columns else ""
+    records["Head"] = df["Head"] if "Head" in df.columns else None
+    item_type = records["Item Type"].str.lower()
+    records["item_type"] = item_type.where(
+        item_type.isin(["table", "plot", "text", "description"]), ""
+    )
+
+    columns = list(records.columns)
+    return [
+        dict(zip(columns, values))
+        for values in records.itertuples(index=False, name=None)
+    ]
+
+
 # -----------------------------
 # EXCEL
 # -----------------------------
@@ -1036,74 +1318,82 @@ def save_excel_report_from_template(
     template_path = _resolve_path(self, template_path, results_base)
     df_template = _read_template(template_path, template_sheet)
 
-    wb = Workbook()
-    
+    # Write-only workbook: rows are streamed to disk as they are appended, so
+    # sheet settings (column widths, views, panes) are applied before any row
+    wb = Workbook(write_only=True)
+
     # Add cover sheet if enabled
     if include_cover_sheet:
-        cover_ws = wb.active
-        cover_ws.title = "Cover"
+        cover_ws = wb.create_sheet("Cover")
         cover_ws.sheet_properties.tabColor = HEADER_BG
-        
-        # Title
-        cover_ws.merge_cells("B4:F4")
-        title_cell = cover_ws["B4"]
-        title_cell.value = report_title
+
+        # Column widths
+        cover_ws.column_dimensions["A"].width = 3
+        cover_ws.column_dimensions["B"].width = 25
+        cover_ws.column_dimensions["C"].width = 35
+
+        cover_ws.sheet_view.showGridLines = False
+
+        # Title (B4) and decorative line (B6), each merged across B:F
+        cover_ws.merged_cells.add("B4:F4")
+        title_cell = WriteOnlyCell(cover_ws, report_title)
         title_cell.font = Font(name="Calibri Light", size=28, bold=True, color=HEADER_BG)
         title_cell.alignment = Alignment(horizontal="center")
-        
-        # Decorative line
-        cover_ws.merge_cells("B6:F6")
-        line_cell = cover_ws["B6"]
-        line_cell.value = "─" * 60
+
+        cover_ws.merged_cells.add("B6:F6")
+        line_cell = WriteOnlyCell(cover_ws, "─" * 60)
         line_cell.font = Font(color=ACCENT_COLOR)
         line_cell.alignment = Alignment(horizontal="center")
-        
-        # Summary stats
+
+        for cover_row in ([], [], [], [None, title_cell], [], [None, line_cell], []):
+            cover_ws.append(cover_row)
+
+        # Summary stats from row 8
         summary_stats = _get_summary_stats(self)
-        row = 8
         for key, value in summary_stats.items():
-            cover_ws.cell(row=row, column=2).value = key
-            cover_ws.cell(row=row, column=2).font = Font(name="Calibri", bold=True, size=11)
-            cover_ws.cell(row=row, column=3).value = str(value)
-            cover_ws.cell(row=row, column=3).font = Font(name="Calibri", size=11)
-            row += 1
-        
-        # Date
+            key_cell = WriteOnlyCell(cover_ws, key)
+            key_cell.font = Font(name="Calibri", bold=True, size=11)
+            value_cell = WriteOnlyCell(cover_ws, str(value))
+            value_cell.font = Font(name="Calibri", size=11)
+            cover_ws.append([None, key_cell, value_cell])
+
+        # Date, after one blank row
         from datetime import datetime
-        cover_ws.cell(row=row + 1, column=2).value = "Generated:"
-        cover_ws.cell(row=row + 1, column=2).font = Font(name="Calibri", bold=True, size=11)
-        cover_ws.cell(row=row + 1, column=3).value = datetime.now().strftime("%B %d, %Y")
-        cover_ws.cell(row=row + 1, column=3).font = Font(name="Calibri", size=11)
-        
-        # Column widths
-        cover_ws.column_dimensions["A"].width = 3
-        cover_ws.column_dimensions["B"].width = 25
-        cover_ws.column_dimensions["C"].width = 35
-        
-        cover_ws.sheet_view.showGridLines = False
-        
-        # Create new TOC sheet
-        toc_ws = wb.create_sheet("Table of Contents")
-    else:
-        toc_ws = wb.active
-        toc_ws.title = "Table of Contents"
-    
+        label_cell = WriteOnlyCell(cover_ws, "Generated:")
+        label_cell.font = Font(name="Calibri", bold=True, size=11)
+        date_cell = WriteOnlyCell(cover_ws, datetime.now().strftime("%B %d, %Y"))
+        date_cell.font = Font(name="Calibri", size=11)
+        cover_ws.append([])
+        cover_ws.append([None, label_cell, date_cell])
+
+    # The TOC keeps its place after the cover, but its rows are collected and
+    # written last: its column widths depend on every entry
+    toc_ws = wb.create_sheet("Table of Contents")
     toc_ws.freeze_panes = "A3"
     toc_tab_color = _normalize_hex("LightBlue")
     toc_ws.sheet_properties.tabColor = toc_tab_color
 
     header = ["Level 1", "Level 2", "Sheet Name"] + (["Icon"] if show_icons else [])
-    toc_ws.append(header)
-    
+
+    # Style objects shared by every cell that uses them
+    bold_font = Font(bold=True)
+    toc_header_font = Font(bold=True, color=HEADER_FG, name="Calibri")
+    home_font = Font(name="Calibri", size=10, bold=True, color="FFFFFF")
+    # Packed table styles, registered with the workbook at the first table
+    table_styles: Optional[Dict[str, Any]] = None
+
     # Modern header styling for TOC
-    for col_idx in range(1, len(header) + 1):
-        cell = toc_ws.cell(row=1, column=col_idx)
+    header_cells = []
+    for label in header:
+        cell = WriteOnlyCell(toc_ws, label)
         if modern_style:
-            cell.fill = PatternFill(start_color=HEADER_BG, end_color=HEADER_BG, fill_type="solid")
-            cell.font = Font(bold=True, color=HEADER_FG, name="Calibri")
+            cell.fill = _solid_fill(HEADER_BG)
+            cell.font = toc_header_font
         else:
-            cell.fill = PatternFill(start_color="D9EAD3", end_color="D9EAD3", fill_type="solid")
-            cell.font = Font(bold=True)
+            cell.fill = _solid_fill("D9EAD3")
+            cell.font = bold_font
+        header_cells.append(cell)
+    toc_rows: List[List[Any]] = [header_cells]
 
     def _insert_icon(ws, row_idx: int, item_type: str) -> None:
         """
@@ -1131,9 +1421,9 @@ def save_excel_report_from_template(
         if icon_name is None:
             return
 
-        icon_path = ICONS_DIR / icon_name
-        if icon_path.exists():
-            img = XLImage(str(icon_path))
+        data = _icon_bytes(icon_name)
+        if data is not None:
+            img = XLImage(BytesIO(data))
             img.width = int(img.width * 0.5)
             img.height = int(img.height * 0.5)
             ws.add_image(img, f"D{row_idx}")
@@ -1187,45 +1477,38 @@ def save_excel_report_from_template(
         ws = wb.create_sheet(sheet_name)
         ws.sheet_properties.tabColor = tab_color
 
+        if not show_gridlines:
+            ws.sheet_view.showGridLines = False
+
         # Add home link with icon
-        home_cell = ws["A1"]
-        home_cell.value = "🏠 Home"
+        home_cell = WriteOnlyCell(ws, "🏠 Home")
         _set_internal_link(home_cell, toc_ws.title, "A1")
         try:
             if modern_style:
-                home_cell.fill = PatternFill(
-                    start_color=ACCENT_COLOR,
-                    end_color=ACCENT_COLOR,
-                    fill_type="solid",
-                )
-                home_cell.font = Font(name="Calibri", size=10, bold=True, color="FFFFFF")
+                home_cell.fill = _solid_fill(ACCENT_COLOR)
+                home_cell.font = home_font
             else:
-                home_cell.fill = PatternFill(
-                    start_color="FFF2CC",
-                    end_color="FFF2CC",
-                    fill_type="solid",
-                )
+                home_cell.fill = _solid_fill("FFF2CC")
         except Exception:
             pass
 
         start_row = 3
 
-        toc_ws.cell(row=row_idx, column=1, value=level1)
-        toc_ws.cell(row=row_idx, column=2, value=level2)
-        toc_cell = toc_ws.cell(row=row_idx, column=3, value=sheet_name)
+        toc_cell = WriteOnlyCell(toc_ws, sheet_name)
         _set_internal_link(toc_cell, sheet_name, "A1")
         if toc_color:
-            toc_cell.fill = PatternFill(
-                start_color=toc_color,
-                end_color=toc_color,
-                fill_type="solid",
-            )
+            toc_cell.fill = _solid_fill(toc_color)
+        toc_rows.append([level1, level2, toc_cell])
 
         if show_icons:
             _insert_icon(toc_ws, row_idx, it)
 
         row_idx += 1
 
+        # Rows above the content: home link, then the plot's file link if any
+        top_rows: List[List[Any]] = [[home_cell], []]
+        df_print: Optional[pd.DataFrame] = None
+
         # Content
         if it == "table" and df_obj is not None:
             if freeze_header:
@@ -1233,55 +1516,32 @@ def save_excel_report_from_template(
 
             df_print = _df_display(df_obj)
             if df_print is None or df_print.empty:
-                continue
-
-            n_cols = len(df_print.columns)
-            n_data_rows = len(df_print)
-            
-            for r_idx, row_data in enumerate(
-                dataframe_to_rows(df_print, index=False, header=True),
-                start=start_row,
-            ):
-                is_header = (r_idx == start_row)
-                is_alt_row = (r_idx - start_row) % 2 == 0 and not is_header
-                
-                for c_idx, value in enumerate(row_data, 1):
-                    ws_cell = ws.cell(row=r_idx, column=c_idx, value=value)
-                    
-                    if modern_style:
-                        if is_header:
-                            ws_cell.fill = PatternFill(start_color=HEADER_BG, end_color=HEADER_BG, fill_type="solid")
-                            ws_cell.font = Font(bold=True, color=HEADER_FG, name="Calibri", size=10)
-                            ws_cell.alignment = Alignment(horizontal="center", vertical="center")
-                        else:
-                            if is_alt_row:
-                                ws_cell.fill = PatternFill(start_color=ALT_ROW_BG, end_color=ALT_ROW_BG, fill_type="solid")
-                            ws_cell.font = Font(name="Calibri", size=10)
-                            ws_cell.border = Border(bottom=Side(style="thin", color="DEE2E6"))
-                    else:
-                        if is_header:
-                            ws_cell.font = Font(bold=True)
-            
-            # Add data bars to numeric columns
-            if modern_style and data_bars and n_data_rows > 1:
-                # Find numeric columns that might benefit from data bars
-                for col_idx, col_name in enumerate(df_print.columns, 1):
-                    col_lower = str(col_name).lower()
-                    if any(kw in col_lower for kw in ["number", "count", "total", "citations", "documents"]):
-                        col_letter = get_column_letter(col_idx)
-                        data_bar_rule = DataBarRule(
-                            start_type="min",
-                            end_type="max",
-                            color=ACCENT_COLOR,
-                            showValue=True,
-                            minLength=None,
-                            maxLength=None
-                        )
-                        range_str = f"{col_letter}{start_row + 1}:{col_letter}{start_row + n_data_rows}"
-                        try:
-                            ws.conditional_formatting.add(range_str, data_bar_rule)
-                        except Exception:
-                            pass  # Skip if conditional formatting fails
+                df_print = None
+                top_rows = [[home_cell]]
+            else:
+                n_cols = len(df_print.columns)
+                n_data_rows = len(df_print)
+
+                # Add data bars to numeric columns
+                if modern_style and data_bars and n_data_rows > 1:
+                    # Find numeric columns that might benefit from data bars
+                    for col_idx, col_name in enumerate(df_print.columns, 1):
+                        col_lower = str(col_name).lower()
+                        if any(kw in col_lower for kw in ["number", "count", "total", "citations", "documents"]):
+                            col_letter = get_column_letter(col_idx)
+                            data_bar_rule = DataBarRule(
+                                start_type="min",
+                                end_type="max",
+                                color=ACCENT_COLOR,
+                                showValue=True,
+                                minLength=None,
+                                maxLength=None
+                            )
+                            range_str = f"{col_letter}{start_row + 1}:{col_letter}{start_row + n_data_rows}"
+                            try:
+                                ws.conditional_formatting.add(range_str, data_bar_rule)
+                            except Exception:
+                                pass  # Skip if conditional formatting fails
 
         elif it == "plot" and img_path is not None:
             try:
@@ -1293,34 +1553,76 @@ def save_excel_report_from_template(
                     max_h=int(image_max_height_px),
                 )
                 ws.add_image(img, "B5")
-                link_cell = ws["A2"]
-                link_cell.value = str(img_path)
+                link_cell = WriteOnlyCell(ws, str(img_path))
                 _set_external_file_link(link_cell, img_path)
+                top_rows = [[home_cell], [link_cell]]
             except Exception:
                 pass
 
         elif it in {"text", "description"} and text_value:
-            ws.cell(row=start_row, column=1, value=text_value)
+            top_rows.append([text_value])
 
         if autofit:
-            _autosize_columns(ws)
+            # Header row(s) go with the rows; the table body is measured per column
+            header_rows = _df_rows(df_print.iloc[:0]) if df_print is not None else []
+            _autosize_columns(ws, chain(top_rows, header_rows), df_print)
+
+        for top_row in top_rows:
+            ws.append(top_row)
+
+        if df_print is not None:
+            if table_styles is None:
+                if modern_style:
+                    body_font = Font(name="Calibri", size=10)
+                    body_border = Border(bottom=Side(style="thin", color="DEE2E6"))
+                    table_styles = {
+                        "header": _style_array(
+                            ws,
+                            fill=_solid_fill(HEADER_BG),
+                            font=Font(bold=True, color=HEADER_FG, name="Calibri", size=10),
+                            alignment=Alignment(horizontal="center", vertical="center"),
+                        ),
+                        "body": _style_array(ws, font=body_font, border=body_border),
+                        "alt": _style_array(ws, fill=_solid_fill(ALT_ROW_BG), font=body_font, border=body_border),
+                    }
+                else:
+                    table_styles = {"header": _style_array(ws, font=bold_font)}
 
-        if not show_gridlines:
-            ws.sheet_view.showGridLines = False
+            for r_idx, row_data in enumerate(_df_rows(df_print), start=start_row):
+                is_header = (r_idx == start_row)
+                is_alt_row = (r_idx - start_row) % 2 == 0 and not is_header
+
+                if is_header:
+                    style = table_styles["header"]
+                elif modern_style:
+                    style = table_styles["alt" if is_alt_row else "body"]
+                else:
+                    ws.append(row_data)
+                    continue
+
+                ws.append([Cell(ws, row=1, column=1, value=value, style_array=style) for value in row_data])
 
     if striped_rows:
-        for row in toc_ws.iter_rows(min_row=2, max_row=row_idx - 1):
-            if row[0].row % 2 == 0:
-                for cell in row:
-                    cell.fill = PatternFill(
-                        start_color="F2F2F2",
-                        end_color="F2F2F2",
-                        fill_type="solid",
+        stripe_fill = _solid_fill("F2F2F2")
+        stripe_style = _style_array(toc_ws, fill=stripe_fill)
+        # Even sheet rows only (sheet row n is toc_rows[n - 1])
+        for toc_row in toc_rows[1::2]:
+            toc_row.extend([None] * (len(header) - len(toc_row)))
+            for c_idx, value in enumerate(toc_row):
+                if isinstance(value, Cell):
+                    value.fill = stripe_fill
+                else:
+                    toc_row[c_idx] = Cell(
+                        toc_ws, row=1, column=1, value=value, style_array=stripe_style
                     )
 
-    _autosize_columns(toc_ws)
+    _autosize_columns(toc_ws, toc_rows)
+    for toc_row in toc_rows:
+        toc_ws.append(toc_row)
 
     if "Sheet" in wb.sheetnames:
+        # Finish the streamed sheet before dropping it from the workbook
+        wb["Sheet"].close()
         del wb["Sheet"]
 
     out_path = _resolve_path(self, output_path, results_base)
@@ -1371,13 +1673,12 @@ def _ppt_add_df_table(
     """
     from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
     
-    dfp = _df_display(df, ndigits=round_ndigits)
-    if dfp is None or dfp.empty:
+    if df is None or df.empty:
         return
-    
-    # Limit rows for PowerPoint readability
-    if len(dfp) > max_rows:
-        dfp = dfp.head(max_rows)
+
+    # Limit rows for PowerPoint readability; truncate first so only the
+    # rows shown are formatted
+    dfp = _df_display(df.head(max_rows), ndigits=round_ndigits)
 
     rows, cols = dfp.shape
     table_shape = slide.shapes.add_table(
@@ -1400,16 +1701,22 @@ def _ppt_add_df_table(
     if header_font is None:
         header_font = HEADER_FG
 
+    header_size = Pt(10)
+    data_size = Pt(9)
+
+    # Fill row by row: table_shape.cell(i, j) re-walks the row and cell
+    # element lists on every call
+    table_rows = iter(table_shape.rows)
+
     # Header row
-    for j, name in enumerate(dfp.columns):
-        cell = table_shape.cell(0, j)
+    for cell, name in zip(next(table_rows).cells, dfp.columns):
         cell.text = str(name)
         
         # Center align and style header
         para = cell.text_frame.paragraphs[0]
         para.alignment = PP_ALIGN.CENTER
         para.font.name = "Calibri"
-        para.font.size = Pt(10)
+        para.font.size = header_size
         
         if style_headers or modern_style:
             para.font.bold = True
@@ -1425,16 +1732,16 @@ def _ppt_add_df_table(
             pass
 
     # Data rows
-    for i in range(rows):
+    values_iter = dfp.itertuples(index=False, name=None)
+    for i, (table_row, values) in enumerate(zip(table_rows, values_iter)):
         is_alt = (i % 2 == 1)
-        for j in range(cols):
-            cell = table_shape.cell(i + 1, j)
-            cell.text = str(dfp.iloc[i, j])
+        for cell, value in zip(table_row.cells, values):
+            cell.text = str(value)
             
             # Style data cell
             para = cell.text_frame.paragraphs[0]
             para.font.name = "Calibri"
-            para.font.size = Pt(9)
+            para.font.size = data_size
             para.font.color.rgb = DATA_COLOR
             
             # Apply zebra striping
@@ -1449,6 +1756,15 @@ def _ppt_add_df_table(
                 pass
 
 
+# Logo offsets for the `insert_logo` positions of the PPTX exporter
+_PPT_LOGO_POSITIONS = {
+    "bottom-right": (Inches(9), Inches(6.5)),
+    "bottom-left": (Inches(0.5), Inches(6.5)),
+    "top-left": (Inches(0.5), Inches(0.5)),
+    "top-right": (Inches(9), Inches(0.5)),
+}
+
+
 def save_powerpoint_report_from_template(
     self: Any,
     output_path: str = "bibliometric_report.pptx",
@@ -1576,6 +1892,21 @@ def save_powerpoint_report_from_template(
     prs.slide_width = Inches(13.333)
     prs.slide_height = Inches(7.5)
 
+    # Logo is resolved once and placed on each slide as it is completed
+    logo: Optional[Path] = None
+    if insert_logo:
+        logo = _resolve_path(self, logo_path, results_base)
+        if not logo.exists():
+            logo = None
+    logo_left, logo_top = _PPT_LOGO_POSITIONS.get(
+        logo_position, _PPT_LOGO_POSITIONS["bottom-right"]
+    )
+    logo_w = Inches(float(logo_width))
+
+    def _finish_slide(slide) -> None:
+        if logo is not None:
+            slide.shapes.add_picture(str(logo), logo_left, logo_top, width=logo_w)
+
     # Title slide
     title_layout = prs.slides.add_slide(prs.slide_layouts[0])
     title_shape = title_layout.shapes.title
@@ -1599,6 +1930,7 @@ def save_powerpoint_report_from_template(
         sp.font.name = subtitle_font.get("name", "Arial")
         sp.font.size = Pt(subtitle_font.get("size", 24))
         sp.font.italic = bool(subtitle_font.get("italic", False))
+    _finish_slide(title_layout)
 
     title_and_content = prs.slide_layouts[1]
     section_title_layout = prs.slide_layouts[0]  # reuse title slide layout for sections
@@ -1611,16 +1943,15 @@ def save_powerpoint_report_from_template(
             toc_slide.shapes.title.text_frame.paragraphs[0].font.bold = True
 
         tf = toc_slide.placeholders[1].text_frame
-        seen: List[str] = []
         if "Level 1" in df_template.columns:
-            for lvl1 in df_template["Level 1"]:
-                s = _clean_str(lvl1)
-                if s and s not in seen:
-                    seen.append(s)
+            # Unique section names in first-seen order, in a single pass
+            seen = dict.fromkeys(df_template["Level 1"].map(_clean_str))
+            seen.pop("", None)
             for s in seen:
                 pr = tf.add_paragraph()
                 pr.text = s
                 pr.level = 0
+        _finish_slide(toc_slide)
 
     if theme_palette is None:
         theme_palette = {
@@ -1630,14 +1961,13 @@ def save_powerpoint_report_from_template(
 
     current_lvl1: Optional[str] = None
 
-    for _, row in df_template.iterrows():
-        # Skip rows marked as xlsx_only
-        if _is_xlsx_only(row):
-            continue
-            
-        level1 = _clean_str(row.get("Level 1", ""))
-        level2 = _clean_str(row.get("Level 2", ""))
-        item_type = _infer_item_type(row)
+    records = _template_records(df_template)
+    attrs = _self_attrs(self, records)
+
+    for row in records:
+        level1 = row["Level 1"]
+        level2 = row["Level 2"]
+        it = row["item_type"]
 
         # Insert a section title slide when Level 1 changes
         if level1 and level1 != current_lvl1:
@@ -1646,52 +1976,43 @@ def save_powerpoint_report_from_template(
             section_title_shape.text = level1
             if bold_slide_titles:
                 section_title_shape.text_frame.paragraphs[0].font.bold = True
+            _finish_slide(section_slide)
             current_lvl1 = level1
 
-        if not item_type:
+        if not it:
             # Still honor explicit page-break flag (no direct PPTX equivalent, so ignore).
             continue
 
-        it = item_type.lower()
-
         df_obj: Optional[pd.DataFrame] = None
         img_path: Optional[Path] = None
         text_value: str = ""
         has_content = False
 
         if it == "table":
-            data_attr = _clean_str(row.get("Data Attr", ""))
-            df_obj = _get_df_attr(self, data_attr)
-            if isinstance(df_obj, pd.DataFrame) and not df_obj.empty:
-                # Filter columns for pptx output
-                columns_spec = _clean_str(row.get("Columns (docx/pptx/tex)", ""))
-                df_obj = _filter_columns(df_obj, columns_spec)
+            # Column filtering never empties a table, so it is left to the
+            # (head-truncated) frame below
+            df_obj = attrs.get(row["Data Attr"])
             has_content = isinstance(df_obj, pd.DataFrame) and not df_obj.empty
 
         elif it == "plot":
-            tpath = _clean_str(row.get("Path", ""))
-            filename = _clean_str(row.get("Plot Filename", ""))
+            filename = row["Plot Filename"]
             if filename:
-                img_path = _resolve_image_path(self, tpath, filename, results_base)
+                img_path = _resolve_image_path(self, row["Path"], filename, results_base)
                 has_content = img_path is not None
 
         elif it == "text":
-            text_value = _clean_str(row.get("Text", ""))
+            text_value = row["Text"]
             if not text_value:
-                narrative_attr = _clean_str(row.get("Narrative", ""))
-                if narrative_attr and hasattr(self, narrative_attr):
-                    narr = getattr(self, narrative_attr)
-                    if isinstance(narr, str):
-                        text_value = narr
+                narr = attrs.get(row["Narrative"])
+                if isinstance(narr, str):
+                    text_value = narr
             has_content = bool(text_value)
 
         elif it == "description":
-            data_attr = _clean_str(row.get("Data Attr", ""))
-            if data_attr and hasattr(self, data_attr):
-                desc = getattr(self, data_attr)
-                if isinstance(desc, str):
-                    text_value = desc
-                    has_content = bool(text_value.strip())
+            desc = attrs.get(row["Data Attr"])
+            if isinstance(desc, str):
+                text_value = desc
+                has_content = bool(text_value.strip())
 
         if not has_content:
             continue
@@ -1715,10 +2036,11 @@ def save_powerpoint_report_from_template(
             )
 
         elif it == "table" and df_obj is not None:
-            df_print_raw = _apply_head(df_obj, row.get("Head", None), top_n)
+            df_print_raw = _apply_head(df_obj, row["Head"], top_n)
             # Filter columns for PPTX
-            columns_spec = _clean_str(row.get("Columns (docx/pptx/tex)", ""))
-            df_print_filtered = _filter_columns(df_print_raw, columns_spec)
+            df_print_filtered = _filter_columns(
+                df_print_raw, row["Columns (docx/pptx/tex)"]
+            )
             if df_print_filtered is not None and not df_print_filtered.empty:
                 _ppt_add_df_table(
                     slide,
@@ -1750,26 +2072,7 @@ def save_powerpoint_report_from_template(
             )
             footer.text_frame.text = footer_text or level1
 
-    if insert_logo:
-        logo = _resolve_path(self, logo_path, results_base)
-        if logo.exists():
-            for slide in prs.slides:
-                if logo_position == "bottom-right":
-                    left, top = Inches(9), Inches(6.5)
-                elif logo_position == "bottom-left":
-                    left, top = Inches(0.5), Inches(6.5)
-                elif logo_position == "top-left":
-                    left, top = Inches(0.5), Inches(0.5)
-                elif logo_position == "top-right":
-                    left, top = Inches(9), Inches(0.5)
-                else:
-                    left, top = Inches(9), Inches(6.5)
-                slide.shapes.add_picture(
-                    str(logo),
-                    left,
-                    top,
-                    width=Inches(float(logo_width)),
-                )
+        _finish_slide(slide)
 
     out_path = _resolve_path(self, output_path, results_base)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1794,6 +2097,24 @@ MODERN_COLORS = {
     "muted": DocxColor(149, 165, 166),     # Muted gray #95A5A6
 }
 
+# Heading colors accepted by `save_word_report_from_template`
+_HEADING_COLOR_MAP = {
+    # Modern palette
+    "primary": MODERN_COLORS["primary"],
+    "secondary": MODERN_COLORS["secondary"],
+    "accent": MODERN_COLORS["accent"],
+    "dark": MODERN_COLORS["dark"],
+    "muted": MODERN_COLORS["muted"],
+    # Legacy colors
+    "orange": DocxColor(255, 165, 0),
+    "blue": DocxColor(0, 112, 192),
+    "black": DocxColor(0, 0, 0),
+    "gray": DocxColor(128, 128, 128),
+    "green": DocxColor(0, 176, 80),
+    "red": DocxColor(255, 0, 0),
+    "purple": DocxColor(112, 48, 160),
+}
+
 
 def _apply_modern_table_style(table, header_color=None, zebra=True, autofit=True):
     """
@@ -1810,6 +2131,7 @@ def _apply_modern_table_style(table, header_color=None, zebra=True, autofit=True
     autofit : bool
         Whether to autofit table to content.
     """
+    from copy import deepcopy
     from docx.oxml.ns import nsdecls, qn
     from docx.oxml import parse_xml, OxmlElement
     from docx.shared import Pt, Twips
@@ -1879,21 +2201,32 @@ def _apply_modern_table_style(table, header_color=None, zebra=True, autofit=True
     # Style data rows with zebra striping
     light_gray = "F8F9FA"
     white = "FFFFFF"
+
+    # Data cells all get the same shading and run properties: parse/build
+    # them once and stamp copies, as each python-docx font setter re-scans
+    # the run's XML to place its child element
+    shading = {
+        color: parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}" w:val="clear"/>')
+        for color in (light_gray, white)
+    }
+    data_rpr = None
     
     for i, row in enumerate(table.rows[1:], start=1):
         bg_color = light_gray if zebra and i % 2 == 0 else white
         for cell in row.cells:
-            shading_elm = parse_xml(
-                f'<w:shd {nsdecls("w")} w:fill="{bg_color}" w:val="clear"/>'
-            )
-            cell._tc.get_or_add_tcPr().append(shading_elm)
+            cell._tc.get_or_add_tcPr().append(deepcopy(shading[bg_color]))
             
             # Style text
             for paragraph in cell.paragraphs:
                 for run in paragraph.runs:
+                    if data_rpr is not None and run._r.rPr is None:
+                        run._r.insert(0, deepcopy(data_rpr))
+                        continue
                     run.font.name = "Calibri"
                     run.font.size = Pt(9)
                     run.font.color.rgb = MODERN_COLORS["dark"]
+                    if data_rpr is None:
+                        data_rpr = deepcopy(run._r.rPr)
 
 
 def _add_cover_page(doc, title="Bibliometric Report", subtitle=None, date_str=None, 
@@ -2362,26 +2695,8 @@ def save_word_report_from_template(
     df_template = _read_template(template_path, template_sheet)
 
     doc = Document()
-    
-    # Extended color map with modern colors
-    color_map_docx = {
-        # Modern palette
-        "primary": MODERN_COLORS["primary"],
-        "secondary": MODERN_COLORS["secondary"],
-        "accent": MODERN_COLORS["accent"],
-        "dark": MODERN_COLORS["dark"],
-        "muted": MODERN_COLORS["muted"],
-        # Legacy colors
-        "orange": DocxColor(255, 165, 0),
-        "blue": DocxColor(0, 112, 192),
-        "black": DocxColor(0, 0, 0),
-        "gray": DocxColor(128, 128, 128),
-        "green": DocxColor(0, 176, 80),
-        "red": DocxColor(255, 0, 0),
-        "purple": DocxColor(112, 48, 160),
-    }
-    
-    heading_rgb = color_map_docx.get(heading_color.lower(), MODERN_COLORS["primary"])
+
+    heading_rgb = _HEADING_COLOR_MAP.get(heading_color.lower(), MODERN_COLORS["primary"])
     
     # Add cover page
     if include_cover_page:
@@ -2411,13 +2726,12 @@ def save_word_report_from_template(
     sec_idx = 0
     sub_idx = 0
 
-    for _, row in df_template.iterrows():
-        # Skip rows marked as xlsx_only
-        if _is_xlsx_only(row):
-            continue
-            
-        lvl1 = _clean_str(row.get("Level 1", ""))
-        lvl2 = _clean_str(row.get("Level 2", ""))
+    records = _template_records(df_template)
+    attrs = _self_attrs(self, records)
+
+    for row in records:
+        lvl1 = row["Level 1"]
+        lvl2 = row["Level 2"]
 
         # New Level 1 section
         if lvl1 and lvl1 != current_lvl1:
@@ -2439,45 +2753,36 @@ def save_word_report_from_template(
             para2.runs[0].font.color.rgb = heading_rgb
 
         # Section-level description / narrative (attributes)
-        desc_attr = _clean_str(row.get("Description", ""))
-        if desc_attr and hasattr(self, desc_attr):
-            desc_text = getattr(self, desc_attr)
-            if isinstance(desc_text, str) and desc_text:
-                doc.add_paragraph(desc_text)
-
-        narrative_attr = _clean_str(row.get("Narrative", ""))
-        if narrative_attr and hasattr(self, narrative_attr):
-            narrative = getattr(self, narrative_attr)
-            if isinstance(narrative, str) and narrative:
-                for line in narrative.splitlines():
-                    doc.add_paragraph(line)
-
-        item_type = _infer_item_type(row)
-        if not item_type:
-            if _flag_true(row.get("Page Break After", "")):
+        desc_text = attrs.get(row["Description"])
+        if isinstance(desc_text, str) and desc_text:
+            doc.add_paragraph(desc_text)
+
+        narrative = attrs.get(row["Narrative"])
+        if isinstance(narrative, str) and narrative:
+            for line in narrative.splitlines():
+                doc.add_paragraph(line)
+
+        it = row["item_type"]
+        if not it:
+            if _flag_true(row["Page Break After"]):
                 doc.add_page_break()
             continue
 
-        it = item_type.lower()
-        
-        # DEBUG: Show what item type we're processing
-        lvl2_debug = _clean_str(row.get("Level 2", ""))
-
         if it == "table":
-            data_attr = _clean_str(row.get("Data Attr", ""))
-            df_obj = _get_df_attr(self, data_attr)
+            df_obj = attrs.get(row["Data Attr"])
             if isinstance(df_obj, pd.DataFrame) and not df_obj.empty:
-                dfp_raw = _apply_head(df_obj, row.get("Head", None), top_n)
+                dfp_raw = _apply_head(df_obj, row["Head"], top_n)
                 # Filter columns for docx/pptx/tex output
-                columns_spec = _clean_str(row.get("Columns (docx/pptx/tex)", ""))
-                dfp_filtered = _filter_columns(dfp_raw, columns_spec)
+                dfp_filtered = _filter_columns(
+                    dfp_raw, row["Columns (docx/pptx/tex)"]
+                )
                 dfp = _df_display(dfp_filtered)
                 if dfp is not None and not dfp.empty:
                     rows, cols = dfp.shape
                     table = doc.add_table(rows=rows + 1, cols=cols)
 
                     # Apply base style first
-                    style_name = _clean_str(row.get("Table Style", ""))
+                    style_name = row["Table Style"]
                     try:
                         table.style = style_name or default_table_style
                     except KeyError:
@@ -2489,14 +2794,19 @@ def save_word_report_from_template(
                             except KeyError:
                                 pass
 
+                    # Fill row by row: table.cell(i, j) rebuilds the
+                    # whole cell list on every call
+                    table_rows = iter(table.rows)
+
                     # Header row
-                    for j, name in enumerate(dfp.columns):
-                        table.cell(0, j).text = str(name)
+                    for cell, name in zip(next(table_rows).cells, dfp.columns):
+                        cell.text = str(name)
 
                     # Data rows
-                    for i in range(rows):
-                        for j in range(cols):
-                            table.cell(i + 1, j).text = str(dfp.iloc[i, j])
+                    values_iter = dfp.itertuples(index=False, name=None)
+                    for table_row, values in zip(table_rows, values_iter):
+                        for cell, value in zip(table_row.cells, values):
+                            cell.text = str(value)
 
                     # Apply modern styling if enabled
                     if modern_style:
@@ -2506,7 +2816,7 @@ def save_word_report_from_template(
                             zebra=zebra_tables
                         )
 
-                    caption = _clean_str(row.get("Caption", ""))
+                    caption = row["Caption"]
                     if caption:
                         prefix = (
                             f"Table {table_counter}: "
@@ -2518,13 +2828,12 @@ def save_word_report_from_template(
                         cap.runs[0].font.color.rgb = heading_rgb
 
         elif it == "plot":
-            tpath = _clean_str(row.get("Path", ""))
-            filename = _clean_str(row.get("Plot Filename", ""))
+            filename = row["Plot Filename"]
             if filename:
-                img = _resolve_image_path(self, tpath, filename, results_base)
+                img = _resolve_image_path(self, row["Path"], filename, results_base)
                 if img is not None:
                     doc.add_picture(str(img), width=DocxInches(5.5))
-                    caption = _clean_str(row.get("Caption", ""))
+                    caption = row["Caption"]
                     if caption:
                         prefix = (
                             f"Figure {figure_counter}: "
@@ -2539,20 +2848,18 @@ def save_word_report_from_template(
                         cap.runs[0].font.color.rgb = heading_rgb
 
         elif it == "text":
-            text_value = _clean_str(row.get("Text", ""))
+            text_value = row["Text"]
             if text_value:
                 for line in text_value.splitlines():
                     doc.add_paragraph(line)
 
         elif it == "description":
-            data_attr = _clean_str(row.get("Data Attr", ""))
-            if data_attr and hasattr(self, data_attr):
-                desc_text2 = getattr(self, data_attr)
-                if isinstance(desc_text2, str) and desc_text2:
-                    for line in desc_text2.splitlines():
-                        doc.add_paragraph(line)
+            desc_text2 = attrs.get(row["Data Attr"])
+            if isinstance(desc_text2, str) and desc_text2:
+                for line in desc_text2.splitlines():
+                    doc.add_paragraph(line)
 
-        if _flag_true(row.get("Page Break After", "")):
+        if _flag_true(row["Page Break After"]):
             doc.add_page_break()
 
     # Footer logo
@@ -2581,6 +2888,100 @@ def save_word_report_from_template(
 # LaTeX
 # -----------------------------
 
+# LaTeX special characters; escaped in a single str.translate pass
+_TEX_ESCAPES = str.maketrans({
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+})
+
+
+def _tex_escape(
+    text: str,
+) -> str:
+    """
+    Escape LaTeX special characters in `text`.
+    """
+    return text.translate(_TEX_ESCAPES)
+
+
+# Preambles for `save_tex_report_from_template` ($-placeholders, as LaTeX
+# itself is full of braces and percent signs)
+_TEX_PREAMBLE_MODERN = Template(r"""\documentclass[11pt,a4paper]{article}
+
+% Encoding and fonts
+\usepackage[utf8]{inputenc}
+\usepackage[T1]{fontenc}
+\usepackage{lmodern}
+
+% Layout
+\usepackage[margin=1in]{geometry}
+\usepackage{parskip}
+
+% Graphics and tables
+\usepackage{graphicx}
+\usepackage{booktabs}
+\usepackage{longtable}
+\usepackage{array}
+\usepackage{colortbl}
+
+% Colors
+\usepackage{xcolor}
+\definecolor{primary}{HTML}{2C3E50}
+\definecolor{secondary}{HTML}{3498DB}
+\definecolor{accent}{HTML}{E74C3C}
+\definecolor{tableheader}{HTML}{2C3E50}
+\definecolor{tablealt}{HTML}{F8F9FA}
+\definecolor{tableborder}{HTML}{DEE2E6}
+
+% Section styling
+\usepackage{titlesec}
+\titleformat{\section}{\normalfont\Large\bfseries\color{primary}}{\thesection}{1em}{}
+\titleformat{\subsection}{\normalfont\large\bfseries\color{secondary}}{\thesubsection}{1em}{}
+
+% Hyperlinks
+\usepackage{hyperref}
+\hypersetup{colorlinks=true,linkcolor=secondary,urlcolor=secondary,citecolor=secondary}
+
+% Headers and footers
+\usepackage{fancyhdr}
+\pagestyle{fancy}
+\fancyhf{}
+\fancyhead[L]{\small\textcolor{primary}{$title}}
+\fancyhead[R]{\small\textcolor{primary}{\thepage}}
+\renewcommand{\headrulewidth}{0.4pt}
+\renewcommand{\headrule}{\hbox to\headwidth{\color{secondary}\leaders\hrule height \headrulewidth\hfill}}
+
+% Table styling commands
+\newcommand{\tableheaderrow}{\rowcolor{tableheader}}
+\newcommand{\tablealtrow}{\rowcolor{tablealt}}
+
+% Document info
+\title{\textcolor{primary}{\textbf{$title}}}
+\author{$author}
+\date{$date}
+
+\begin{document}
+\maketitle""")
+
+_TEX_PREAMBLE_SIMPLE = Template(r"""\documentclass{article}
+\usepackage[utf8]{inputenc}
+\usepackage{graphicx}
+\usepackage{booktabs}
+\usepackage{geometry}
+\geometry{margin=1in}
+\title{$title}
+\date{}
+\begin{document}
+\maketitle""")
+
+
 def save_tex_report_from_template(
     self: Any,
     output_path: str = "bibliometric_report.tex",
@@ -2643,102 +3044,30 @@ def save_tex_report_from_template(
 
     figure_counter = 1
     table_counter = 1
-    
-    # Escape title and author for LaTeX
-    def _tex_escape(text):
-        chars = {"&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#", "_": r"\_", 
-                 "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}"}
-        for char, replacement in chars.items():
-            text = text.replace(char, replacement)
-        return text
 
-    lines: List[str] = []
-    
     if modern_style:
-        # Modern LaTeX preamble with colors and styling
-        lines.append(r"\documentclass[11pt,a4paper]{article}")
-        lines.append(r"")
-        lines.append(r"% Encoding and fonts")
-        lines.append(r"\usepackage[utf8]{inputenc}")
-        lines.append(r"\usepackage[T1]{fontenc}")
-        lines.append(r"\usepackage{lmodern}")
-        lines.append(r"")
-        lines.append(r"% Layout")
-        lines.append(r"\usepackage[margin=1in]{geometry}")
-        lines.append(r"\usepackage{parskip}")
-        lines.append(r"")
-        lines.append(r"% Graphics and tables")
-        lines.append(r"\usepackage{graphicx}")
-        lines.append(r"\usepackage{booktabs}")
-        lines.append(r"\usepackage{longtable}")
-        lines.append(r"\usepackage{array}")
-        lines.append(r"\usepackage{colortbl}")
-        lines.append(r"")
-        lines.append(r"% Colors")
-        lines.append(r"\usepackage{xcolor}")
-        lines.append(r"\definecolor{primary}{HTML}{2C3E50}")
-        lines.append(r"\definecolor{secondary}{HTML}{3498DB}")
-        lines.append(r"\definecolor{accent}{HTML}{E74C3C}")
-        lines.append(r"\definecolor{tableheader}{HTML}{2C3E50}")
-        lines.append(r"\definecolor{tablealt}{HTML}{F8F9FA}")
-        lines.append(r"\definecolor{tableborder}{HTML}{DEE2E6}")
-        lines.append(r"")
-        lines.append(r"% Section styling")
-        lines.append(r"\usepackage{titlesec}")
-        lines.append(r"\titleformat{\section}{\normalfont\Large\bfseries\color{primary}}{\thesection}{1em}{}")
-        lines.append(r"\titleformat{\subsection}{\normalfont\large\bfseries\color{secondary}}{\thesubsection}{1em}{}")
-        lines.append(r"")
-        lines.append(r"% Hyperlinks")
-        lines.append(r"\usepackage{hyperref}")
-        lines.append(r"\hypersetup{colorlinks=true,linkcolor=secondary,urlcolor=secondary,citecolor=secondary}")
-        lines.append(r"")
-        lines.append(r"% Headers and footers")
-        lines.append(r"\usepackage{fancyhdr}")
-        lines.append(r"\pagestyle{fancy}")
-        lines.append(r"\fancyhf{}")
-        lines.append(r"\fancyhead[L]{\small\textcolor{primary}{" + _tex_escape(report_title) + r"}}")
-        lines.append(r"\fancyhead[R]{\small\textcolor{primary}{\thepage}}")
-        lines.append(r"\renewcommand{\headrulewidth}{0.4pt}")
-        lines.append(r"\renewcommand{\headrule}{\hbox to\headwidth{\color{secondary}\leaders\hrule height \headrulewidth\hfill}}")
-        lines.append(r"")
-        lines.append(r"% Table styling commands")
-        lines.append(r"\newcommand{\tableheaderrow}{\rowcolor{tableheader}}")
-        lines.append(r"\newcommand{\tablealtrow}{\rowcolor{tablealt}}")
-        lines.append(r"")
-        lines.append(r"% Document info")
-        lines.append(r"\title{\textcolor{primary}{\textbf{" + _tex_escape(report_title) + r"}}}")
-        lines.append(r"\author{" + _tex_escape(report_author) + r"}")
-        lines.append(r"\date{" + datetime.now().strftime("%B %d, %Y") + r"}")
-        lines.append(r"")
-        lines.append(r"\begin{document}")
-        lines.append(r"\maketitle")
+        preamble = _TEX_PREAMBLE_MODERN.substitute(
+            title=_tex_escape(report_title),
+            author=_tex_escape(report_author),
+            date=datetime.now().strftime("%B %d, %Y"),
+        )
+        lines: List[str] = [preamble]
         if include_toc:
             lines.append(r"\tableofcontents")
             lines.append(r"\newpage")
     else:
-        # Simple preamble
-        lines.append(r"\documentclass{article}")
-        lines.append(r"\usepackage[utf8]{inputenc}")
-        lines.append(r"\usepackage{graphicx}")
-        lines.append(r"\usepackage{booktabs}")
-        lines.append(r"\usepackage{geometry}")
-        lines.append(r"\geometry{margin=1in}")
-        lines.append(r"\title{" + _tex_escape(report_title) + r"}")
-        lines.append(r"\date{}")
-        lines.append(r"\begin{document}")
-        lines.append(r"\maketitle")
+        lines = [_TEX_PREAMBLE_SIMPLE.substitute(title=_tex_escape(report_title))]
 
     current_lvl1: Optional[str] = None
     sec_idx = 0
     sub_idx = 0
 
-    for _, row in df_template.iterrows():
-        # Skip rows marked as xlsx_only
-        if _is_xlsx_only(row):
-            continue
-            
-        lvl1 = _clean_str(row.get("Level 1", ""))
-        lvl2 = _clean_str(row.get("Level 2", ""))
+    records = _template_records(df_template)
+    attrs = _self_attrs(self, records)
+
+    for row in records:
+        lvl1 = row["Level 1"]
+        lvl2 = row["Level 2"]
 
         if lvl1 and lvl1 != current_lvl1:
             sec_idx += 1
@@ -2756,32 +3085,27 @@ def save_tex_report_from_template(
             )
             lines.append(f"\\subsection{{{heading2}}}")
 
-        desc_attr = _clean_str(row.get("Description", ""))
-        if desc_attr and hasattr(self, desc_attr):
-            desc_text = getattr(self, desc_attr)
-            if isinstance(desc_text, str) and desc_text:
-                lines.append(desc_text + r"\\")
-
-        narrative_attr = _clean_str(row.get("Narrative", ""))
-        if narrative_attr and hasattr(self, narrative_attr):
-            narrative = getattr(self, narrative_attr)
-            if isinstance(narrative, str) and narrative:
-                for ln in narrative.splitlines():
-                    lines.append(ln + r"\\")
+        desc_text = attrs.get(row["Description"])
+        if isinstance(desc_text, str) and desc_text:
+            lines.append(desc_text + r"\\")
 
-        item_type = _infer_item_type(row)
-        if not item_type:
+        narrative = attrs.get(row["Narrative"])
+        if isinstance(narrative, str) and narrative:
+            for ln in narrative.splitlines():
+                lines.append(ln + r"\\")
+
+        it = row["item_type"]
+        if not it:
             continue
-        it = item_type.lower()
 
         if it == "table":
-            data_attr = _clean_str(row.get("Data Attr", ""))
-            df_obj = _get_df_attr(self, data_attr)
+            df_obj = attrs.get(row["Data Attr"])
             if isinstance(df_obj, pd.DataFrame) and not df_obj.empty:
-                dfp_raw = _apply_head(df_obj, row.get("Head", None), top_n)
+                dfp_raw = _apply_head(df_obj, row["Head"], top_n)
                 # Filter columns for tex output
-                columns_spec = _clean_str(row.get("Columns (docx/pptx/tex)", ""))
-                dfp_filtered = _filter_columns(dfp_raw, columns_spec)
+                dfp_filtered = _filter_columns(
+                    dfp_raw, row["Columns (docx/pptx/tex)"]
+                )
                 dfp = _df_display(dfp_filtered)
                 if dfp is not None and not dfp.empty:
                     if modern_style:
@@ -2805,16 +3129,16 @@ def save_tex_report_from_template(
                         lines.append(r"\midrule")
                         
                         # Data rows with alternating colors
-                        for i, (_, row_data) in enumerate(dfp.iterrows()):
+                        for i, values in enumerate(dfp.itertuples(index=False, name=None)):
                             if i % 2 == 1:
                                 lines.append(r"\rowcolor{tablealt}")
-                            row_cells = [_tex_escape(str(val)) for val in row_data.values]
+                            row_cells = [_tex_escape(str(val)) for val in values]
                             lines.append(" & ".join(row_cells) + r" \\")
                         
                         lines.append(r"\bottomrule")
                         lines.append(r"\end{tabular}")
                         
-                        caption = _clean_str(row.get("Caption", ""))
+                        caption = row["Caption"]
                         if caption:
                             prefix = f"Table {table_counter}: " if enumerate_tables else ""
                             caption_escaped = _tex_escape(prefix + caption)
@@ -2827,7 +3151,7 @@ def save_tex_report_from_template(
                         # Simple table
                         latex_table = dfp.to_latex(index=False, escape=True)
                         lines.append(latex_table)
-                        caption = _clean_str(row.get("Caption", ""))
+                        caption = row["Caption"]
                         if caption:
                             prefix = (
                                 f"Table {table_counter}: "
@@ -2838,16 +3162,15 @@ def save_tex_report_from_template(
                             table_counter += 1
 
         elif it == "plot":
-            tpath = _clean_str(row.get("Path", ""))
-            filename = _clean_str(row.get("Plot Filename", ""))
+            filename = row["Plot Filename"]
             if filename:
-                img = _resolve_image_path(self, tpath, filename, results_base)
+                img = _resolve_image_path(self, row["Path"], filename, results_base)
                 if img is not None:
                     tex_img_path = str(img).replace("\\", "/")
                     lines.append(
                         rf"\begin{{center}}\includegraphics[width=0.9\textwidth]{{{tex_img_path}}}\end{{center}}"
                     )
-                    caption = _clean_str(row.get("Caption", ""))
+                    caption = row["Caption"]
                     if caption:
                         prefix = (
                             f"Figure {figure_counter}: "
@@ -2858,18 +3181,16 @@ def save_tex_report_from_template(
                         figure_counter += 1
 
         elif it == "text":
-            text_value = _clean_str(row.get("Text", ""))
+            text_value = row["Text"]
             if text_value:
                 for ln in text_value.splitlines():
                     lines.append(ln + r"\\")
 
         elif it == "description":
-            data_attr = _clean_str(row.get("Data Attr", ""))
-            if data_attr and hasattr(self, data_attr):
-                desc_text2 = getattr(self, data_attr)
-                if isinstance(desc_text2, str) and desc_text2:
-                    for ln in desc_text2.splitlines():
-                        lines.append(ln + r"\\")
+            desc_text2 = attrs.get(row["Data Attr"])
+            if isinstance(desc_text2, str) and desc_text2:
+                for ln in desc_text2.splitlines():
+                    lines.append(ln + r"\\")
 
     lines.append(r"\end{document}")
 
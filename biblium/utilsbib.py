@@ -11276,11 +11276,15 @@ def compute_zipf_distribution_from_counts(
     if isinstance(count_col, int):
         count_col = df.columns[count_col]
 
-    zipf_df = df[[word_col, count_col]].copy()
-    zipf_df.columns = ["Word", "Frequency"]
-    zipf_df = zipf_df.sort_values(by="Frequency", ascending=False).reset_index(drop=True)
-    zipf_df["Rank"] = np.arange(1, len(zipf_df) + 1)
-    return zipf_df
+    words = df[word_col].to_numpy()
+    freqs = df[count_col].to_numpy()
+    # descending, stable for ties; a single argsort avoids the sorted + reindexed copies
+    order = np.argsort(-freqs, kind="stable")
+    return pd.DataFrame({
+        "Word": words[order],
+        "Frequency": freqs[order],
+        "Rank": np.arange(1, len(order) + 1),
+    })
 
 def evaluate_zipf_fit(
     zipf_df,
@@ -15939,6 +15943,7 @@ def compute_centralities(
 def compute_cluster_metrics(
     G,
     partition_attr,
+    degree_centrality=None,
 ):
     """
     Compute density and average degree centrality for each cluster.
@@ -15948,6 +15953,8 @@ def compute_cluster_metrics(
     G : networkx.Graph
     partition_attr : str
         Node attribute name (with or without "partition_" prefix).
+    degree_centrality : dict, optional
+        Precomputed ``nx.degree_centrality(G)``; computed here if None.
 
     Returns
     -------
@@ -15958,7 +15965,7 @@ def compute_cluster_metrics(
         - "size": number of nodes in the cluster
     """
     key = partition_attr if partition_attr.startswith("partition_") else f"partition_{partition_attr}"
-    cent = nx.degree_centrality(G)
+    cent = nx.degree_centrality(G) if degree_centrality is None else degree_centrality
     clusters = {}
     for n, attrs in G.nodes(data=True):
         cid = attrs.get(key)
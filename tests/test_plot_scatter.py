@@ -0,0 +1,35 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from biblium.plotbib import plot_scatter
+
+
+def _highlighted(df, highlight_points):
+    """Return the sorted (x, y) points drawn by plot_scatter's highlight layer."""
+    fig, ax = plt.subplots()
+    plot_scatter(df, "x", "y", highlight_points=highlight_points, x_scale="linear",
+                 y_scale="linear", legend=False, filename=None, show=False, ax=ax)
+    offsets = np.asarray(ax.collections[-1].get_offsets())
+    plt.close(fig)
+    return sorted(map(tuple, offsets.tolist()))
+
+
+def test_highlight_mask_built_before_dropna():
+    df = pd.DataFrame({"x": [1.0, 2.0, np.nan, 3.0], "y": [1.0, 2.0, 3.0, 4.0]})
+    assert _highlighted(df, df["x"] > 1.5) == [(2.0, 2.0), (3.0, 4.0)]
+
+
+def test_highlight_mask_on_shuffled_index():
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0], "y": [10.0, 20.0, 30.0, 40.0]}, index=[3, 1, 2, 0])
+    mask = (df["x"] > 2.5).sample(frac=1, random_state=0)
+    assert _highlighted(df, mask) == [(3.0, 30.0), (4.0, 40.0)]
+
+
+def test_highlight_duplicate_index_labels():
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0], "y": [4.0, 5.0, 6.0]}, index=["a", "a", "b"])
+    assert _highlighted(df, ["a"]) == [(1.0, 4.0), (2.0, 5.0)]